@@ -1,9 +1,67 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     supabase_url: str = ""
     supabase_key: str = ""
+    supabase_jwt_secret: str = ""
+
+    auth_verification: Literal["local", "remote"] = "remote"
+    jwks_cache_seconds: int = 600
+
+    supabase_client_mode: Literal["sync", "async"] = "sync"
+    http_timeout_seconds: float = 10.0
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    user_client_cache_size: int = 256
+
+    request_budget_seconds: float = 15.0
+    supabase_call_timeout_seconds: float = 5.0
+    supabase_retries: int = 2
+    supabase_retry_backoff_seconds: float = 0.1
+    circuit_breaker_failure_threshold: int = 5
+    circuit_breaker_reset_seconds: float = 30.0
+
+    admission_enabled: bool = True
+    admission_max_concurrency: int = 40
+    admission_route_limits: dict[str, int] = {"/projects/export": 4, "/projects/batch": 8}
+    admission_max_queue: int = 100
+    admission_queue_timeout_seconds: float = 5.0
+    admission_max_per_user: int = 20
+    admission_retry_after_seconds: int = 1
+    admission_exempt_paths: list[str] = ["/health", "/ready", "/metrics", "/projects/stream"]
+
+    warmup_connections: int = 4
+    warmup_timeout_seconds: float = 10.0
+    jwks_prefetch: bool = True
+
+    project_storage: Literal["postgrest", "postgres"] = "postgrest"
+    database_url: str = ""
+    database_pool_min_size: int = 1
+    database_pool_max_size: int = 10
+    database_statement_cache_size: int = 100
+
+    projects_batch_max_items: int = 1000
+    projects_batch_ids_per_statement: int = 200
+    projects_batch_concurrency: int = 4
+    sync_tombstone_retention_days: int = 90
+
+    project_stream_enabled: bool = False
+    stream_buffer_size: int = 64
+    stream_keepalive_seconds: float = 15.0
+
+    cache_enabled: bool = False
+    cache_ttl_seconds: float = 30.0
+    cache_max_entries: int = 10_000
+    cache_max_bytes: int = 64 * 1024 * 1024
+
+    singleflight_enabled: bool = True
+
+    trusted_serialization: bool = False
+
+    metrics_enabled: bool = True
 
     model_config = {"env_file": ".env"}
 
@@ -2,17 +2,19 @@ from fastapi import APIRouter, Depends, HTTPException
 from supabase_auth.errors import AuthApiError
 
 from app.features.auth.models import AuthRequest
-from app.shared.dependencies import get_current_user
-from app.supabase_client import supabase
+from app.shared.calls import call
+from app.shared.dependencies import get_current_user, get_supabase
 
 router = APIRouter()
 
 
 @router.post("/signup")
-def signup(body: AuthRequest):
+async def signup(body: AuthRequest):
     try:
-        response = supabase.auth.sign_up(
-            {"email": body.email, "password": body.password}
+        response = await call(
+            get_supabase().auth.sign_up,
+            {"email": body.email, "password": body.password},
+            upstream="auth",
         )
     except AuthApiError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -28,10 +30,12 @@ def signup(body: AuthRequest):
 
 
 @router.post("/login")
-def login(body: AuthRequest):
+async def login(body: AuthRequest):
     try:
-        response = supabase.auth.sign_in_with_password(
-            {"email": body.email, "password": body.password}
+        response = await call(
+            get_supabase().auth.sign_in_with_password,
+            {"email": body.email, "password": body.password},
+            upstream="auth",
         )
     except AuthApiError as e:
         raise HTTPException(status_code=401, detail=str(e))
@@ -43,5 +47,5 @@ def login(body: AuthRequest):
 
 
 @router.get("/me")
-def me(user: dict = Depends(get_current_user)):
+async def me(user: dict = Depends(get_current_user)):
     return user
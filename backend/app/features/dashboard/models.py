@@ -0,0 +1,16 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.features.projects.models import ProjectPriority, ProjectStatus
+
+
+class DashboardStats(BaseModel):
+    total_projects: int
+    by_status: dict[ProjectStatus, int]
+    by_priority: dict[ProjectPriority, int]
+    total_estimated_cost: float
+    total_estimated_hours: float
+    materials_total: int
+    materials_owned: int
+    materials_owned_percent: Optional[float] = None
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends
+
+from app.features.dashboard.models import DashboardStats
+from app.features.projects.models import ProjectPriority, ProjectStatus
+from app.shared.cache import read_through
+from app.shared.calls import execute
+from app.shared.dependencies import get_authenticated_client, get_current_user
+from app.supabase_client import PostgrestClient
+
+router = APIRouter()
+
+
+def _dashboard(stats: dict) -> DashboardStats:
+    by_status = stats.get("by_status") or {}
+    by_priority = stats.get("by_priority") or {}
+    materials_total = stats.get("materials_total") or 0
+    materials_owned = stats.get("materials_owned") or 0
+
+    return DashboardStats(
+        total_projects=stats.get("total_projects") or 0,
+        by_status={status: by_status.get(status.value, 0) for status in ProjectStatus},
+        by_priority={
+            priority: by_priority.get(priority.value, 0) for priority in ProjectPriority
+        },
+        total_estimated_cost=stats.get("total_estimated_cost") or 0,
+        total_estimated_hours=stats.get("total_estimated_hours") or 0,
+        materials_total=materials_total,
+        materials_owned=materials_owned,
+        materials_owned_percent=(
+            round(100 * materials_owned / materials_total, 1) if materials_total else None
+        ),
+    )
+
+
+@router.get("", response_model=DashboardStats)
+async def get_dashboard(
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    async def load() -> dict:
+        return (await execute(db.rpc("dashboard_stats", {}, get=True))).data
+
+    return _dashboard(await read_through(user["id"], "dashboard", load))
@@ -0,0 +1,93 @@
+from unittest.mock import MagicMock
+
+from app.config import settings
+
+USER_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+AUTH_HEADER = {"Authorization": "Bearer valid-token"}
+
+SAMPLE_STATS = {
+    "total_projects": 3,
+    "by_status": {"planning": 2, "completed": 1},
+    "by_priority": {"medium": 2, "high": 1},
+    "total_estimated_cost": 450.5,
+    "total_estimated_hours": 12,
+    "materials_total": 8,
+    "materials_owned": 2,
+}
+
+
+def _mock_auth(mock_supabase):
+    mock_response = MagicMock()
+    mock_response.user.id = USER_ID
+    mock_response.user.email = "test@example.com"
+    mock_supabase.auth.get_user.return_value = mock_response
+
+
+def _mock_rpc(mock_supabase, return_data):
+    execute = MagicMock()
+    execute.data = return_data
+    mock_supabase.rpc.return_value.execute.return_value = execute
+
+
+class TestDashboard:
+    def test_returns_stats(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_rpc(mock_supabase, SAMPLE_STATS)
+
+        resp = client.get("/dashboard", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total_projects"] == 3
+        assert data["by_status"] == {"planning": 2, "in_progress": 0, "completed": 1}
+        assert data["by_priority"] == {"low": 0, "medium": 2, "high": 1}
+        assert data["total_estimated_cost"] == 450.5
+        assert data["total_estimated_hours"] == 12
+        assert data["materials_owned_percent"] == 25.0
+
+    def test_single_database_call(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_rpc(mock_supabase, SAMPLE_STATS)
+
+        client.get("/dashboard", headers=AUTH_HEADER)
+        mock_supabase.rpc.assert_called_once_with("dashboard_stats", {}, get=True)
+        mock_supabase.table.assert_not_called()
+
+    def test_no_projects(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_rpc(
+            mock_supabase,
+            {
+                "total_projects": 0,
+                "by_status": {},
+                "by_priority": {},
+                "total_estimated_cost": 0,
+                "total_estimated_hours": 0,
+                "materials_total": 0,
+                "materials_owned": 0,
+            },
+        )
+
+        resp = client.get("/dashboard", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total_projects"] == 0
+        assert data["by_status"]["planning"] == 0
+        assert data["materials_owned_percent"] is None
+
+    def test_cached_per_user(self, client, mock_supabase, monkeypatch):
+        monkeypatch.setattr(settings, "cache_enabled", True)
+        _mock_auth(mock_supabase)
+        _mock_rpc(mock_supabase, SAMPLE_STATS)
+
+        client.get("/dashboard", headers=AUTH_HEADER)
+        client.get("/dashboard", headers=AUTH_HEADER)
+        assert mock_supabase.rpc.call_count == 1
+
+        mock_supabase.table.return_value.delete.return_value.eq.return_value.execute.return_value.count = 1
+        client.delete("/projects/11111111-2222-3333-4444-555555555555", headers=AUTH_HEADER)
+        client.get("/dashboard", headers=AUTH_HEADER)
+        assert mock_supabase.rpc.call_count == 2
+
+    def test_without_token(self, client, mock_supabase):
+        resp = client.get("/dashboard")
+        assert resp.status_code == 401
@@ -0,0 +1,10 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class MaterialUpdate(BaseModel):
+    name: Optional[str] = Field(default=None, min_length=1)
+    quantity: Optional[float] = Field(default=None, ge=0)
+    cost: Optional[float] = Field(default=None, ge=0)
+    owned: Optional[bool] = None
@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, HTTPException, Response
+from postgrest import APIError
+from postgrest.types import CountMethod, ReturnMethod
+
+from app.features.materials.models import MaterialUpdate
+from app.features.projects.models import MATERIAL_COLUMNS, Material, MaterialItem
+from app.shared.cache import invalidate, read_through
+from app.shared.calls import execute
+from app.shared.dependencies import get_authenticated_client, get_current_user
+from app.supabase_client import PostgrestClient
+
+# Postgres errors meaning the parent project isn't the caller's to write to:
+# invalid uuid, foreign key violation, row-level security violation.
+_PROJECT_NOT_FOUND_CODES = {"22P02", "23503", "42501"}
+
+router = APIRouter()
+
+
+@router.get("", response_model=list[Material])
+async def list_materials(
+    project_id: str,
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    async def load() -> list[dict]:
+        query = (
+            db.table("materials")
+            .select(MATERIAL_COLUMNS)
+            .eq("project_id", project_id)
+            .order("position")
+        )
+        return (await execute(query)).data
+
+    return await read_through(user["id"], f"materials:{project_id}", load)
+
+
+@router.post("", response_model=Material)
+async def create_material(
+    project_id: str,
+    body: MaterialItem,
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    data = {**body.model_dump(mode="json"), "project_id": project_id}
+    try:
+        result = await execute(db.table("materials").insert(data).select(MATERIAL_COLUMNS))
+    except APIError as e:
+        if e.code in _PROJECT_NOT_FOUND_CODES:
+            raise HTTPException(status_code=404, detail="Project not found")
+        raise
+
+    await invalidate(user["id"])
+    return result.data[0]
+
+
+@router.patch("/{material_id}", response_model=Material)
+async def update_material(
+    project_id: str,
+    material_id: str,
+    body: MaterialUpdate,
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    update_data = body.model_dump(exclude_unset=True, mode="json")
+    if update_data:
+        query = db.table("materials").update(update_data)
+    else:
+        query = db.table("materials").select(MATERIAL_COLUMNS)
+    query = query.eq("id", material_id).eq("project_id", project_id)
+    if update_data:
+        query = query.select(MATERIAL_COLUMNS)
+
+    result = await execute(query)
+    if not result.data:
+        raise HTTPException(status_code=404, detail="Material not found")
+
+    await invalidate(user["id"])
+    return result.data[0]
+
+
+@router.delete("/{material_id}", status_code=204)
+async def delete_material(
+    project_id: str,
+    material_id: str,
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    query = (
+        db.table("materials")
+        .delete(count=CountMethod.exact, returning=ReturnMethod.minimal)
+        .eq("id", material_id)
+        .eq("project_id", project_id)
+    )
+    result = await execute(query)
+    if not result.count:
+        raise HTTPException(status_code=404, detail="Material not found")
+
+    await invalidate(user["id"])
+    return Response(status_code=204)
@@ -0,0 +1,115 @@
+from postgrest import APIError
+
+from app.config import settings
+from app.features.projects.test_projects import (
+    AUTH_HEADER,
+    MATERIAL_ID,
+    PROJECT_ID,
+    SAMPLE_MATERIALS,
+    _fluent,
+    _mock_auth,
+)
+
+MATERIALS_URL = f"/projects/{PROJECT_ID}/materials"
+MATERIAL_URL = f"{MATERIALS_URL}/{MATERIAL_ID}"
+
+
+class TestListMaterials:
+    def test_list_in_position_order(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        query = _fluent(mock_supabase.table.return_value.select.return_value, SAMPLE_MATERIALS)
+
+        resp = client.get(MATERIALS_URL, headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert [item["name"] for item in resp.json()] == ["Moen faucet", "Plumber's tape"]
+        mock_supabase.table.assert_called_once_with("materials")
+        query.eq.assert_called_once_with("project_id", PROJECT_ID)
+        query.order.assert_called_once_with("position")
+
+
+class TestCreateMaterial:
+    def test_create_inserts_one_row(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        insert = mock_supabase.table.return_value.insert
+        _fluent(insert.return_value, [SAMPLE_MATERIALS[0]])
+
+        resp = client.post(MATERIALS_URL, json={"name": "Moen faucet"}, headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert resp.json()["id"] == MATERIAL_ID
+        assert insert.call_args.args[0] == {
+            "name": "Moen faucet",
+            "quantity": 1,
+            "cost": None,
+            "owned": False,
+            "project_id": PROJECT_ID,
+        }
+
+    def test_create_in_foreign_project(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        insert = mock_supabase.table.return_value.insert
+        _fluent(insert.return_value, []).execute.side_effect = APIError(
+            {"message": "new row violates row-level security policy", "code": "42501"}
+        )
+
+        resp = client.post(MATERIALS_URL, json={"name": "Tape"}, headers=AUTH_HEADER)
+        assert resp.status_code == 404
+
+    def test_create_validates_body(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+
+        resp = client.post(MATERIALS_URL, json={"name": "Tape", "cost": -1}, headers=AUTH_HEADER)
+        assert resp.status_code == 422
+
+
+class TestUpdateMaterial:
+    def test_flip_owned_touches_one_row(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        update = mock_supabase.table.return_value.update
+        query = _fluent(update.return_value, [{**SAMPLE_MATERIALS[0], "owned": True}])
+
+        resp = client.patch(MATERIAL_URL, json={"owned": True}, headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert resp.json()["owned"] is True
+        mock_supabase.table.assert_called_once_with("materials")
+        update.assert_called_once_with({"owned": True})
+        query.eq.assert_any_call("id", MATERIAL_ID)
+        query.eq.assert_any_call("project_id", PROJECT_ID)
+
+    def test_update_missing(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _fluent(mock_supabase.table.return_value.update.return_value, [])
+
+        resp = client.patch(MATERIAL_URL, json={"owned": True}, headers=AUTH_HEADER)
+        assert resp.status_code == 404
+
+    def test_update_invalidates_project_cache(self, client, mock_supabase, monkeypatch):
+        monkeypatch.setattr(settings, "cache_enabled", True)
+        _mock_auth(mock_supabase)
+        _fluent(mock_supabase.table.return_value.select.return_value, SAMPLE_MATERIALS)
+        _fluent(mock_supabase.table.return_value.update.return_value, [SAMPLE_MATERIALS[0]])
+
+        client.get(MATERIALS_URL, headers=AUTH_HEADER)
+        client.patch(MATERIAL_URL, json={"quantity": 3}, headers=AUTH_HEADER)
+        client.get(MATERIALS_URL, headers=AUTH_HEADER)
+        assert mock_supabase.table.return_value.select.call_count == 2
+
+
+class TestDeleteMaterial:
+    def test_delete(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _fluent(mock_supabase.table.return_value.delete.return_value, [], count=1)
+
+        resp = client.delete(MATERIAL_URL, headers=AUTH_HEADER)
+        assert resp.status_code == 204
+        assert resp.content == b""
+
+    def test_delete_missing(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _fluent(mock_supabase.table.return_value.delete.return_value, [], count=0)
+
+        resp = client.delete(MATERIAL_URL, headers=AUTH_HEADER)
+        assert resp.status_code == 404
+
+    def test_without_token(self, client, mock_supabase):
+        resp = client.delete(MATERIAL_URL)
+        assert resp.status_code == 401
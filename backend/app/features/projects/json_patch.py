@@ -0,0 +1,130 @@
+"""RFC 6902 JSON Patch for a project's ``instructions`` and ``materials``.
+
+Operations are checked and normalized here, then applied in one
+transaction by the ``patch_project`` RPC.
+"""
+
+import re
+from functools import lru_cache
+from typing import Annotated, Any, Optional, Union
+
+from fastapi import HTTPException
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.features.projects.models import (
+    InstructionStep,
+    JsonPatchOp,
+    JsonPatchOperation,
+    MaterialItem,
+)
+
+JSON_PATCH_MEDIA_TYPE = "application/json-patch+json"
+
+PATCHABLE_ARRAYS: dict[str, type[BaseModel]] = {
+    "instructions": InstructionStep,
+    "materials": MaterialItem,
+}
+
+_POINTER = re.compile(
+    r"^/(?P<array>[^/]+)(?:/(?P<index>0|[1-9][0-9]*|-)(?:/(?P<field>[^/]+))?)?$"
+)
+
+Index = Union[int, str, None]
+
+
+def _fail(index: int, message: str) -> HTTPException:
+    return HTTPException(status_code=422, detail=f"Operation {index}: {message}")
+
+
+@lru_cache(maxsize=None)
+def _value_adapter(array: str, whole: bool, field: Optional[str]) -> TypeAdapter:
+    model = PATCHABLE_ARRAYS[array]
+    if whole:
+        return TypeAdapter(list[model])
+    if field is None:
+        return TypeAdapter(model)
+    info = model.model_fields[field]
+    return TypeAdapter(Annotated[info.annotation, info])
+
+
+def _pointer(index: int, pointer: str) -> tuple[str, Index, Optional[str]]:
+    match = _POINTER.match(pointer)
+    if not match or match["array"] not in PATCHABLE_ARRAYS:
+        raise _fail(
+            index, f"unsupported path {pointer!r}; only /instructions and /materials"
+        )
+    array, position, field = match["array"], match["index"], match["field"]
+    if field is not None and field not in PATCHABLE_ARRAYS[array].model_fields:
+        raise _fail(index, f"unknown field in {pointer!r}")
+    if position == "-" and field is not None:
+        raise _fail(index, f"'-' cannot be followed by a field in {pointer!r}")
+    if position is not None and position != "-":
+        position = int(position)
+    return array, position, field
+
+
+def _value(
+    index: int,
+    op: JsonPatchOperation,
+    array: str,
+    position: Index,
+    field: Optional[str],
+) -> Any:
+    if "value" not in op.model_fields_set:
+        raise _fail(index, f"'{op.op.value}' requires a value")
+    adapter = _value_adapter(array, position is None, field)
+    try:
+        return adapter.dump_python(adapter.validate_python(op.value), mode="json")
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=[
+                {**error, "loc": ["body", index, "value", *error["loc"]]}
+                for error in e.errors(include_url=False, include_context=False)
+            ],
+        )
+
+
+def normalize_patch(ops: list[JsonPatchOperation]) -> list[dict]:
+    """Validate a patch document and resolve its paths for ``patch_project``."""
+    normalized = []
+    for index, op in enumerate(ops):
+        array, position, field = _pointer(index, op.path)
+        entry = {
+            "op": op.op.value,
+            "path": op.path,
+            "array": array,
+            "index": position,
+            "field": field,
+        }
+
+        if position is None and op.op not in (JsonPatchOp.add, JsonPatchOp.replace):
+            raise _fail(index, f"'{op.op.value}' needs an item path, not {op.path!r}")
+        if position == "-" and op.op not in (
+            JsonPatchOp.add,
+            JsonPatchOp.move,
+            JsonPatchOp.copy,
+        ):
+            raise _fail(index, "'-' is only a target for add, move and copy")
+
+        if op.op in (JsonPatchOp.move, JsonPatchOp.copy):
+            if op.from_ is None:
+                raise _fail(index, f"'{op.op.value}' requires from")
+            source = _pointer(index, op.from_)
+            if (
+                field is not None
+                or source[0] != array
+                or not isinstance(source[1], int)
+                or source[2] is not None
+            ):
+                raise _fail(index, "whole items move or copy within one array")
+            entry["from"] = source[1]
+        elif op.op == JsonPatchOp.remove:
+            model = PATCHABLE_ARRAYS[array]
+            if field is not None and model.model_fields[field].is_required():
+                raise _fail(index, f"{field!r} is required and cannot be removed")
+        else:
+            entry["value"] = _value(index, op, array, position, field)
+
+        normalized.append(entry)
+    return normalized
@@ -1,9 +1,10 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 
 
 class ProjectStatus(str, Enum):
@@ -18,6 +19,44 @@ class ProjectPriority(str, Enum):
     high = "high"
 
 
+class ProjectSort(str, Enum):
+    updated_at = "updated_at"
+    updated_at_desc = "-updated_at"
+    created_at = "created_at"
+    created_at_desc = "-created_at"
+    priority = "priority"
+    priority_desc = "-priority"
+    title = "title"
+    title_desc = "-title"
+
+    @property
+    def column(self) -> str:
+        return self.value.removeprefix("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
+
+
+class ProjectView(str, Enum):
+    full = "full"
+    summary = "summary"
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+class JsonPatchOp(str, Enum):
+    add = "add"
+    remove = "remove"
+    replace = "replace"
+    move = "move"
+    copy = "copy"
+    test = "test"
+
+
 class InstructionStep(BaseModel):
     step: int = Field(..., ge=1)
     text: str = Field(..., min_length=1)
@@ -30,6 +69,10 @@ class MaterialItem(BaseModel):
     owned: bool = False
 
 
+class Material(MaterialItem):
+    id: UUID
+
+
 class ProjectCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
@@ -52,7 +95,14 @@ class ProjectUpdate(BaseModel):
     materials: Optional[list[MaterialItem]] = None
 
 
-class ProjectResponse(BaseModel):
+class JsonPatchOperation(BaseModel):
+    op: JsonPatchOp
+    path: str
+    value: Any = None
+    from_: Optional[str] = Field(default=None, alias="from")
+
+
+class ProjectSummary(BaseModel):
     id: UUID
     user_id: UUID
     title: str
@@ -61,7 +111,76 @@ class ProjectResponse(BaseModel):
     priority: ProjectPriority
     estimated_duration_hours: Optional[float] = None
     estimated_cost: Optional[float] = None
-    instructions: list[InstructionStep] = Field(default_factory=list)
-    materials: list[MaterialItem] = Field(default_factory=list)
     created_at: datetime
     updated_at: datetime
+
+
+class ProjectResponse(ProjectSummary):
+    instructions: list[InstructionStep] = Field(default_factory=list)
+    materials: list[Material] = Field(default_factory=list)
+
+
+class ProjectSearchResult(ProjectSummary):
+    rank: float
+
+
+class DeletedProject(BaseModel):
+    id: UUID
+    deleted_at: datetime
+
+
+class ProjectChanges(BaseModel):
+    changed: list[ProjectResponse]
+    deleted: list[DeletedProject]
+    cursor: str
+    has_more: bool
+
+
+class ProjectBatchUpdate(ProjectUpdate):
+    id: UUID
+
+
+class ProjectBatchDelete(BaseModel):
+    ids: list[UUID] = Field(..., min_length=1)
+
+
+class BatchItemResult(BaseModel):
+    index: int
+    status: int
+    id: Optional[UUID] = None
+    project: Optional[ProjectResponse] = None
+    error: Optional[Union[str, list[dict[str, Any]]]] = None
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchItemResult]
+
+
+PROJECT_FIELDS = frozenset(ProjectResponse.model_fields)
+MATERIAL_COLUMNS = ",".join(Material.model_fields)
+
+
+def select_columns(names) -> str:
+    """PostgREST select list for project fields, embedding ``materials`` rows."""
+    return ",".join(
+        f"materials({MATERIAL_COLUMNS})" if name == "materials" else name
+        for name in names
+    )
+
+
+# Explicit column list for full reads, so derived columns such as
+# search_vector stay in the database.
+PROJECT_COLUMNS = select_columns(ProjectResponse.model_fields)
+
+
+@lru_cache(maxsize=128)
+def project_fields_model(fields: frozenset[str]) -> type[BaseModel]:
+    """Response model holding only the requested subset of ProjectResponse fields."""
+    return create_model(
+        "ProjectFields",
+        **{
+            name: (info.annotation, info)
+            for name, info in ProjectResponse.model_fields.items()
+            if name in fields
+        },
+    )
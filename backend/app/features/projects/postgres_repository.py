@@ -0,0 +1,207 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from app.features.projects.models import PROJECT_FIELDS, Material, ProjectResponse
+from app.shared.metrics import timed
+from app.shared.pagination import decode_cursor
+from app.shared.postgres import user_transaction
+
+# Same shape and order as the materials(projects) embed PostgREST returns.
+_MATERIALS_SQL = (
+    "COALESCE((SELECT json_agg(json_build_object({fields}) ORDER BY m.position)"
+    " FROM materials m WHERE m.project_id = p.id), '[]'::json) AS materials"
+).format(fields=", ".join(f"'{name}', m.{name}" for name in Material.model_fields))
+
+# Casts for keyset cursor values, which arrive as JSON strings.
+_SORT_TYPES = {
+    "updated_at": "timestamptz",
+    "created_at": "timestamptz",
+    "priority": "project_priority",
+    "title": "text",
+}
+
+_FULL_COLUMNS = tuple(ProjectResponse.model_fields)
+
+
+def _select_list(columns: Sequence[str]) -> str:
+    parts = []
+    for name in columns:
+        if name not in PROJECT_FIELDS:
+            raise ValueError(f"Unknown project column: {name}")
+        parts.append(_MATERIALS_SQL if name == "materials" else f'p."{name}"')
+    return ", ".join(parts)
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _row(record) -> dict:
+    """A record as PostgREST would have rendered it in JSON."""
+    return {key: _json_value(value) for key, value in record.items()}
+
+
+def _uuid(value: str) -> Optional[str]:
+    try:
+        return str(UUID(value))
+    except ValueError:
+        return None
+
+
+class _Params:
+    """Collects positional parameters, returning a cast placeholder for each."""
+
+    def __init__(self, *initial: Any):
+        self.values = list(initial)
+
+    def add(self, value: Any, cast: str) -> str:
+        self.values.append(value)
+        return f"${len(self.values)}::{cast}"
+
+
+def _versions_clause(params: _Params, versions: Optional[list[str]]) -> str:
+    if versions is None:
+        return ""
+    return f" AND p.updated_at = ANY({params.add(versions, 'text[]::timestamptz[]')})"
+
+
+def _assignments(names: Sequence[str]) -> str:
+    return ", ".join(f'"{name}" = r."{name}"' for name in names)
+
+
+class PostgresProjectRepository:
+    """Projects over a direct asyncpg pool, one transaction per call.
+
+    Each transaction runs as the caller (see
+    :func:`app.shared.postgres.user_transaction`), so the RLS policies that
+    guard PostgREST apply unchanged. Writes convert JSON payloads with
+    ``jsonb_populate_record`` the way PostgREST does.
+    """
+
+    def __init__(self, user: dict):
+        self.user = user
+
+    async def list_projects(self, columns, *, status, priority, sort, limit, cursor):
+        params = _Params()
+        conditions = []
+        if status:
+            values = params.add([s.value for s in status], "text[]::project_status[]")
+            conditions.append(f"p.status = ANY({values})")
+        if priority:
+            values = params.add([p.value for p in priority], "text[]::project_priority[]")
+            conditions.append(f"p.priority = ANY({values})")
+        if cursor:
+            value, row_id = decode_cursor(cursor, sort.column)
+            op = "<" if sort.descending else ">"
+            bound = params.add(str(value), f"text::{_SORT_TYPES[sort.column]}")
+            bound_id = params.add(row_id, "uuid")
+            conditions.append(f'(p."{sort.column}", p.id) {op} ({bound}, {bound_id})')
+
+        direction = "DESC" if sort.descending else "ASC"
+        sql = (
+            f"SELECT {_select_list(columns)} FROM projects p"
+            f"{' WHERE ' + ' AND '.join(conditions) if conditions else ''}"
+            f' ORDER BY p."{sort.column}" {direction}, p.id {direction}'
+            f" LIMIT {int(limit) + 1}"
+        )
+        with timed("database"):
+            async with user_transaction(self.user) as conn:
+                return [_row(record) for record in await conn.fetch(sql, *params.values)]
+
+    async def get_project(self, project_id, columns):
+        project_id = _uuid(project_id)
+        if project_id is None:
+            return None
+        with timed("database"):
+            async with user_transaction(self.user) as conn:
+                return await self._fetch_row(conn, project_id, columns)
+
+    async def create_project(self, data, materials):
+        names = list(data)
+        columns = ", ".join(f'"{name}"' for name in names)
+        sql = (
+            f"INSERT INTO projects ({columns})"
+            f" SELECT {columns} FROM jsonb_populate_record(NULL::projects, $1)"
+            " RETURNING id"
+        )
+        with timed("database"):
+            async with user_transaction(self.user) as conn:
+                project_id = str(await conn.fetchval(sql, data))
+                if materials:
+                    await self._replace_materials(conn, project_id, materials)
+                return await self._fetch_row(conn, project_id, _FULL_COLUMNS)
+
+    async def update_project(self, project_id, changes, materials, versions):
+        project_id = _uuid(project_id)
+        if project_id is None:
+            return None
+
+        if changes:
+            params = _Params(project_id, changes)
+            sql = (
+                f"UPDATE projects p SET {_assignments(list(changes))}"
+                " FROM jsonb_populate_record(NULL::projects, $2) r"
+                f" WHERE p.id = $1::uuid{_versions_clause(params, versions)}"
+                " RETURNING p.id"
+            )
+        else:
+            params = _Params(project_id)
+            conditions = _versions_clause(params, versions)
+            sql = f"SELECT p.id FROM projects p WHERE p.id = $1::uuid{conditions}"
+
+        with timed("database"):
+            async with user_transaction(self.user) as conn:
+                if await conn.fetchval(sql, *params.values) is None:
+                    return None
+                if materials is not None:
+                    await self._replace_materials(conn, project_id, materials)
+                return await self._fetch_row(conn, project_id, _FULL_COLUMNS)
+
+    async def delete_project(self, project_id, versions, returning):
+        project_id = _uuid(project_id)
+        if project_id is None:
+            return None
+
+        params = _Params(project_id)
+        conditions = _versions_clause(params, versions)
+        # Material rows cascade after the statement, so RETURNING still sees them.
+        returned = _select_list(_FULL_COLUMNS) if returning else "p.id"
+        sql = f"DELETE FROM projects p WHERE p.id = $1::uuid{conditions} RETURNING {returned}"
+        with timed("database"):
+            async with user_transaction(self.user) as conn:
+                record = await conn.fetchrow(sql, *params.values)
+        if record is None:
+            return None
+        return _row(record) if returning else {"id": project_id}
+
+    async def project_exists(self, project_id):
+        project_id = _uuid(project_id)
+        if project_id is None:
+            return False
+        with timed("database"):
+            async with user_transaction(self.user) as conn:
+                return await conn.fetchval(
+                    "SELECT EXISTS (SELECT 1 FROM projects WHERE id = $1::uuid)", project_id
+                )
+
+    async def _fetch_row(self, conn, project_id: str, columns: Sequence[str]) -> Optional[dict]:
+        record = await conn.fetchrow(
+            f"SELECT {_select_list(columns)} FROM projects p WHERE p.id = $1::uuid", project_id
+        )
+        return _row(record) if record is not None else None
+
+    async def _replace_materials(self, conn, project_id: str, materials: list[dict]) -> None:
+        items = [{**item, "project_id": project_id} for item in materials]
+        await conn.execute(
+            "SELECT count(*) FROM replace_project_materials($1::uuid[], $2::jsonb)",
+            [project_id],
+            items,
+        )
@@ -0,0 +1,171 @@
+from typing import Optional, Protocol, Sequence
+
+from fastapi import Depends
+from postgrest.types import CountMethod, ReturnMethod
+
+from app.config import settings
+from app.features.projects.models import (
+    PROJECT_COLUMNS,
+    ProjectPriority,
+    ProjectSort,
+    ProjectStatus,
+    select_columns,
+)
+from app.features.projects.postgres_repository import PostgresProjectRepository
+from app.shared.calls import execute
+from app.shared.dependencies import get_authenticated_client, get_current_user
+from app.shared.pagination import paginate
+from app.supabase_client import PostgrestClient
+
+
+class ProjectRepository(Protocol):
+    """Storage for the single-project and list routes.
+
+    Rows are dicts shaped like PostgREST's JSON (ids and timestamps as
+    strings, ``materials`` embedded), so ETags and cursors don't depend on
+    the backend. ``versions`` are If-Match ``updated_at`` values; ``None``
+    means unconditional. Writes return ``None`` when no row matched.
+    """
+
+    async def list_projects(
+        self,
+        columns: Sequence[str],
+        *,
+        status: Optional[list[ProjectStatus]],
+        priority: Optional[list[ProjectPriority]],
+        sort: ProjectSort,
+        limit: int,
+        cursor: Optional[str],
+    ) -> list[dict]:
+        """One keyset page plus a look-ahead row (see ``next_cursor``)."""
+        ...
+
+    async def get_project(self, project_id: str, columns: Sequence[str]) -> Optional[dict]: ...
+
+    async def create_project(self, data: dict, materials: Optional[list[dict]]) -> dict: ...
+
+    async def update_project(
+        self,
+        project_id: str,
+        changes: dict,
+        materials: Optional[list[dict]],
+        versions: Optional[list[str]],
+    ) -> Optional[dict]: ...
+
+    async def delete_project(
+        self, project_id: str, versions: Optional[list[str]], returning: bool
+    ) -> Optional[dict]:
+        """The deleted row, or just ``{"id": ...}`` unless ``returning``."""
+        ...
+
+    async def project_exists(self, project_id: str) -> bool: ...
+
+
+async def create_with_materials(db: PostgrestClient, rows: list[dict]) -> list[dict]:
+    """Insert projects, each with a ``materials`` list, in one transaction.
+
+    Returns the new rows in input order, materials embedded.
+    """
+    query = db.rpc("create_projects", {"new_projects": rows}).select(PROJECT_COLUMNS)
+    return (await execute(query)).data
+
+
+async def update_with_materials(
+    db: PostgrestClient,
+    project_ids: list[str],
+    changes: dict,
+    materials: list[dict],
+    versions: Optional[list[str]] = None,
+) -> list[dict]:
+    """Apply ``changes`` and swap in ``materials`` for each project in one transaction.
+
+    ``versions`` guards both the row and its materials. Returns the rows
+    written; the swap bumps their ``updated_at``, so these carry the
+    current ETag.
+    """
+    params = {
+        "project_ids": project_ids,
+        "changes": changes,
+        "items": materials,
+        "versions": versions,
+    }
+    query = db.rpc("update_projects", params).select(PROJECT_COLUMNS)
+    return (await execute(query)).data
+
+
+def _versions(query, versions: Optional[list[str]]):
+    # Project ETags carry updated_at verbatim, so the precondition becomes
+    # part of the write's WHERE clause instead of a separate read.
+    return query if versions is None else query.in_("updated_at", versions)
+
+
+class PostgrestProjectRepository:
+    """Projects over PostgREST, as the caller's JWT."""
+
+    def __init__(self, db: PostgrestClient):
+        self.db = db
+
+    async def list_projects(self, columns, *, status, priority, sort, limit, cursor):
+        query = self.db.table("projects").select(select_columns(columns))
+        if status:
+            query = query.in_("status", [s.value for s in status])
+        if priority:
+            query = query.in_("priority", [p.value for p in priority])
+        return (
+            await execute(paginate(query, sort.column, sort.descending, limit, cursor))
+        ).data
+
+    async def get_project(self, project_id, columns):
+        query = self.db.table("projects").select(select_columns(columns)).eq("id", project_id)
+        rows = (await execute(query)).data
+        return rows[0] if rows else None
+
+    async def create_project(self, data, materials):
+        if materials:
+            return (await create_with_materials(self.db, [{**data, "materials": materials}]))[0]
+        result = await execute(self.db.table("projects").insert(data).select(PROJECT_COLUMNS))
+        return result.data[0]
+
+    async def update_project(self, project_id, changes, materials, versions):
+        if materials is not None:
+            rows = await update_with_materials(
+                self.db, [project_id], changes, materials, versions
+            )
+            return rows[0] if rows else None
+
+        if changes:
+            query = self.db.table("projects").update(changes).eq("id", project_id)
+            query = _versions(query, versions).select(PROJECT_COLUMNS)
+        else:
+            query = self.db.table("projects").select(PROJECT_COLUMNS).eq("id", project_id)
+            query = _versions(query, versions)
+
+        result = await execute(query)
+        return result.data[0] if result.data else None
+
+    async def delete_project(self, project_id, versions, returning):
+        if returning:
+            query = self.db.table("projects").delete().eq("id", project_id)
+            result = await execute(_versions(query, versions).select(PROJECT_COLUMNS))
+            return result.data[0] if result.data else None
+
+        query = (
+            self.db.table("projects")
+            .delete(count=CountMethod.exact, returning=ReturnMethod.minimal)
+            .eq("id", project_id)
+        )
+        result = await execute(_versions(query, versions))
+        return {"id": project_id} if result.count else None
+
+    async def project_exists(self, project_id):
+        query = self.db.table("projects").select("id").eq("id", project_id)
+        return bool((await execute(query)).data)
+
+
+async def get_project_repository(
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+) -> ProjectRepository:
+    if settings.project_storage == "postgres":
+        return PostgresProjectRepository(user)
+    return PostgrestProjectRepository(db)
@@ -1,59 +1,731 @@
-from fastapi import APIRouter, Depends, HTTPException
-from supabase import Client
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Optional, Union
 
-from app.features.projects.models import ProjectCreate, ProjectResponse, ProjectUpdate
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
+from postgrest import APIError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.config import settings
+from app.features.projects.json_patch import JSON_PATCH_MEDIA_TYPE, normalize_patch
+from app.features.projects.models import (
+    PROJECT_COLUMNS,
+    PROJECT_FIELDS,
+    BatchItemResult,
+    BatchResponse,
+    ExportFormat,
+    JsonPatchOperation,
+    ProjectChanges,
+    ProjectBatchDelete,
+    ProjectBatchUpdate,
+    ProjectCreate,
+    ProjectPriority,
+    ProjectResponse,
+    ProjectSearchResult,
+    ProjectSort,
+    ProjectStatus,
+    ProjectSummary,
+    ProjectUpdate,
+    ProjectView,
+    project_fields_model,
+)
+from app.features.projects.repository import (
+    ProjectRepository,
+    create_with_materials,
+    get_project_repository,
+    update_with_materials,
+)
+from app.features.projects.stream import event_stream
+from app.shared.cache import invalidate, read_through
+from app.shared.calls import execute
 from app.shared.dependencies import get_authenticated_client, get_current_user
+from app.shared.etag import digest_etag, matches, parse_etags, weak_etag
+from app.shared.pagination import (
+    cursor_started_at,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    next_cursor,
+    paginate,
+    parse_timestamp,
+)
+from app.shared.resilience import budget
+from app.shared.serialization import model_response
+from app.supabase_client import PostgrestClient
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+EXPORT_PAGE_SIZE = 500
+
+# updated_at is set at transaction start, so a write can commit with a
+# timestamp just behind rows a client has already synced past. A caught-up
+# sync's cursor is held back by this much so such late commits are picked
+# up next time (at the cost of resending rows changed in the window).
+SYNC_OVERLAP = timedelta(seconds=5)
+_ZERO_ID = "00000000-0000-0000-0000-000000000000"
+
+EXPORT_CSV_COLUMNS = [
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "estimated_duration_hours",
+    "estimated_cost",
+    "instructions",
+    "materials",
+    "created_at",
+    "updated_at",
+]
+
+_project_adapter = TypeAdapter(ProjectResponse)
 
 router = APIRouter()
 
 
+def _project_etag(row: dict) -> str:
+    return weak_etag(row["updated_at"])
+
+
 @router.post("", response_model=ProjectResponse)
-def create_project(
+async def create_project(
     body: ProjectCreate,
     user: dict = Depends(get_current_user),
-    db: Client = Depends(get_authenticated_client),
+    repo: ProjectRepository = Depends(get_project_repository),
 ):
     data = body.model_dump(mode="json")
+    materials = data.pop("materials") or None
     data["user_id"] = user["id"]
 
-    result = db.table("projects").insert(data).execute()
-    return result.data[0]
+    row = await repo.create_project(data, materials)
+    await invalidate(user["id"])
+    return model_response(row, ProjectResponse, headers={"ETag": _project_etag(row)})
+
+
+def _check_batch_size(items: list) -> None:
+    if len(items) > settings.projects_batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds {settings.projects_batch_max_items} items",
+        )
+
+
+def _statement_chunks(items: list) -> list[list]:
+    """Split a batch so each statement filters on a bounded number of ids."""
+    size = settings.projects_batch_ids_per_statement
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _statement_failure(error: Exception) -> tuple[int, str]:
+    """Per-item status and message for a batch statement that failed.
+
+    PostgREST rejections are the items' fault (400); an open breaker or an
+    exhausted budget keeps the status :func:`app.shared.calls.call` gave it.
+    """
+    if isinstance(error, HTTPException):
+        return error.status_code, error.detail
+    return 400, error.message
+
+
+def _invalid_item(index: int, error: ValidationError) -> BatchItemResult:
+    return BatchItemResult(
+        index=index,
+        status=422,
+        error=error.errors(include_url=False, include_context=False),
+    )
+
+
+@router.post("/batch", response_model=BatchResponse)
+async def create_projects_batch(
+    items: list[Any] = Body(...),
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    _check_batch_size(items)
+    results: list[Optional[BatchItemResult]] = [None] * len(items)
+
+    rows, indexes = [], []
+    for index, item in enumerate(items):
+        try:
+            project = ProjectCreate.model_validate(item)
+        except ValidationError as e:
+            results[index] = _invalid_item(index, e)
+            continue
+        rows.append({**project.model_dump(mode="json"), "user_id": user["id"]})
+        indexes.append(index)
+
+    if rows:
+        try:
+            if any(row["materials"] for row in rows):
+                created = await create_with_materials(db, rows)
+            else:
+                for row in rows:
+                    del row["materials"]
+                query = db.table("projects").insert(rows).select(PROJECT_COLUMNS)
+                created = (await execute(query)).data
+            await invalidate(user["id"])
+        except APIError as e:
+            for index in indexes:
+                results[index] = BatchItemResult(index=index, status=400, error=e.message)
+        else:
+            for index, row in zip(indexes, created):
+                results[index] = BatchItemResult(
+                    index=index, status=201, id=row["id"], project=row
+                )
+
+    return BatchResponse(results=results)
+
+
+@router.patch("/batch", response_model=BatchResponse)
+async def update_projects_batch(
+    items: list[Any] = Body(...),
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    """Apply many partial updates, one UPDATE per distinct change set.
+
+    Items carrying the same fields and values (say, marking fifty projects
+    completed) share a single ``UPDATE ... WHERE id IN (...)``, split every
+    ``PROJECTS_BATCH_IDS_PER_STATEMENT`` ids.
+    """
+    _check_batch_size(items)
+    results: list[Optional[BatchItemResult]] = [None] * len(items)
+
+    groups: dict[str, tuple[dict, list[tuple[int, str]]]] = {}
+    seen: set[str] = set()
+    for index, item in enumerate(items):
+        try:
+            update = ProjectBatchUpdate.model_validate(item)
+        except ValidationError as e:
+            results[index] = _invalid_item(index, e)
+            continue
+
+        project_id = str(update.id)
+        if project_id in seen:
+            results[index] = BatchItemResult(
+                index=index, status=409, id=project_id, error="Duplicate id in batch"
+            )
+            continue
+        seen.add(project_id)
+
+        data = update.model_dump(exclude_unset=True, exclude={"id"}, mode="json")
+        key = json.dumps(data, sort_keys=True)
+        groups.setdefault(key, (data, []))[1].append((index, project_id))
+
+    statements = asyncio.Semaphore(settings.projects_batch_concurrency)
+
+    async def apply(data: dict, members: list[tuple[int, str]]) -> None:
+        ids = [project_id for _, project_id in members]
+        fields = {key: value for key, value in data.items() if key != "materials"}
+        try:
+            async with statements:
+                if "materials" in data:
+                    written = await update_with_materials(db, ids, fields, data["materials"])
+                elif fields:
+                    query = db.table("projects").update(fields).in_("id", ids)
+                    written = (await execute(query.select(PROJECT_COLUMNS))).data
+                else:
+                    query = db.table("projects").select(PROJECT_COLUMNS).in_("id", ids)
+                    written = (await execute(query)).data
+        except (APIError, HTTPException) as e:
+            status, error = _statement_failure(e)
+            for index, project_id in members:
+                results[index] = BatchItemResult(
+                    index=index, status=status, id=project_id, error=error
+                )
+            return
+
+        rows = {row["id"]: row for row in written}
+        for index, project_id in members:
+            if project_id in rows:
+                results[index] = BatchItemResult(
+                    index=index, status=200, id=project_id, project=rows[project_id]
+                )
+            else:
+                results[index] = BatchItemResult(
+                    index=index, status=404, id=project_id, error="Project not found"
+                )
+
+    try:
+        await asyncio.gather(
+            *(
+                apply(data, chunk)
+                for data, members in groups.values()
+                for chunk in _statement_chunks(members)
+            )
+        )
+    finally:
+        await invalidate(user["id"])
+    return BatchResponse(results=results)
+
+
+@router.post("/batch/delete", response_model=BatchResponse)
+async def delete_projects_batch(
+    body: ProjectBatchDelete,
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    _check_batch_size(body.ids)
+    ids = [str(project_id) for project_id in body.ids]
+
+    statements = asyncio.Semaphore(settings.projects_batch_concurrency)
+    deleted: set[str] = set()
+    failed: dict[str, tuple[int, str]] = {}
+
+    async def delete(chunk: list[str]) -> None:
+        try:
+            async with statements:
+                query = db.table("projects").delete().in_("id", chunk).select("id")
+                result = await execute(query)
+        except (APIError, HTTPException) as e:
+            failed.update(dict.fromkeys(chunk, _statement_failure(e)))
+            return
+        deleted.update(row["id"] for row in result.data)
+
+    try:
+        await asyncio.gather(
+            *(delete(chunk) for chunk in _statement_chunks(list(dict.fromkeys(ids))))
+        )
+    finally:
+        await invalidate(user["id"])
+
+    results = []
+    for index, project_id in enumerate(ids):
+        if project_id in deleted:
+            results.append(BatchItemResult(index=index, status=204, id=project_id))
+        elif project_id in failed:
+            status, error = failed[project_id]
+            results.append(
+                BatchItemResult(index=index, status=status, id=project_id, error=error)
+            )
+        else:
+            results.append(
+                BatchItemResult(
+                    index=index, status=404, id=project_id, error="Project not found"
+                )
+            )
+    return BatchResponse(results=results)
+
+
+def _projection(
+    fields: Optional[str],
+    view: ProjectView,
+    *required: str,
+) -> tuple[tuple[str, ...], type[BaseModel]]:
+    """Resolve ``fields``/``view`` into the columns to read and the response model.
+
+    ``required`` columns (such as the pagination key) are always selected
+    but only appear in the response if the model asks for them.
+    """
+    if fields:
+        names = frozenset(name.strip() for name in fields.split(",") if name.strip())
+        unknown = names - PROJECT_FIELDS
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+        model = project_fields_model(names)
+    elif view == ProjectView.summary:
+        model = ProjectSummary
+    else:
+        model = ProjectResponse
+
+    return tuple(dict.fromkeys([*model.model_fields, *required])), model
+
+
+def _list_etag(rows: list[dict], request: Request) -> str:
+    return digest_etag(
+        [str(request.url.query), *(f"{row['id']}@{row['updated_at']}" for row in rows)]
+    )
+
+
+def _if_match_versions(if_match: Optional[str]) -> Optional[list[str]]:
+    """``updated_at`` values named by an If-Match header; None if any will do."""
+    tags = parse_etags(if_match)
+    if tags is None or "*" in tags:
+        return None
+
+    versions = []
+    for tag in tags:
+        try:
+            datetime.fromisoformat(tag)
+        except ValueError:
+            continue
+        versions.append(tag)
+    return versions
+
+
+async def _not_found_or_stale(
+    repo: ProjectRepository,
+    project_id: str,
+    if_match: Optional[str],
+) -> HTTPException:
+    """Explain an empty conditional write: missing row (404) or stale ETag (412)."""
+    if parse_etags(if_match) is not None and await repo.project_exists(project_id):
+        return HTTPException(status_code=412, detail="Project has been modified")
+    return HTTPException(status_code=404, detail="Project not found")
+
+
+async def _export_projects(db: PostgrestClient) -> AsyncIterator[ProjectResponse]:
+    """Yield every project visible to ``db``, one keyset page in memory at a time.
+
+    Pages follow the (user_id, updated_at, id) index. A project updated
+    mid-export moves past the cursor and may be emitted twice; the later
+    copy is the current one. The stream can outlast the request budget, so
+    each page gets a budget of its own.
+    """
+    cursor = None
+    while True:
+        query = paginate(
+            db.table("projects").select(PROJECT_COLUMNS),
+            "updated_at",
+            False,
+            EXPORT_PAGE_SIZE,
+            cursor,
+        )
+        with budget():
+            rows = (await execute(query)).data
+        cursor = next_cursor(rows, "updated_at", EXPORT_PAGE_SIZE)
+        for row in rows:
+            yield _project_adapter.validate_python(row)
+        if cursor is None:
+            return
+
+
+def _csv_line(values: list) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue().encode()
+
 
+def _csv_row(project: ProjectResponse) -> list:
+    row = project.model_dump(mode="json", include=set(EXPORT_CSV_COLUMNS))
+    row["instructions"] = "; ".join(
+        f"{step.step}. {step.text}" for step in project.instructions
+    )
+    row["materials"] = "; ".join(
+        f"{item.name} x{item.quantity:g}"
+        + (f" @ {item.cost:.2f}" if item.cost is not None else "")
+        + (" [owned]" if item.owned else "")
+        for item in project.materials
+    )
+    return [row[column] for column in EXPORT_CSV_COLUMNS]
 
-@router.get("", response_model=list[ProjectResponse])
-def list_projects(db: Client = Depends(get_authenticated_client)):
-    result = db.table("projects").select("*").execute()
-    return result.data
 
+async def _ndjson_lines(db: PostgrestClient) -> AsyncIterator[bytes]:
+    async for project in _export_projects(db):
+        yield _project_adapter.dump_json(project) + b"\n"
 
-@router.get("/{project_id}", response_model=ProjectResponse)
-def get_project(project_id: str, db: Client = Depends(get_authenticated_client)):
-    result = db.table("projects").select("*").eq("id", project_id).execute()
-    if not result.data:
+
+async def _csv_lines(db: PostgrestClient) -> AsyncIterator[bytes]:
+    yield _csv_line(EXPORT_CSV_COLUMNS)
+    async for project in _export_projects(db):
+        yield _csv_line(_csv_row(project))
+
+
+@router.get("/export")
+async def export_projects(
+    format: ExportFormat = ExportFormat.ndjson,
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    if format == ExportFormat.csv:
+        body, media_type = _csv_lines(db), "text/csv"
+    else:
+        body, media_type = _ndjson_lines(db), "application/x-ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="projects.{format.value}"'
+        },
+    )
+
+
+@router.get("/changes", response_model=ProjectChanges)
+async def project_changes(
+    since: Optional[str] = None,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    """Projects changed and deleted after ``since``, oldest first.
+
+    Omit ``since`` for the initial sync, then pass back ``cursor`` until
+    ``has_more`` is false. Both streams are keyset-paginated on the same
+    (timestamp, id) order and merged, so one cursor covers both.
+
+    Cursors carry when the sync they belong to started: the first page of a
+    run stamps it and later pages pass it on, and the cursor returned once
+    the client has caught up starts the next run. Tombstones are kept for
+    ``SYNC_TOMBSTONE_RETENTION_DAYS``, so a run that started longer ago than
+    that gets 410; rows deleted since it started may have lost theirs.
+    """
+    now = datetime.now(timezone.utc)
+    started = now
+    if since:
+        value, row_id = decode_cursor(since, "updated_at")
+        parse_timestamp(value)
+        started = parse_timestamp(cursor_started_at(since))
+        if started < now - timedelta(days=settings.sync_tombstone_retention_days):
+            raise HTTPException(status_code=410, detail="Cursor expired; resync from scratch")
+
+    changed_query = paginate(
+        db.table("projects").select(PROJECT_COLUMNS), "updated_at", False, limit, since
+    )
+    loads = [execute(changed_query)]
+    if since:
+        deleted_query = (
+            db.table("deleted_projects")
+            .select("id,deleted_at")
+            .or_(keyset_filter("deleted_at", value, row_id, False))
+            .order("deleted_at")
+            .order("id")
+            .limit(limit + 1)
+        )
+        loads.append(execute(deleted_query))
+
+    results = await asyncio.gather(*loads)
+    entries = [(row["updated_at"], row["id"], row, False) for row in results[0].data]
+    if since:
+        entries += [(row["deleted_at"], row["id"], row, True) for row in results[1].data]
+    entries.sort(key=lambda entry: (datetime.fromisoformat(entry[0]), entry[1]))
+
+    has_more = len(entries) > limit
+    page = entries[:limit]
+    if page:
+        last = page[-1][:2]
+    elif since:
+        last = (value, row_id)
+    else:
+        last = None
+
+    held_back = now - SYNC_OVERLAP
+    if not has_more and (last is None or datetime.fromisoformat(last[0]) > held_back):
+        last = (held_back.isoformat(), _ZERO_ID)
+    if not has_more:
+        started = now
+
+    return ProjectChanges(
+        changed=[row for _, _, row, deleted in page if not deleted],
+        deleted=[row for _, _, row, deleted in page if deleted],
+        cursor=encode_cursor("updated_at", *last, started.isoformat()),
+        has_more=has_more,
+    )
+
+
+@router.get("/stream")
+async def project_stream(user: dict = Depends(get_current_user)):
+    """Server-Sent Events for the caller's project writes.
+
+    ``created``, ``updated`` and ``deleted`` events carry ``{"id",
+    "updated_at"}``; ``resync`` means events may have been missed and the
+    client should catch up with ``/projects/changes``. EventSource cannot
+    send the bearer token, so clients read the stream with fetch.
+    """
+    if not settings.project_stream_enabled:
+        raise HTTPException(status_code=503, detail="Project stream is not enabled")
+    return StreamingResponse(
+        event_stream(user["id"]),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/search", response_model=list[ProjectSearchResult])
+async def search_projects(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    """Ranked full-text search over titles, descriptions, instructions and materials."""
+    params: dict[str, Any] = {"q": q, "result_limit": limit + 1}
+    if cursor:
+        params["after_rank"], params["after_id"] = decode_cursor(cursor, "rank")
+
+    async def load() -> list[dict]:
+        return (await execute(db.rpc("search_projects", params, get=True))).data
+
+    rows = list(await read_through(user["id"], f"search?{request.url.query}", load))
+
+    headers = {}
+    if page_cursor := next_cursor(rows, "rank", limit):
+        headers["X-Next-Cursor"] = page_cursor
+    return model_response(rows, ProjectSearchResult, headers=headers)
+
+
+@router.get("", response_model=Union[list[ProjectResponse], list[ProjectSummary]])
+async def list_projects(
+    request: Request,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    status: Optional[list[ProjectStatus]] = Query(default=None),
+    priority: Optional[list[ProjectPriority]] = Query(default=None),
+    sort: ProjectSort = ProjectSort.updated_at_desc,
+    fields: Optional[str] = None,
+    view: ProjectView = ProjectView.full,
+    if_none_match: Optional[str] = Header(default=None),
+    user: dict = Depends(get_current_user),
+    repo: ProjectRepository = Depends(get_project_repository),
+):
+    columns, model = _projection(fields, view, "id", "updated_at", sort.column)
+
+    async def load() -> list[dict]:
+        return await repo.list_projects(
+            columns,
+            status=status,
+            priority=priority,
+            sort=sort,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    rows = list(await read_through(user["id"], f"list?{request.url.query}", load))
+
+    headers = {}
+    if page_cursor := next_cursor(rows, sort.column, limit):
+        headers["X-Next-Cursor"] = page_cursor
+    headers["ETag"] = _list_etag(rows, request)
+
+    if matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return model_response(rows, model, headers=headers)
+
+
+@router.get("/{project_id}", response_model=Union[ProjectResponse, ProjectSummary])
+async def get_project(
+    project_id: str,
+    request: Request,
+    fields: Optional[str] = None,
+    view: ProjectView = ProjectView.full,
+    if_none_match: Optional[str] = Header(default=None),
+    user: dict = Depends(get_current_user),
+    repo: ProjectRepository = Depends(get_project_repository),
+):
+    columns, model = _projection(fields, view, "id", "updated_at")
+
+    async def load() -> Optional[dict]:
+        return await repo.get_project(project_id, columns)
+
+    row = await read_through(user["id"], f"get:{project_id}?{request.url.query}", load)
+    if row is None:
         raise HTTPException(status_code=404, detail="Project not found")
+
+    headers = {"ETag": _project_etag(row)}
+    if matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return model_response(row, model, headers=headers)
+
+
+async def _apply_update(
+    repo: ProjectRepository,
+    project_id: str,
+    body: ProjectUpdate,
+    if_match: Optional[str],
+) -> dict:
+    changes = body.model_dump(exclude_unset=True, mode="json")
+    materials = changes.pop("materials", None)
+    row = await repo.update_project(
+        project_id, changes, materials, _if_match_versions(if_match)
+    )
+    if row is None:
+        raise await _not_found_or_stale(repo, project_id, if_match)
+    return row
+
+
+# PostgREST maps these codes raised by patch_project to HTTP statuses.
+_PATCH_ERROR_STATUS = {"PT404": 404, "PT409": 409, "PT412": 412, "PT422": 422}
+
+
+async def _apply_json_patch(
+    db: PostgrestClient,
+    project_id: str,
+    ops: list[JsonPatchOperation],
+    if_match: Optional[str],
+) -> dict:
+    params: dict[str, Any] = {"target_id": project_id, "ops": normalize_patch(ops)}
+    versions = _if_match_versions(if_match)
+    if versions is not None:
+        params["versions"] = versions
+
+    try:
+        result = await execute(db.rpc("patch_project", params).select(PROJECT_COLUMNS))
+    except APIError as e:
+        if e.code in _PATCH_ERROR_STATUS:
+            raise HTTPException(status_code=_PATCH_ERROR_STATUS[e.code], detail=e.message)
+        raise
     return result.data[0]
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
-def update_project(
+async def update_project(
     project_id: str,
-    body: ProjectUpdate,
-    db: Client = Depends(get_authenticated_client),
+    body: Union[ProjectUpdate, list[JsonPatchOperation]],
+    content_type: Optional[str] = Header(default=None),
+    if_match: Optional[str] = Header(default=None),
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+    repo: ProjectRepository = Depends(get_project_repository),
 ):
-    existing = db.table("projects").select("*").eq("id", project_id).execute()
-    if not existing.data:
-        raise HTTPException(status_code=404, detail="Project not found")
+    """Partial update from a JSON object or an RFC 6902 JSON Patch document.
 
-    update_data = body.model_dump(exclude_unset=True, mode="json")
-    result = db.table("projects").update(update_data).eq("id", project_id).execute()
-    return result.data[0]
+    JSON Patch edits single entries of ``instructions`` and ``materials``
+    without resending either array.
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if isinstance(body, list) != (media_type == JSON_PATCH_MEDIA_TYPE):
+        raise HTTPException(
+            status_code=415,
+            detail=f"JSON Patch documents must be arrays sent as {JSON_PATCH_MEDIA_TYPE}",
+        )
 
+    if isinstance(body, list):
+        row = await _apply_json_patch(db, project_id, body, if_match)
+    else:
+        row = await _apply_update(repo, project_id, body, if_match)
 
-@router.delete("/{project_id}")
-def delete_project(project_id: str, db: Client = Depends(get_authenticated_client)):
-    existing = db.table("projects").select("*").eq("id", project_id).execute()
-    if not existing.data:
-        raise HTTPException(status_code=404, detail="Project not found")
+    await invalidate(user["id"])
+    return model_response(row, ProjectResponse, headers={"ETag": _project_etag(row)})
+
+
+@router.delete(
+    "/{project_id}",
+    status_code=204,
+    responses={200: {"model": ProjectResponse}},
+)
+async def delete_project(
+    project_id: str,
+    prefer: Optional[str] = Header(default=None),
+    if_match: Optional[str] = Header(default=None),
+    user: dict = Depends(get_current_user),
+    repo: ProjectRepository = Depends(get_project_repository),
+):
+    returning = bool(prefer and "return=representation" in prefer)
+    row = await repo.delete_project(project_id, _if_match_versions(if_match), returning)
+    if row is None:
+        raise await _not_found_or_stale(repo, project_id, if_match)
+    await invalidate(user["id"])
 
-    db.table("projects").delete().eq("id", project_id).execute()
-    return {"message": "Project deleted"}
+    if returning:
+        return model_response(
+            row,
+            ProjectResponse,
+            headers={"Preference-Applied": "return=representation"},
+        )
+    return Response(status_code=204)
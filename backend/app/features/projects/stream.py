@@ -0,0 +1,124 @@
+"""Live project changes: one ``LISTEN`` per worker, fanned out per user.
+
+The ``projects_notify_change`` trigger (migration 009) sends
+``{"op", "id", "user_id", "updated_at"}`` on the ``project_changes``
+channel for every committed write. :class:`ProjectChangeFeed` holds a
+single dedicated connection listening on it and publishes each change to
+the owner's topic on the shared :data:`~app.shared.broadcast.broadcaster`;
+``GET /projects/stream`` turns a subscription into Server-Sent Events.
+
+Notifications sent while the listener is disconnected are lost, so after
+a reconnect every stream gets a ``resync`` event and clients catch up with
+``GET /projects/changes``.
+"""
+
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from app.config import settings
+from app.shared import postgres
+from app.shared.broadcast import OVERFLOW, Broadcaster, broadcaster
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "project_changes"
+RESYNC = ("resync", {})
+
+_EVENT_TYPES = {"INSERT": "created", "UPDATE": "updated", "DELETE": "deleted"}
+
+
+class ProjectChangeFeed:
+    """The worker's shared listener; started by the first stream."""
+
+    reconnect_delay = 0.5
+    reconnect_max_delay = 30.0
+
+    def __init__(
+        self,
+        broadcaster: Broadcaster,
+        connect: Callable[[], Awaitable] = postgres.connect,
+    ):
+        self.broadcaster = broadcaster
+        self.connect = connect
+        self.connected = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.connected.clear()
+
+    def handle(self, payload: str) -> None:
+        try:
+            change = json.loads(payload)
+            event = _EVENT_TYPES[change["op"]]
+            data = {"id": change["id"], "updated_at": change.get("updated_at")}
+            topic = change["user_id"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed %s payload: %r", CHANNEL, payload)
+            return
+        self.broadcaster.publish(topic, (event, data))
+
+    async def _run(self) -> None:
+        delay, connected_before = self.reconnect_delay, False
+        while True:
+            conn = None
+            try:
+                conn = await self.connect()
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _conn: lost.set())
+                await conn.add_listener(CHANNEL, self._on_notification)
+                self.connected.set()
+                if connected_before:
+                    self.broadcaster.publish_all(RESYNC)
+                connected_before, delay = True, self.reconnect_delay
+                await lost.wait()
+                logger.warning("Lost the %s listener connection; reconnecting", CHANNEL)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Could not listen on %s: %r", CHANNEL, e)
+            finally:
+                self.connected.clear()
+                if conn is not None and not conn.is_closed():
+                    await asyncio.shield(conn.close())
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.reconnect_max_delay)
+
+    def _on_notification(self, _conn, _pid: int, _channel: str, payload: str) -> None:
+        self.handle(payload)
+
+
+feed = ProjectChangeFeed(broadcaster)
+
+
+def _event(name: str, data: dict) -> str:
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+
+async def event_stream(user_id: str) -> AsyncIterator[str]:
+    """SSE for one client: change events, ``resync`` and keep-alive comments."""
+    feed.ensure_started()
+    subscription = broadcaster.subscribe(user_id)
+    try:
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    subscription.get(), settings.stream_keepalive_seconds
+                )
+            except TimeoutError:
+                # Keeps proxies from closing an idle connection.
+                yield ": keep-alive\n\n"
+                continue
+            yield _event(*(RESYNC if message is OVERFLOW else message))
+    finally:
+        broadcaster.unsubscribe(subscription)
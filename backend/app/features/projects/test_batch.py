@@ -0,0 +1,343 @@
+import threading
+import time
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+from postgrest import APIError
+
+import app.features.projects.router as projects_router
+from app.config import settings
+from app.features.projects.test_projects import (
+    AUTH_HEADER,
+    PROJECT_ID,
+    SAMPLE_PROJECT,
+    USER_ID,
+    _mock_auth,
+)
+
+OTHER_ID = "22222222-2222-3333-4444-555555555555"
+MISSING_ID = "33333333-2222-3333-4444-555555555555"
+
+
+def _result(data):
+    execute = MagicMock()
+    execute.data = data
+    return execute
+
+
+class TestBatchCreate:
+    def test_creates_valid_items_in_one_insert(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        insert = mock_supabase.table.return_value.insert
+        insert.return_value.select.return_value.execute.return_value = _result(
+            [SAMPLE_PROJECT, {**SAMPLE_PROJECT, "id": OTHER_ID, "title": "Paint fence"}]
+        )
+
+        resp = client.post(
+            "/projects/batch",
+            json=[{"title": "Replace kitchen faucet"}, {"title": ""}, {"title": "Paint fence"}],
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert [r["status"] for r in results] == [201, 422, 201]
+        assert results[0]["id"] == PROJECT_ID
+        assert results[2]["project"]["title"] == "Paint fence"
+        assert results[1]["error"][0]["loc"] == ["title"]
+
+        insert.assert_called_once()
+        rows = insert.call_args.args[0]
+        assert [row["title"] for row in rows] == ["Replace kitchen faucet", "Paint fence"]
+        assert all(row["user_id"] == USER_ID for row in rows)
+        mock_supabase.rpc.assert_not_called()
+
+    def test_materials_are_written_in_one_call(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        rpc = mock_supabase.rpc
+        rpc.return_value.select.return_value.execute.return_value = _result(
+            [SAMPLE_PROJECT, {**SAMPLE_PROJECT, "id": OTHER_ID, "materials": []}]
+        )
+
+        resp = client.post(
+            "/projects/batch",
+            json=[
+                {"title": "Replace kitchen faucet", "materials": [{"name": "Moen faucet"}]},
+                {"title": "Paint fence"},
+            ],
+            headers=AUTH_HEADER,
+        )
+        results = resp.json()["results"]
+        assert [r["status"] for r in results] == [201, 201]
+        assert [r["id"] for r in results] == [PROJECT_ID, OTHER_ID]
+        mock_supabase.table.assert_not_called()
+
+        rpc.assert_called_once()
+        name, params = rpc.call_args.args
+        assert name == "create_projects"
+        rows = params["new_projects"]
+        assert [row["title"] for row in rows] == ["Replace kitchen faucet", "Paint fence"]
+        assert [len(row["materials"]) for row in rows] == [1, 0]
+
+    def test_materials_failure_creates_nothing(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        mock_supabase.rpc.return_value.select.return_value.execute.side_effect = APIError(
+            {"message": "new row violates row-level security policy", "code": "42501"}
+        )
+
+        resp = client.post(
+            "/projects/batch",
+            json=[{"title": "A", "materials": [{"name": "Caulk"}]}],
+            headers=AUTH_HEADER,
+        )
+        assert resp.json()["results"][0]["status"] == 400
+        # No separate insert that could have committed before the failure.
+        mock_supabase.table.assert_not_called()
+
+    def test_backend_error_is_reported_per_item(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        insert = mock_supabase.table.return_value.insert
+        insert.return_value.select.return_value.execute.side_effect = APIError(
+            {"message": "insert failed", "code": "23514"}
+        )
+
+        resp = client.post("/projects/batch", json=[{"title": "A"}], headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        result = resp.json()["results"][0]
+        assert result["status"] == 400
+        assert result["error"] == "insert failed"
+
+    def test_size_cap(self, client, mock_supabase, monkeypatch):
+        _mock_auth(mock_supabase)
+        monkeypatch.setattr(settings, "projects_batch_max_items", 2)
+
+        resp = client.post("/projects/batch", json=[{"title": "A"}] * 3, headers=AUTH_HEADER)
+        assert resp.status_code == 413
+        mock_supabase.table.assert_not_called()
+
+
+class TestBatchUpdate:
+    def test_groups_identical_changes_into_one_update(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        update = mock_supabase.table.return_value.update
+        update.return_value.in_.return_value.select.return_value.execute.return_value = _result(
+            [{**SAMPLE_PROJECT, "status": "completed"}]
+        )
+
+        resp = client.patch(
+            "/projects/batch",
+            json=[
+                {"id": PROJECT_ID, "status": "completed"},
+                {"id": MISSING_ID, "status": "completed"},
+            ],
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert [r["status"] for r in results] == [200, 404]
+        assert results[0]["project"]["status"] == "completed"
+
+        update.assert_called_once_with({"status": "completed"})
+        update.return_value.in_.assert_called_once_with("id", [PROJECT_ID, MISSING_ID])
+
+    def test_distinct_changes_use_separate_updates(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        update = mock_supabase.table.return_value.update
+        update.return_value.in_.return_value.select.return_value.execute.return_value = _result([])
+
+        resp = client.patch(
+            "/projects/batch",
+            json=[
+                {"id": PROJECT_ID, "status": "completed"},
+                {"id": OTHER_ID, "priority": "high"},
+            ],
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 200
+        assert update.call_count == 2
+
+    def test_materials_change_is_one_call_per_group(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        rpc = mock_supabase.rpc
+        rpc.return_value.select.return_value.execute.return_value = _result([SAMPLE_PROJECT])
+
+        resp = client.patch(
+            "/projects/batch",
+            json=[
+                {"id": PROJECT_ID, "status": "completed", "materials": []},
+                {"id": MISSING_ID, "status": "completed", "materials": []},
+            ],
+            headers=AUTH_HEADER,
+        )
+        assert [r["status"] for r in resp.json()["results"]] == [200, 404]
+        mock_supabase.table.assert_not_called()
+        name, params = rpc.call_args.args
+        assert name == "update_projects"
+        assert params["project_ids"] == [PROJECT_ID, MISSING_ID]
+        assert params["changes"] == {"status": "completed"}
+        assert params["items"] == []
+
+    def test_large_group_is_split_across_statements(self, client, mock_supabase, monkeypatch):
+        _mock_auth(mock_supabase)
+        monkeypatch.setattr(settings, "projects_batch_ids_per_statement", 2)
+        update = mock_supabase.table.return_value.update
+        update.return_value.in_.return_value.select.return_value.execute.return_value = _result(
+            [{**SAMPLE_PROJECT, "status": "completed"}]
+        )
+        ids = [PROJECT_ID, OTHER_ID, MISSING_ID]
+
+        resp = client.patch(
+            "/projects/batch",
+            json=[{"id": project_id, "status": "completed"} for project_id in ids],
+            headers=AUTH_HEADER,
+        )
+        assert [r["status"] for r in resp.json()["results"]] == [200, 404, 404]
+        chunks = [c.args[1] for c in update.return_value.in_.call_args_list]
+        assert chunks == [[PROJECT_ID, OTHER_ID], [MISSING_ID]]
+
+    def test_statements_run_with_bounded_concurrency(self, client, mock_supabase, monkeypatch):
+        _mock_auth(mock_supabase)
+        monkeypatch.setattr(settings, "projects_batch_concurrency", 2)
+        update = mock_supabase.table.return_value.update
+        lock, running, peak = threading.Lock(), [0], [0]
+
+        def slow_update():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return _result([])
+
+        update.return_value.in_.return_value.select.return_value.execute.side_effect = slow_update
+
+        resp = client.patch(
+            "/projects/batch",
+            json=[{"id": str(uuid.uuid4()), "title": f"Project {i}"} for i in range(8)],
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 200
+        assert update.call_count == 8
+        assert peak[0] <= 2
+
+    def test_unavailable_upstream_is_reported_per_item(
+        self, client, mock_supabase, monkeypatch
+    ):
+        _mock_auth(mock_supabase)
+        monkeypatch.setattr(settings, "projects_batch_ids_per_statement", 1)
+        monkeypatch.setattr(settings, "projects_batch_concurrency", 1)
+        invalidate = AsyncMock()
+        monkeypatch.setattr(projects_router, "invalidate", invalidate)
+        update = mock_supabase.table.return_value.update
+        update.return_value.in_.return_value.select.return_value.execute.side_effect = [
+            _result([SAMPLE_PROJECT]),
+            httpx.ConnectError("connection refused"),
+        ]
+
+        resp = client.patch(
+            "/projects/batch",
+            json=[
+                {"id": PROJECT_ID, "status": "completed"},
+                {"id": OTHER_ID, "status": "completed"},
+            ],
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert [r["status"] for r in results] == [200, 503]
+        assert "Supabase" in results[1]["error"]
+        invalidate.assert_awaited_once_with(USER_ID)
+
+    def test_invalid_and_duplicate_items(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        update = mock_supabase.table.return_value.update
+        update.return_value.in_.return_value.select.return_value.execute.return_value = _result([SAMPLE_PROJECT])
+
+        resp = client.patch(
+            "/projects/batch",
+            json=[
+                {"id": PROJECT_ID, "title": "Renamed"},
+                {"id": PROJECT_ID, "title": "Again"},
+                {"id": "not-a-uuid", "title": "Bad"},
+                {"title": "No id"},
+            ],
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 200
+        assert [r["status"] for r in resp.json()["results"]] == [200, 409, 422, 422]
+        update.assert_called_once()
+
+
+class TestBatchDelete:
+    def test_deletes_in_one_statement(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        delete = mock_supabase.table.return_value.delete
+        delete.return_value.in_.return_value.select.return_value.execute.return_value = (
+            _result([{"id": PROJECT_ID}])
+        )
+
+        resp = client.post(
+            "/projects/batch/delete",
+            json={"ids": [PROJECT_ID, MISSING_ID]},
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 200
+        assert [r["status"] for r in resp.json()["results"]] == [204, 404]
+        delete.return_value.in_.assert_called_once_with("id", [PROJECT_ID, MISSING_ID])
+        assert mock_supabase.table.call_count == 1
+
+    def test_full_batch_keeps_each_filter_bounded(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        delete = mock_supabase.table.return_value.delete
+        delete.return_value.in_.return_value.select.return_value.execute.return_value = (
+            _result([{"id": PROJECT_ID}])
+        )
+        ids = [PROJECT_ID] + [
+            str(uuid.uuid4()) for _ in range(settings.projects_batch_max_items - 1)
+        ]
+
+        resp = client.post("/projects/batch/delete", json={"ids": ids}, headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        statuses = [r["status"] for r in resp.json()["results"]]
+        assert statuses.count(204) == 1
+
+        chunks = [c.args[1] for c in delete.return_value.in_.call_args_list]
+        assert len(chunks) == 5
+        assert all(len(chunk) <= settings.projects_batch_ids_per_statement for chunk in chunks)
+        assert [project_id for chunk in chunks for project_id in chunk] == ids
+
+    def test_failed_chunk_is_reported_per_item(self, client, mock_supabase, monkeypatch):
+        _mock_auth(mock_supabase)
+        monkeypatch.setattr(settings, "projects_batch_ids_per_statement", 1)
+        monkeypatch.setattr(settings, "projects_batch_concurrency", 1)
+        invalidate = AsyncMock()
+        monkeypatch.setattr(projects_router, "invalidate", invalidate)
+        delete = mock_supabase.table.return_value.delete
+        delete.return_value.in_.return_value.select.return_value.execute.side_effect = [
+            _result([{"id": PROJECT_ID}]),
+            APIError({"message": "permission denied", "code": "42501"}),
+            _result([]),
+        ]
+
+        resp = client.post(
+            "/projects/batch/delete",
+            json={"ids": [PROJECT_ID, OTHER_ID, MISSING_ID]},
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert [r["status"] for r in results] == [204, 400, 404]
+        assert results[1]["error"] == "permission denied"
+        # Some rows are gone, so cached lists must go too.
+        invalidate.assert_awaited_once_with(USER_ID)
+
+    def test_empty_ids(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+
+        resp = client.post("/projects/batch/delete", json={"ids": []}, headers=AUTH_HEADER)
+        assert resp.status_code == 422
+
+    def test_without_token(self, client, mock_supabase):
+        resp = client.post("/projects/batch/delete", json={"ids": [PROJECT_ID]})
+        assert resp.status_code == 401
@@ -0,0 +1,204 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from app.features.projects.test_projects import (
+    AUTH_HEADER,
+    PROJECT_ID,
+    SAMPLE_PROJECT,
+    _fluent,
+    _mock_auth,
+)
+from app.shared.pagination import cursor_started_at, decode_cursor, encode_cursor
+
+DELETED_ID = "33333333-2222-3333-4444-555555555555"
+BASE = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(days=3)
+SINCE = encode_cursor("updated_at", BASE.isoformat(), PROJECT_ID, BASE.isoformat())
+
+
+def _at(hours: int) -> str:
+    return (BASE + timedelta(hours=hours)).isoformat()
+
+
+def _mock_tables(mock_supabase, projects, deleted=()):
+    tables = {
+        "projects": _fluent(MagicMock(), list(projects)),
+        "deleted_projects": _fluent(MagicMock(), list(deleted)),
+    }
+    mock_supabase.table.side_effect = lambda name: tables[name]
+    return tables
+
+
+def _tombstone(deleted_at, project_id=DELETED_ID):
+    return {"id": project_id, "deleted_at": deleted_at}
+
+
+def _changes(client, query=""):
+    return client.get(f"/projects/changes{query}", headers=AUTH_HEADER)
+
+
+class TestProjectChanges:
+    def test_initial_sync_skips_tombstones(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        tables = _mock_tables(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = _changes(client)
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [row["id"] for row in data["changed"]] == [PROJECT_ID]
+        assert data["changed"][0]["materials"] == SAMPLE_PROJECT["materials"]
+        assert data["deleted"] == []
+        assert data["has_more"] is False
+        tables["projects"].order.assert_any_call("updated_at", desc=False)
+        tables["deleted_projects"].execute.assert_not_called()
+
+    def test_merges_changes_and_tombstones_in_order(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        tables = _mock_tables(
+            mock_supabase,
+            [{**SAMPLE_PROJECT, "updated_at": _at(24)}],
+            [_tombstone(_at(12))],
+        )
+
+        data = _changes(client, f"?since={SINCE}").json()
+
+        assert [row["id"] for row in data["changed"]] == [PROJECT_ID]
+        assert [row["id"] for row in data["deleted"]] == [DELETED_ID]
+        assert decode_cursor(data["cursor"], "updated_at") == (_at(24), PROJECT_ID)
+        keyset = tables["deleted_projects"].or_.call_args.args[0]
+        assert keyset.startswith(f'deleted_at.gt."{BASE.isoformat()}"')
+
+    def test_page_cut_across_both_streams(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_tables(
+            mock_supabase,
+            [
+                {**SAMPLE_PROJECT, "updated_at": _at(1)},
+                {**SAMPLE_PROJECT, "id": DELETED_ID, "updated_at": _at(36)},
+            ],
+            [_tombstone(_at(24), "44444444-2222-3333-4444-555555555555")],
+        )
+
+        data = _changes(client, f"?since={SINCE}&limit=2").json()
+
+        assert data["has_more"] is True
+        assert len(data["changed"]) == 1
+        assert len(data["deleted"]) == 1
+        value, _ = decode_cursor(data["cursor"], "updated_at")
+        assert value == _at(24)
+
+    def test_caught_up_cursor_is_held_back(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        just_now = datetime.now(timezone.utc).isoformat()
+        _mock_tables(mock_supabase, [{**SAMPLE_PROJECT, "updated_at": just_now}])
+
+        data = _changes(client, f"?since={SINCE}").json()
+
+        value, _ = decode_cursor(data["cursor"], "updated_at")
+        assert datetime.fromisoformat(value) < datetime.fromisoformat(just_now)
+
+    def test_no_changes_keeps_cursor(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_tables(mock_supabase, [])
+
+        data = _changes(client, f"?since={SINCE}").json()
+
+        assert (data["changed"], data["deleted"], data["has_more"]) == ([], [], False)
+        assert decode_cursor(data["cursor"], "updated_at") == (BASE.isoformat(), PROJECT_ID)
+
+    def test_sync_start_is_carried_across_pages(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_tables(
+            mock_supabase,
+            [
+                {**SAMPLE_PROJECT, "updated_at": _at(1)},
+                {**SAMPLE_PROJECT, "id": DELETED_ID, "updated_at": _at(2)},
+            ],
+        )
+
+        data = _changes(client, f"?since={SINCE}&limit=1").json()
+
+        assert data["has_more"] is True
+        assert cursor_started_at(data["cursor"]) == BASE.isoformat()
+
+    def test_caught_up_cursor_starts_a_new_sync(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_tables(mock_supabase, [])
+        before = datetime.now(timezone.utc)
+
+        data = _changes(client, f"?since={SINCE}").json()
+
+        assert datetime.fromisoformat(cursor_started_at(data["cursor"])) >= before
+
+    def test_paging_through_old_projects(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        old = [
+            {
+                **SAMPLE_PROJECT,
+                "id": f"{day}1111111-2222-3333-4444-555555555555",
+                "updated_at": f"2025-01-0{day}T00:00:00+00:00",
+            }
+            for day in range(1, 4)
+        ]
+        tables = _mock_tables(mock_supabase, old)
+
+        first = _changes(client, "?limit=2").json()
+        tables["projects"].execute.return_value = MagicMock(data=old[2:])
+        resp = _changes(client, f"?since={first['cursor']}&limit=2")
+
+        assert first["has_more"] is True
+        assert resp.status_code == 200
+        assert [row["id"] for row in resp.json()["changed"]] == [old[2]["id"]]
+
+    def test_expired_cursor(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_tables(mock_supabase, [])
+        old = (datetime.now(timezone.utc) - timedelta(days=365)).isoformat()
+
+        resp = _changes(client, f"?since={encode_cursor('updated_at', old, PROJECT_ID, old)}")
+
+        assert resp.status_code == 410
+
+    def test_long_pause_mid_sync_expires(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_tables(mock_supabase, [])
+        started = (datetime.now(timezone.utc) - timedelta(days=365)).isoformat()
+        cursor = encode_cursor("updated_at", _at(1), PROJECT_ID, started)
+
+        resp = _changes(client, f"?since={cursor}")
+
+        assert resp.status_code == 410
+
+    def test_cursor_without_sync_start(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_tables(mock_supabase, [])
+
+        resp = _changes(client, f"?since={encode_cursor('updated_at', _at(1), PROJECT_ID)}")
+
+        assert resp.status_code == 400
+
+    def test_invalid_cursor(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_tables(mock_supabase, [])
+
+        resp = _changes(client, "?since=not-a-cursor")
+
+        assert resp.status_code == 400
+
+    def test_cursor_with_invalid_timestamp(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_tables(mock_supabase, [])
+        naive = BASE.replace(tzinfo=None).isoformat()
+
+        for value, started_at in [
+            (naive, BASE.isoformat()),
+            ("yesterday", BASE.isoformat()),
+            (12345, BASE.isoformat()),
+            (BASE.isoformat(), naive),
+            (BASE.isoformat(), []),
+        ]:
+            cursor = encode_cursor("updated_at", value, PROJECT_ID, started_at)
+            assert _changes(client, f"?since={cursor}").status_code == 400
+
+    def test_requires_auth(self, client):
+        assert client.get("/projects/changes").status_code == 401
@@ -0,0 +1,174 @@
+from unittest.mock import MagicMock
+
+from app.features.projects.test_projects import (
+    AUTH_HEADER,
+    PROJECT_ID,
+    SAMPLE_PROJECT,
+    _mock_auth,
+    _mock_table_select,
+    _mock_table_select_eq,
+)
+
+PROJECT_ETAG = f'W/"{SAMPLE_PROJECT["updated_at"]}"'
+
+
+def _result(data, count=None):
+    execute = MagicMock()
+    execute.data = data
+    execute.count = count
+    return execute
+
+
+class TestConditionalGet:
+    def test_get_returns_etag(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select_eq(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = client.get(f"/projects/{PROJECT_ID}", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] == PROJECT_ETAG
+
+    def test_get_not_modified(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select_eq(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = client.get(
+            f"/projects/{PROJECT_ID}",
+            headers={**AUTH_HEADER, "If-None-Match": PROJECT_ETAG},
+        )
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["ETag"] == PROJECT_ETAG
+
+    def test_get_modified_since_etag(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select_eq(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = client.get(
+            f"/projects/{PROJECT_ID}",
+            headers={**AUTH_HEADER, "If-None-Match": 'W/"2025-01-01T00:00:00+00:00"'},
+        )
+        assert resp.status_code == 200
+
+    def test_list_not_modified(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select(mock_supabase, [SAMPLE_PROJECT])
+
+        etag = client.get("/projects", headers=AUTH_HEADER).headers["ETag"]
+        resp = client.get("/projects", headers={**AUTH_HEADER, "If-None-Match": etag})
+        assert resp.status_code == 304
+
+    def test_list_etag_changes_with_rows_and_query(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select(mock_supabase, [SAMPLE_PROJECT])
+        etag = client.get("/projects", headers=AUTH_HEADER).headers["ETag"]
+
+        other_query = client.get("/projects?view=summary", headers=AUTH_HEADER)
+        assert other_query.headers["ETag"] != etag
+
+        _mock_table_select(
+            mock_supabase, [{**SAMPLE_PROJECT, "updated_at": "2026-02-01T00:00:00+00:00"}]
+        )
+        resp = client.get("/projects", headers={**AUTH_HEADER, "If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+
+
+class TestIfMatch:
+    def test_update_with_matching_etag(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        updated = {**SAMPLE_PROJECT, "title": "New", "updated_at": "2026-02-01T00:00:00+00:00"}
+        eq = mock_supabase.table.return_value.update.return_value.eq
+        eq.return_value.in_.return_value.select.return_value.execute.return_value = _result([updated])
+
+        resp = client.patch(
+            f"/projects/{PROJECT_ID}",
+            json={"title": "New"},
+            headers={**AUTH_HEADER, "If-Match": PROJECT_ETAG},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] == 'W/"2026-02-01T00:00:00+00:00"'
+        eq.return_value.in_.assert_called_once_with(
+            "updated_at", [SAMPLE_PROJECT["updated_at"]]
+        )
+        assert mock_supabase.table.call_count == 1
+
+    def test_update_with_stale_etag(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        eq = mock_supabase.table.return_value.update.return_value.eq
+        eq.return_value.in_.return_value.select.return_value.execute.return_value = _result([])
+        _mock_table_select_eq(mock_supabase, [{"id": PROJECT_ID}])
+
+        resp = client.patch(
+            f"/projects/{PROJECT_ID}",
+            json={"title": "New"},
+            headers={**AUTH_HEADER, "If-Match": 'W/"2025-01-01T00:00:00+00:00"'},
+        )
+        assert resp.status_code == 412
+
+    def test_stale_etag_guards_materials_too(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        rpc = mock_supabase.rpc.return_value
+        rpc.select.return_value.execute.return_value = _result([])
+        _mock_table_select_eq(mock_supabase, [{"id": PROJECT_ID}])
+
+        resp = client.patch(
+            f"/projects/{PROJECT_ID}",
+            json={"title": "New", "materials": [{"name": "Caulk"}]},
+            headers={**AUTH_HEADER, "If-Match": 'W/"2025-01-01T00:00:00+00:00"'},
+        )
+        assert resp.status_code == 412
+        params = mock_supabase.rpc.call_args.args[1]
+        assert params["versions"] == ["2025-01-01T00:00:00+00:00"]
+        mock_supabase.table.return_value.update.assert_not_called()
+
+    def test_update_missing_project_with_etag(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        eq = mock_supabase.table.return_value.update.return_value.eq
+        eq.return_value.in_.return_value.select.return_value.execute.return_value = _result([])
+        _mock_table_select_eq(mock_supabase, [])
+
+        resp = client.patch(
+            f"/projects/{PROJECT_ID}",
+            json={"title": "New"},
+            headers={**AUTH_HEADER, "If-Match": PROJECT_ETAG},
+        )
+        assert resp.status_code == 404
+
+    def test_garbage_etag_never_matches(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        eq = mock_supabase.table.return_value.update.return_value.eq
+        eq.return_value.in_.return_value.select.return_value.execute.return_value = _result([])
+        _mock_table_select_eq(mock_supabase, [{"id": PROJECT_ID}])
+
+        resp = client.patch(
+            f"/projects/{PROJECT_ID}",
+            json={"title": "New"},
+            headers={**AUTH_HEADER, "If-Match": '"not-a-version"'},
+        )
+        assert resp.status_code == 412
+        eq.return_value.in_.assert_called_once_with("updated_at", [])
+
+    def test_delete_with_stale_etag(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        eq = mock_supabase.table.return_value.delete.return_value.eq
+        eq.return_value.in_.return_value.execute.return_value = _result([], count=0)
+        _mock_table_select_eq(mock_supabase, [{"id": PROJECT_ID}])
+
+        resp = client.delete(
+            f"/projects/{PROJECT_ID}",
+            headers={**AUTH_HEADER, "If-Match": 'W/"2025-01-01T00:00:00+00:00"'},
+        )
+        assert resp.status_code == 412
+
+    def test_delete_with_matching_etag(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        eq = mock_supabase.table.return_value.delete.return_value.eq
+        eq.return_value.in_.return_value.execute.return_value = _result([], count=1)
+
+        resp = client.delete(
+            f"/projects/{PROJECT_ID}",
+            headers={**AUTH_HEADER, "If-Match": PROJECT_ETAG},
+        )
+        assert resp.status_code == 204
+        assert mock_supabase.table.call_count == 1
@@ -0,0 +1,104 @@
+import csv
+import io
+import json
+import time
+from unittest.mock import MagicMock
+
+import app.features.projects.router as projects_router
+from app.config import settings
+from app.features.projects.test_projects import (
+    AUTH_HEADER,
+    PROJECT_ID,
+    SAMPLE_PROJECT,
+    _mock_auth,
+    _mock_table_select,
+)
+
+SECOND_PROJECT = {
+    **SAMPLE_PROJECT,
+    "id": "22222222-2222-3333-4444-555555555555",
+    "title": "Paint fence",
+    "instructions": [],
+    "materials": [],
+    "updated_at": "2026-01-02T00:00:00+00:00",
+}
+
+
+def _pages(*pages):
+    return [MagicMock(data=list(page)) for page in pages]
+
+
+class TestExport:
+    def test_ndjson(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select(mock_supabase, [SAMPLE_PROJECT, SECOND_PROJECT])
+
+        resp = client.get("/projects/export", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        assert 'filename="projects.ndjson"' in resp.headers["content-disposition"]
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [line["id"] for line in lines] == [PROJECT_ID, SECOND_PROJECT["id"]]
+        assert lines[0]["materials"][0]["name"] == "Moen faucet"
+
+    def test_pages_through_keyset_cursor(self, client, mock_supabase, monkeypatch):
+        _mock_auth(mock_supabase)
+        monkeypatch.setattr(projects_router, "EXPORT_PAGE_SIZE", 1)
+        query = _mock_table_select(mock_supabase, [])
+        query.execute.side_effect = _pages(
+            [SAMPLE_PROJECT, SECOND_PROJECT], [SECOND_PROJECT]
+        )
+
+        resp = client.get("/projects/export", headers=AUTH_HEADER)
+        assert len(resp.text.splitlines()) == 2
+        assert query.execute.call_count == 2
+        query.limit.assert_called_with(2)
+        query.or_.assert_called_once()
+
+    def test_export_outlasts_request_budget(self, client, mock_supabase, monkeypatch):
+        _mock_auth(mock_supabase)
+        monkeypatch.setattr(projects_router, "EXPORT_PAGE_SIZE", 1)
+        monkeypatch.setattr(settings, "request_budget_seconds", 0.3)
+        query = _mock_table_select(mock_supabase, [])
+        pages = iter(_pages(*[[SAMPLE_PROJECT, SECOND_PROJECT]] * 3, [SECOND_PROJECT]))
+
+        def slow_page():
+            time.sleep(0.12)
+            return next(pages)
+
+        query.execute.side_effect = slow_page
+
+        resp = client.get("/projects/export", headers=AUTH_HEADER)
+        assert len(resp.text.splitlines()) == 4
+        assert query.execute.call_count == 4
+
+    def test_csv_flattens_instructions_and_materials(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select(mock_supabase, [SAMPLE_PROJECT, SECOND_PROJECT])
+
+        resp = client.get("/projects/export?format=csv", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(resp.text)))
+        assert len(rows) == 2
+        assert rows[0]["title"] == "Replace kitchen faucet"
+        assert rows[0]["instructions"] == "1. Turn off water supply; 2. Remove old faucet"
+        assert rows[0]["materials"] == "Moen faucet x1 @ 89.99; Plumber's tape x1 @ 3.99 [owned]"
+        assert rows[1]["materials"] == ""
+
+    def test_empty_export(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select(mock_supabase, [])
+
+        resp = client.get("/projects/export?format=csv", headers=AUTH_HEADER)
+        assert resp.text.splitlines() == [",".join(projects_router.EXPORT_CSV_COLUMNS)]
+
+    def test_invalid_format(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+
+        resp = client.get("/projects/export?format=xml", headers=AUTH_HEADER)
+        assert resp.status_code == 422
+
+    def test_without_token(self, client, mock_supabase):
+        resp = client.get("/projects/export")
+        assert resp.status_code == 401
@@ -0,0 +1,160 @@
+from unittest.mock import MagicMock
+
+from postgrest import APIError
+
+from app.features.projects.test_projects import (
+    AUTH_HEADER,
+    PROJECT_ID,
+    SAMPLE_PROJECT,
+    _mock_auth,
+)
+
+PATCH_HEADERS = {**AUTH_HEADER, "Content-Type": "application/json-patch+json"}
+PROJECT_URL = f"/projects/{PROJECT_ID}"
+
+
+def _mock_patch_rpc(mock_supabase, return_data):
+    execute = MagicMock()
+    execute.data = return_data
+    mock_supabase.rpc.return_value.select.return_value.execute.return_value = execute
+
+
+def _patch(client, ops, headers=PATCH_HEADERS):
+    return client.patch(PROJECT_URL, json=ops, headers=headers)
+
+
+def _sent_ops(mock_supabase):
+    name, params = mock_supabase.rpc.call_args.args
+    assert name == "patch_project"
+    return params["ops"]
+
+
+class TestJsonPatch:
+    def test_field_replace_is_one_rpc(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        updated = {**SAMPLE_PROJECT, "updated_at": "2026-02-01T00:00:00+00:00"}
+        _mock_patch_rpc(mock_supabase, [updated])
+
+        resp = _patch(client, [{"op": "replace", "path": "/materials/0/owned", "value": True}])
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] == 'W/"2026-02-01T00:00:00+00:00"'
+        assert _sent_ops(mock_supabase) == [
+            {
+                "op": "replace",
+                "path": "/materials/0/owned",
+                "array": "materials",
+                "index": 0,
+                "field": "owned",
+                "value": True,
+            }
+        ]
+        assert mock_supabase.rpc.call_args.args[1]["target_id"] == PROJECT_ID
+        mock_supabase.table.assert_not_called()
+
+    def test_append_and_move(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_patch_rpc(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = _patch(
+            client,
+            [
+                {"op": "add", "path": "/instructions/-", "value": {"step": 3, "text": "Test"}},
+                {"op": "move", "from": "/instructions/2", "path": "/instructions/0"},
+                {"op": "remove", "path": "/materials/1"},
+            ],
+        )
+        assert resp.status_code == 200
+        add, move, remove = _sent_ops(mock_supabase)
+        assert add["index"] == "-"
+        assert add["value"] == {"step": 3, "text": "Test"}
+        assert move["from"] == 2 and move["index"] == 0
+        assert remove == {
+            "op": "remove",
+            "path": "/materials/1",
+            "array": "materials",
+            "index": 1,
+            "field": None,
+        }
+
+    def test_item_values_are_validated_and_normalized(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_patch_rpc(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = _patch(client, [{"op": "add", "path": "/materials/0", "value": {"name": "Tape"}}])
+        assert resp.status_code == 200
+        assert _sent_ops(mock_supabase)[0]["value"] == {
+            "name": "Tape",
+            "quantity": 1.0,
+            "cost": None,
+            "owned": False,
+        }
+
+    def test_invalid_value(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+
+        resp = _patch(
+            client, [{"op": "replace", "path": "/materials/0/cost", "value": -1}]
+        )
+        assert resp.status_code == 422
+        assert resp.json()["detail"][0]["loc"] == ["body", 0, "value"]
+        mock_supabase.rpc.assert_not_called()
+
+    def test_rejects_unsupported_paths(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+
+        for op in [
+            {"op": "replace", "path": "/title", "value": "New"},
+            {"op": "replace", "path": "/materials/0/id", "value": "x"},
+            {"op": "remove", "path": "/instructions/0/text"},
+            {"op": "remove", "path": "/materials/-"},
+            {"op": "test", "path": "/materials", "value": []},
+            {"op": "move", "from": "/materials/0", "path": "/instructions/0"},
+            {"op": "add", "path": "/materials/0"},
+        ]:
+            resp = _patch(client, [op])
+            assert resp.status_code == 422, op
+        mock_supabase.rpc.assert_not_called()
+
+    def test_optional_field_can_be_removed(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_patch_rpc(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = _patch(client, [{"op": "remove", "path": "/materials/0/cost"}])
+        assert resp.status_code == 200
+
+    def test_if_match_is_passed_to_rpc(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_patch_rpc(mock_supabase, [SAMPLE_PROJECT])
+
+        _patch(
+            client,
+            [{"op": "replace", "path": "/instructions/0/text", "value": "Shut off water"}],
+            headers={**PATCH_HEADERS, "If-Match": f'W/"{SAMPLE_PROJECT["updated_at"]}"'},
+        )
+        params = mock_supabase.rpc.call_args.args[1]
+        assert params["versions"] == [SAMPLE_PROJECT["updated_at"]]
+
+    def test_database_errors_map_to_statuses(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        execute = mock_supabase.rpc.return_value.select.return_value.execute
+
+        for code, status in [("PT404", 404), ("PT409", 409), ("PT412", 412), ("PT422", 422)]:
+            execute.side_effect = APIError({"message": "nope", "code": code})
+            resp = _patch(client, [{"op": "test", "path": "/materials/0/owned", "value": True}])
+            assert resp.status_code == status
+
+    def test_patch_document_requires_patch_media_type(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+
+        resp = _patch(
+            client,
+            [{"op": "remove", "path": "/materials/0"}],
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 415
+
+    def test_object_with_patch_media_type(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+
+        resp = _patch(client, {"title": "New"})
+        assert resp.status_code == 415
@@ -0,0 +1,110 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.config import settings
+from app.features.projects.test_projects import (
+    AUTH_HEADER,
+    PROJECT_ID,
+    SAMPLE_PROJECT,
+    USER_ID,
+    _mock_table_insert,
+    _mock_table_select,
+    _mock_table_select_eq,
+    _mock_table_update_eq,
+)
+
+OTHER_USER_ID = "99999999-e5f6-7890-abcd-ef1234567890"
+OTHER_AUTH_HEADER = {"Authorization": "Bearer other-token"}
+
+
+@pytest.fixture(autouse=True)
+def cache_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", True)
+
+
+@pytest.fixture
+def two_users(mock_supabase):
+    def get_user(token):
+        response = MagicMock()
+        response.user.id = USER_ID if token == "valid-token" else OTHER_USER_ID
+        response.user.email = "test@example.com"
+        return response
+
+    mock_supabase.auth.get_user.side_effect = get_user
+
+
+def _selects(mock_supabase):
+    return mock_supabase.table.return_value.select.call_count
+
+
+class TestProjectCache:
+    def test_repeat_list_is_served_from_cache(self, client, mock_supabase, two_users):
+        _mock_table_select(mock_supabase, [SAMPLE_PROJECT])
+
+        first = client.get("/projects", headers=AUTH_HEADER)
+        second = client.get("/projects", headers=AUTH_HEADER)
+
+        assert first.json() == second.json()
+        assert _selects(mock_supabase) == 1
+
+    def test_different_query_is_a_different_entry(self, client, mock_supabase, two_users):
+        _mock_table_select(mock_supabase, [SAMPLE_PROJECT])
+
+        client.get("/projects", headers=AUTH_HEADER)
+        client.get("/projects?status=planning", headers=AUTH_HEADER)
+
+        assert _selects(mock_supabase) == 2
+
+    def test_cache_never_crosses_users(self, client, mock_supabase, two_users):
+        _mock_table_select(mock_supabase, [SAMPLE_PROJECT])
+        client.get("/projects", headers=AUTH_HEADER)
+
+        _mock_table_select(mock_supabase, [])
+        resp = client.get("/projects", headers=OTHER_AUTH_HEADER)
+
+        assert resp.json() == []
+        assert _selects(mock_supabase) == 2
+
+    def test_single_project_not_shared_across_users(self, client, mock_supabase, two_users):
+        _mock_table_select_eq(mock_supabase, [SAMPLE_PROJECT])
+        assert client.get(f"/projects/{PROJECT_ID}", headers=AUTH_HEADER).status_code == 200
+
+        _mock_table_select_eq(mock_supabase, [])
+        resp = client.get(f"/projects/{PROJECT_ID}", headers=OTHER_AUTH_HEADER)
+
+        assert resp.status_code == 404
+
+    def test_update_invalidates(self, client, mock_supabase, two_users):
+        _mock_table_select(mock_supabase, [SAMPLE_PROJECT])
+        client.get("/projects", headers=AUTH_HEADER)
+
+        _mock_table_update_eq(mock_supabase, [{**SAMPLE_PROJECT, "title": "Renamed"}])
+        client.patch(f"/projects/{PROJECT_ID}", json={"title": "Renamed"}, headers=AUTH_HEADER)
+
+        _mock_table_select(mock_supabase, [{**SAMPLE_PROJECT, "title": "Renamed"}])
+        resp = client.get("/projects", headers=AUTH_HEADER)
+
+        assert resp.json()[0]["title"] == "Renamed"
+
+    def test_write_by_one_user_keeps_others_cached(self, client, mock_supabase, two_users):
+        _mock_table_select(mock_supabase, [])
+        client.get("/projects", headers=OTHER_AUTH_HEADER)
+
+        _mock_table_insert(mock_supabase, SAMPLE_PROJECT)
+        client.post("/projects", json={"title": "New"}, headers=AUTH_HEADER)
+        client.get("/projects", headers=OTHER_AUTH_HEADER)
+
+        assert _selects(mock_supabase) == 1
+
+    def test_delete_invalidates(self, client, mock_supabase, two_users):
+        _mock_table_select_eq(mock_supabase, [SAMPLE_PROJECT])
+        client.get(f"/projects/{PROJECT_ID}", headers=AUTH_HEADER)
+
+        delete_result = mock_supabase.table.return_value.delete.return_value.eq.return_value
+        delete_result.execute.return_value.count = 1
+        client.delete(f"/projects/{PROJECT_ID}", headers=AUTH_HEADER)
+
+        _mock_table_select_eq(mock_supabase, [])
+        resp = client.get(f"/projects/{PROJECT_ID}", headers=AUTH_HEADER)
+        assert resp.status_code == 404
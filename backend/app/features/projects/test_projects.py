@@ -1,5 +1,8 @@
 from unittest.mock import MagicMock
 
+import pytest
+from pydantic import ValidationError
+
 
 USER_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
 PROJECT_ID = "11111111-2222-3333-4444-555555555555"
@@ -9,9 +12,17 @@ SAMPLE_INSTRUCTIONS = [
     {"step": 2, "text": "Remove old faucet"},
 ]
 
+MATERIAL_ID = "99999999-2222-3333-4444-555555555555"
+
 SAMPLE_MATERIALS = [
-    {"name": "Moen faucet", "quantity": 1, "cost": 89.99, "owned": False},
-    {"name": "Plumber's tape", "quantity": 1, "cost": 3.99, "owned": True},
+    {"id": MATERIAL_ID, "name": "Moen faucet", "quantity": 1, "cost": 89.99, "owned": False},
+    {
+        "id": "99999999-2222-3333-4444-666666666666",
+        "name": "Plumber's tape",
+        "quantity": 1,
+        "cost": 3.99,
+        "owned": True,
+    },
 ]
 
 SAMPLE_PROJECT = {
@@ -41,34 +52,43 @@ def _mock_auth(mock_supabase):
     mock_supabase.auth.get_user.return_value = mock_response
 
 
-def _mock_table_insert(mock_supabase, return_data):
+def _fluent(query, return_data, count=None):
+    """Make filter/modifier calls on ``query`` return it, ending in ``return_data``."""
+    for method in ("select", "eq", "in_", "or_", "order", "limit"):
+        getattr(query, method).return_value = query
     execute = MagicMock()
-    execute.data = [return_data]
-    mock_supabase.table.return_value.insert.return_value.execute.return_value = execute
+    execute.data = return_data
+    execute.count = count
+    query.execute.return_value = execute
+    return query
+
+
+def _mock_table_insert(mock_supabase, return_data):
+    return _fluent(mock_supabase.table.return_value.insert.return_value, [return_data])
 
 
 def _mock_table_select(mock_supabase, return_data):
-    execute = MagicMock()
-    execute.data = return_data
-    mock_supabase.table.return_value.select.return_value.execute.return_value = execute
+    return _fluent(mock_supabase.table.return_value.select.return_value, return_data)
 
 
 def _mock_table_select_eq(mock_supabase, return_data):
-    execute = MagicMock()
-    execute.data = return_data
-    mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = execute
+    return _mock_table_select(mock_supabase, return_data)
 
 
 def _mock_table_update_eq(mock_supabase, return_data):
-    execute = MagicMock()
-    execute.data = return_data
-    mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value = execute
+    return _fluent(mock_supabase.table.return_value.update.return_value, return_data)
 
 
-def _mock_table_delete_eq(mock_supabase, return_data):
-    execute = MagicMock()
-    execute.data = return_data
-    mock_supabase.table.return_value.delete.return_value.eq.return_value.execute.return_value = execute
+def _mock_table_delete_eq(mock_supabase, return_data, count=None):
+    return _fluent(mock_supabase.table.return_value.delete.return_value, return_data, count)
+
+
+def _mock_rpc(mock_supabase, return_data):
+    return _fluent(mock_supabase.rpc.return_value, return_data)
+
+
+def _backend_calls(mock_supabase):
+    return mock_supabase.table.call_count + mock_supabase.rpc.call_count
 
 
 class TestCreateProject:
@@ -86,6 +106,7 @@ class TestCreateProject:
         assert data["id"] == PROJECT_ID
         assert data["title"] == "Replace kitchen faucet"
         assert data["user_id"] == USER_ID
+        assert _backend_calls(mock_supabase) == 1
 
     def test_create_missing_title(self, client, mock_supabase):
         _mock_auth(mock_supabase)
@@ -159,7 +180,7 @@ class TestCreateProject:
 
     def test_create_with_instructions_and_materials(self, client, mock_supabase):
         _mock_auth(mock_supabase)
-        _mock_table_insert(mock_supabase, SAMPLE_PROJECT)
+        rpc = _mock_rpc(mock_supabase, [SAMPLE_PROJECT])
 
         resp = client.post(
             "/projects",
@@ -180,6 +201,23 @@ class TestCreateProject:
         assert data["materials"][0]["owned"] is False
         assert data["materials"][1]["owned"] is True
 
+        # Row and materials go in one call, so one transaction.
+        assert _backend_calls(mock_supabase) == 1
+        name, params = mock_supabase.rpc.call_args.args
+        assert name == "create_projects"
+        (row,) = params["new_projects"]
+        assert row["user_id"] == USER_ID
+        assert [item["name"] for item in row["materials"]] == ["Moen faucet", "Plumber's tape"]
+        rpc.select.assert_called_once()
+
+    def test_create_without_materials_skips_materials_call(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_insert(mock_supabase, {**SAMPLE_PROJECT, "materials": []})
+
+        resp = client.post("/projects", json={"title": "Paint fence"}, headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        mock_supabase.rpc.assert_not_called()
+
     def test_create_invalid_instruction_missing_text(self, client, mock_supabase):
         _mock_auth(mock_supabase)
 
@@ -221,6 +259,7 @@ class TestListProjects:
         data = resp.json()
         assert len(data) == 1
         assert data[0]["title"] == "Replace kitchen faucet"
+        assert _backend_calls(mock_supabase) == 1
 
     def test_list_empty(self, client, mock_supabase):
         _mock_auth(mock_supabase)
@@ -234,6 +273,137 @@ class TestListProjects:
         resp = client.get("/projects")
         assert resp.status_code == 401
 
+    def test_list_default_page(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        query = _mock_table_select(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = client.get("/projects", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert "X-Next-Cursor" not in resp.headers
+        query.order.assert_any_call("updated_at", desc=True)
+        query.order.assert_any_call("id", desc=True)
+        query.limit.assert_called_once_with(51)
+        query.or_.assert_not_called()
+
+    def test_list_returns_next_cursor(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        second = {
+            **SAMPLE_PROJECT,
+            "id": "22222222-2222-3333-4444-555555555555",
+            "updated_at": "2025-12-31T00:00:00+00:00",
+        }
+        query = _mock_table_select(mock_supabase, [SAMPLE_PROJECT, second])
+
+        resp = client.get("/projects?limit=1", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert [p["id"] for p in resp.json()] == [PROJECT_ID]
+        cursor = resp.headers["X-Next-Cursor"]
+
+        resp = client.get(f"/projects?limit=1&cursor={cursor}", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        query.or_.assert_called_once_with(
+            f'updated_at.lt."{SAMPLE_PROJECT["updated_at"]}",'
+            f'and(updated_at.eq."{SAMPLE_PROJECT["updated_at"]}",id.lt."{PROJECT_ID}")'
+        )
+
+    def test_list_filters_and_sort(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        query = _mock_table_select(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = client.get(
+            "/projects?status=planning&status=in_progress&priority=high&sort=title",
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 200
+        query.in_.assert_any_call("status", ["planning", "in_progress"])
+        query.in_.assert_any_call("priority", ["high"])
+        query.order.assert_any_call("title", desc=False)
+
+    def test_list_invalid_cursor(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select(mock_supabase, [])
+
+        resp = client.get("/projects?cursor=not-a-cursor", headers=AUTH_HEADER)
+        assert resp.status_code == 400
+
+    def test_list_cursor_from_other_sort(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select(mock_supabase, [SAMPLE_PROJECT, SAMPLE_PROJECT])
+
+        cursor = client.get("/projects?limit=1", headers=AUTH_HEADER).headers["X-Next-Cursor"]
+
+        resp = client.get(f"/projects?sort=title&cursor={cursor}", headers=AUTH_HEADER)
+        assert resp.status_code == 400
+
+    def test_list_limit_out_of_range(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+
+        resp = client.get("/projects?limit=0", headers=AUTH_HEADER)
+        assert resp.status_code == 422
+
+
+class TestSparseFieldsets:
+    def test_summary_view_omits_jsonb_arrays(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        summary_row = {
+            k: v for k, v in SAMPLE_PROJECT.items() if k not in ("instructions", "materials")
+        }
+        _mock_table_select(mock_supabase, [summary_row])
+
+        resp = client.get("/projects?view=summary", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data[0]["title"] == "Replace kitchen faucet"
+        assert "instructions" not in data[0]
+        assert "materials" not in data[0]
+        columns = mock_supabase.table.return_value.select.call_args.args[0].split(",")
+        assert "instructions" not in columns
+        assert "materials" not in columns
+
+    def test_fields_become_column_projection(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select(
+            mock_supabase,
+            [{"id": PROJECT_ID, "title": "Replace kitchen faucet", "status": "planning",
+              "updated_at": SAMPLE_PROJECT["updated_at"]}],
+        )
+
+        resp = client.get("/projects?fields=title,status", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert resp.json() == [{"title": "Replace kitchen faucet", "status": "planning"}]
+        mock_supabase.table.return_value.select.assert_called_once_with(
+            "title,status,id,updated_at"
+        )
+
+    def test_fields_are_still_validated(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select_eq(
+            mock_supabase,
+            [{"status": "not-a-status", "id": PROJECT_ID, "updated_at": SAMPLE_PROJECT["updated_at"]}],
+        )
+
+        with pytest.raises(ValidationError):
+            client.get(f"/projects/{PROJECT_ID}?fields=status", headers=AUTH_HEADER)
+
+    def test_fields_on_single_project(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select_eq(
+            mock_supabase,
+            [{"id": PROJECT_ID, "materials": SAMPLE_MATERIALS,
+              "updated_at": SAMPLE_PROJECT["updated_at"]}],
+        )
+
+        resp = client.get(f"/projects/{PROJECT_ID}?fields=id,materials", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert resp.json() == {"id": PROJECT_ID, "materials": SAMPLE_MATERIALS}
+
+    def test_unknown_field(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+
+        resp = client.get("/projects?fields=title,secret", headers=AUTH_HEADER)
+        assert resp.status_code == 400
+        assert "secret" in resp.json()["detail"]
+
 
 class TestGetProject:
     def test_get_success(self, client, mock_supabase):
@@ -245,6 +415,7 @@ class TestGetProject:
         data = resp.json()
         assert data["title"] == "Replace kitchen faucet"
         assert data["id"] == PROJECT_ID
+        assert _backend_calls(mock_supabase) == 1
 
     def test_get_not_found(self, client, mock_supabase):
         _mock_auth(mock_supabase)
@@ -261,7 +432,6 @@ class TestGetProject:
 class TestUpdateProject:
     def test_update_success(self, client, mock_supabase):
         _mock_auth(mock_supabase)
-        _mock_table_select_eq(mock_supabase, [SAMPLE_PROJECT])
         updated = {**SAMPLE_PROJECT, "title": "Updated title", "status": "in_progress"}
         _mock_table_update_eq(mock_supabase, [updated])
 
@@ -277,7 +447,6 @@ class TestUpdateProject:
 
     def test_update_partial(self, client, mock_supabase):
         _mock_auth(mock_supabase)
-        _mock_table_select_eq(mock_supabase, [SAMPLE_PROJECT])
         updated = {**SAMPLE_PROJECT, "priority": "high"}
         _mock_table_update_eq(mock_supabase, [updated])
 
@@ -290,14 +459,17 @@ class TestUpdateProject:
         data = resp.json()
         assert data["priority"] == "high"
         assert data["title"] == SAMPLE_PROJECT["title"]
+        mock_supabase.table.return_value.update.assert_called_once_with({"priority": "high"})
 
     def test_update_instructions_and_materials(self, client, mock_supabase):
         _mock_auth(mock_supabase)
-        _mock_table_select_eq(mock_supabase, [SAMPLE_PROJECT])
         new_instructions = [{"step": 1, "text": "New step one"}]
         new_materials = [{"name": "New item", "quantity": 2, "cost": 10.0, "owned": False}]
-        updated = {**SAMPLE_PROJECT, "instructions": new_instructions, "materials": new_materials}
-        _mock_table_update_eq(mock_supabase, [updated])
+        updated = {**SAMPLE_PROJECT, "instructions": new_instructions}
+        _mock_rpc(
+            mock_supabase,
+            [{**updated, "materials": [{**new_materials[0], "id": MATERIAL_ID}]}],
+        )
 
         resp = client.patch(
             f"/projects/{SAMPLE_PROJECT['id']}",
@@ -310,10 +482,46 @@ class TestUpdateProject:
         assert data["instructions"][0]["text"] == "New step one"
         assert len(data["materials"]) == 1
         assert data["materials"][0]["name"] == "New item"
+        assert _backend_calls(mock_supabase) == 1
+        name, params = mock_supabase.rpc.call_args.args
+        assert name == "update_projects"
+        assert params == {
+            "project_ids": [PROJECT_ID],
+            "changes": {"instructions": new_instructions},
+            "items": new_materials,
+            "versions": None,
+        }
+
+    def test_update_is_single_backend_call(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_update_eq(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = client.patch(
+            f"/projects/{SAMPLE_PROJECT['id']}",
+            json={"title": "Updated"},
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 200
+        assert _backend_calls(mock_supabase) == 1
+        mock_supabase.table.return_value.select.assert_not_called()
+
+    def test_update_empty_body_reads_project(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select_eq(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = client.patch(
+            f"/projects/{SAMPLE_PROJECT['id']}",
+            json={},
+            headers=AUTH_HEADER,
+        )
+        assert resp.status_code == 200
+        assert resp.json()["id"] == PROJECT_ID
+        assert _backend_calls(mock_supabase) == 1
+        mock_supabase.table.return_value.update.assert_not_called()
 
     def test_update_not_found(self, client, mock_supabase):
         _mock_auth(mock_supabase)
-        _mock_table_select_eq(mock_supabase, [])
+        _mock_table_update_eq(mock_supabase, [])
 
         resp = client.patch(
             "/projects/nonexistent-id",
@@ -321,6 +529,7 @@ class TestUpdateProject:
             headers=AUTH_HEADER,
         )
         assert resp.status_code == 404
+        assert _backend_calls(mock_supabase) == 1
 
     def test_update_invalid_status(self, client, mock_supabase):
         _mock_auth(mock_supabase)
@@ -331,6 +540,7 @@ class TestUpdateProject:
             headers=AUTH_HEADER,
         )
         assert resp.status_code == 422
+        assert _backend_calls(mock_supabase) == 0
 
     def test_update_without_token(self, client, mock_supabase):
         resp = client.patch(
@@ -343,19 +553,34 @@ class TestUpdateProject:
 class TestDeleteProject:
     def test_delete_success(self, client, mock_supabase):
         _mock_auth(mock_supabase)
-        _mock_table_select_eq(mock_supabase, [SAMPLE_PROJECT])
-        _mock_table_delete_eq(mock_supabase, [SAMPLE_PROJECT])
+        _mock_table_delete_eq(mock_supabase, [], count=1)
 
         resp = client.delete(f"/projects/{SAMPLE_PROJECT['id']}", headers=AUTH_HEADER)
+        assert resp.status_code == 204
+        assert resp.content == b""
+        assert _backend_calls(mock_supabase) == 1
+        mock_supabase.table.return_value.select.assert_not_called()
+
+    def test_delete_returns_representation_when_asked(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_delete_eq(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = client.delete(
+            f"/projects/{SAMPLE_PROJECT['id']}",
+            headers={**AUTH_HEADER, "Prefer": "return=representation"},
+        )
         assert resp.status_code == 200
-        assert resp.json()["message"] == "Project deleted"
+        assert resp.json()["id"] == PROJECT_ID
+        assert resp.headers["Preference-Applied"] == "return=representation"
+        assert _backend_calls(mock_supabase) == 1
 
     def test_delete_not_found(self, client, mock_supabase):
         _mock_auth(mock_supabase)
-        _mock_table_select_eq(mock_supabase, [])
+        _mock_table_delete_eq(mock_supabase, [], count=0)
 
         resp = client.delete("/projects/nonexistent-id", headers=AUTH_HEADER)
         assert resp.status_code == 404
+        assert _backend_calls(mock_supabase) == 1
 
     def test_delete_without_token(self, client, mock_supabase):
         resp = client.delete(f"/projects/{SAMPLE_PROJECT['id']}")
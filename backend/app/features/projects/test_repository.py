@@ -0,0 +1,236 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+import app.features.projects.postgres_repository as postgres_repository
+import app.shared.postgres as postgres
+from app.config import settings
+from app.features.projects.models import ProjectResponse, ProjectSort, ProjectStatus
+from app.features.projects.postgres_repository import PostgresProjectRepository
+from app.features.projects.repository import (
+    PostgrestProjectRepository,
+    get_project_repository,
+)
+from app.features.projects.test_projects import AUTH_HEADER, PROJECT_ID, USER_ID, _mock_auth
+from app.shared.pagination import encode_cursor
+
+USER = {"id": USER_ID, "email": "test@example.com", "token": "valid-token"}
+UPDATED_AT = datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+
+class RecordingConnection:
+    """Answers queries from a script and records the SQL it was sent."""
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.queries = []
+
+    def _answer(self, sql, args):
+        self.queries.append((" ".join(sql.split()), args))
+        return self.answers.pop(0) if self.answers else None
+
+    async def fetch(self, sql, *args):
+        return self._answer(sql, args)
+
+    async def fetchrow(self, sql, *args):
+        return self._answer(sql, args)
+
+    async def fetchval(self, sql, *args):
+        return self._answer(sql, args)
+
+    async def execute(self, sql, *args):
+        return self._answer(sql, args)
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+def _record(**overrides):
+    return {
+        "id": UUID(PROJECT_ID),
+        "title": "Replace kitchen faucet",
+        "estimated_cost": Decimal("150.5"),
+        "updated_at": UPDATED_AT,
+        "materials": [{"id": "m1", "name": "Faucet"}],
+        **overrides,
+    }
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    connection = RecordingConnection()
+
+    @asynccontextmanager
+    async def user_transaction(user):
+        assert user["id"] == USER_ID
+        yield connection
+
+    monkeypatch.setattr(postgres_repository, "user_transaction", user_transaction)
+    return connection
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestPostgresProjectRepository:
+    def test_rows_match_postgrest_json(self, conn):
+        conn.answers = [_record()]
+
+        row = _run(PostgresProjectRepository(USER).get_project(PROJECT_ID, ["id", "title"]))
+
+        assert row == {
+            "id": PROJECT_ID,
+            "title": "Replace kitchen faucet",
+            "estimated_cost": 150.5,
+            "updated_at": "2026-01-01T12:30:00+00:00",
+            "materials": [{"id": "m1", "name": "Faucet"}],
+        }
+        sql, args = conn.queries[0]
+        assert sql == 'SELECT p."id", p."title" FROM projects p WHERE p.id = $1::uuid'
+        assert args == (PROJECT_ID,)
+
+    def test_full_columns_embed_materials_in_order(self, conn):
+        conn.answers = [None]
+
+        columns = list(ProjectResponse.model_fields)
+        _run(PostgresProjectRepository(USER).get_project(PROJECT_ID, columns))
+
+        sql, _ = conn.queries[0]
+        assert "json_agg(json_build_object('name', m.name" in sql
+        assert "ORDER BY m.position" in sql
+
+    def test_invalid_id_is_not_found_without_a_query(self, conn):
+        assert _run(PostgresProjectRepository(USER).get_project("nope", ["id"])) is None
+        assert conn.queries == []
+
+    def test_unknown_column_is_rejected(self, conn):
+        with pytest.raises(ValueError):
+            _run(PostgresProjectRepository(USER).get_project(PROJECT_ID, ["id; DROP TABLE x"]))
+
+    def test_list_filters_and_keyset(self, conn):
+        conn.answers = [[_record()]]
+        cursor = encode_cursor("updated_at", "2026-01-02T00:00:00+00:00", PROJECT_ID)
+
+        rows = _run(
+            PostgresProjectRepository(USER).list_projects(
+                ["id", "updated_at"],
+                status=[ProjectStatus.planning],
+                priority=None,
+                sort=ProjectSort.updated_at_desc,
+                limit=10,
+                cursor=cursor,
+            )
+        )
+
+        assert rows[0]["id"] == PROJECT_ID
+        sql, args = conn.queries[0]
+        assert sql == (
+            'SELECT p."id", p."updated_at" FROM projects p'
+            " WHERE p.status = ANY($1::text[]::project_status[])"
+            ' AND (p."updated_at", p.id) < ($2::text::timestamptz, $3::uuid)'
+            ' ORDER BY p."updated_at" DESC, p.id DESC LIMIT 11'
+        )
+        assert args == (["planning"], "2026-01-02T00:00:00+00:00", PROJECT_ID)
+
+    def test_create_converts_json_like_postgrest(self, conn):
+        conn.answers = [UUID(PROJECT_ID), None, _record()]
+        data = {"title": "New", "user_id": USER_ID}
+
+        _run(PostgresProjectRepository(USER).create_project(data, [{"name": "Caulk"}]))
+
+        insert, materials, select = conn.queries
+        assert insert == (
+            'INSERT INTO projects ("title", "user_id") SELECT "title", "user_id"'
+            " FROM jsonb_populate_record(NULL::projects, $1) RETURNING id",
+            (data,),
+        )
+        assert materials[1] == ([PROJECT_ID], [{"name": "Caulk", "project_id": PROJECT_ID}])
+        assert select[1] == (PROJECT_ID,)
+
+    def test_conditional_update_that_matches_nothing(self, conn):
+        conn.answers = [None]
+
+        row = _run(
+            PostgresProjectRepository(USER).update_project(
+                PROJECT_ID, {"title": "X"}, None, ["2026-01-01T00:00:00+00:00"]
+            )
+        )
+
+        assert row is None
+        sql, args = conn.queries[0]
+        assert sql == (
+            'UPDATE projects p SET "title" = r."title"'
+            " FROM jsonb_populate_record(NULL::projects, $2) r"
+            " WHERE p.id = $1::uuid AND p.updated_at = ANY($3::text[]::timestamptz[])"
+            " RETURNING p.id"
+        )
+        assert args == (PROJECT_ID, {"title": "X"}, ["2026-01-01T00:00:00+00:00"])
+
+    def test_delete_minimal(self, conn):
+        conn.answers = [{"id": UUID(PROJECT_ID)}]
+
+        row = _run(PostgresProjectRepository(USER).delete_project(PROJECT_ID, None, False))
+
+        assert row == {"id": PROJECT_ID}
+        assert conn.queries[0][0].endswith("RETURNING p.id")
+
+
+class FakePool:
+    def __init__(self, connection):
+        self.connection = connection
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.connection
+
+
+def test_user_transaction_sets_role_and_claims_locally(monkeypatch):
+    connection = RecordingConnection()
+    monkeypatch.setattr(postgres, "_pool", FakePool(connection))
+
+    async def scenario():
+        async with postgres.user_transaction(USER) as conn:
+            assert conn is connection
+
+    _run(scenario())
+
+    sql, args = connection.queries[0]
+    assert "set_config('role', 'authenticated', true)" in sql
+    assert "set_config('request.jwt.claims', $1, true)" in sql
+    assert json.loads(args[0]) == {
+        "sub": USER_ID,
+        "email": "test@example.com",
+        "role": "authenticated",
+    }
+
+
+class TestRepositorySelection:
+    def test_postgrest_by_default(self):
+        repo = _run(get_project_repository(USER, db="db"))
+        assert isinstance(repo, PostgrestProjectRepository)
+
+    def test_postgres_when_configured(self, monkeypatch):
+        monkeypatch.setattr(settings, "project_storage", "postgres")
+        repo = _run(get_project_repository(USER, db="db"))
+        assert isinstance(repo, PostgresProjectRepository)
+
+    def test_routes_read_through_the_selected_repository(
+        self, client, mock_supabase, conn, monkeypatch
+    ):
+        _mock_auth(mock_supabase)
+        monkeypatch.setattr(settings, "project_storage", "postgres")
+        conn.answers = [_record()]
+
+        resp = client.get(f"/projects/{PROJECT_ID}?fields=title", headers=AUTH_HEADER)
+
+        assert resp.status_code == 200
+        assert resp.json() == {"title": "Replace kitchen faucet"}
+        assert resp.headers["etag"] == 'W/"2026-01-01T12:30:00+00:00"'
+        mock_supabase.table.assert_not_called()
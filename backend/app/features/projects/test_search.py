@@ -0,0 +1,92 @@
+from unittest.mock import MagicMock
+
+from app.features.projects.test_projects import (
+    AUTH_HEADER,
+    PROJECT_ID,
+    SAMPLE_PROJECT,
+    _mock_auth,
+)
+from app.shared.pagination import encode_cursor
+
+SUMMARY_FIELDS = [
+    "id",
+    "user_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "estimated_duration_hours",
+    "estimated_cost",
+    "created_at",
+    "updated_at",
+]
+SECOND_ID = "22222222-2222-3333-4444-555555555555"
+
+
+def _hit(rank, project_id=PROJECT_ID):
+    return {
+        **{field: SAMPLE_PROJECT[field] for field in SUMMARY_FIELDS},
+        "id": project_id,
+        "rank": rank,
+    }
+
+
+def _mock_rpc(mock_supabase, return_data):
+    execute = MagicMock()
+    execute.data = return_data
+    mock_supabase.rpc.return_value.execute.return_value = execute
+
+
+class TestSearchProjects:
+    def test_returns_ranked_summaries(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_rpc(mock_supabase, [_hit(0.9), _hit(0.4, SECOND_ID)])
+
+        resp = client.get("/projects/search?q=faucet", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [row["id"] for row in data] == [PROJECT_ID, SECOND_ID]
+        assert data[0]["rank"] == 0.9
+        assert "materials" not in data[0]
+        assert "X-Next-Cursor" not in resp.headers
+        mock_supabase.rpc.assert_called_once_with(
+            "search_projects", {"q": "faucet", "result_limit": 51}, get=True
+        )
+
+    def test_next_cursor_on_full_page(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_rpc(mock_supabase, [_hit(0.9), _hit(0.4, SECOND_ID)])
+
+        resp = client.get("/projects/search?q=faucet&limit=1", headers=AUTH_HEADER)
+        assert len(resp.json()) == 1
+        assert resp.headers["X-Next-Cursor"] == encode_cursor("rank", 0.9, PROJECT_ID)
+
+    def test_cursor_resumes_after_rank(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_rpc(mock_supabase, [])
+        cursor = encode_cursor("rank", 0.9, PROJECT_ID)
+
+        resp = client.get(
+            f"/projects/search?q=faucet&limit=1&cursor={cursor}", headers=AUTH_HEADER
+        )
+        assert resp.status_code == 200
+        params = mock_supabase.rpc.call_args.args[1]
+        assert params["after_rank"] == 0.9
+        assert params["after_id"] == PROJECT_ID
+
+    def test_rejects_cursor_from_other_sort(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        cursor = encode_cursor("updated_at", "2026-01-01", PROJECT_ID)
+
+        resp = client.get(
+            f"/projects/search?q=faucet&cursor={cursor}", headers=AUTH_HEADER
+        )
+        assert resp.status_code == 400
+
+    def test_requires_query(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+
+        resp = client.get("/projects/search", headers=AUTH_HEADER)
+        assert resp.status_code == 422
+        resp = client.get("/projects/search?q=", headers=AUTH_HEADER)
+        assert resp.status_code == 422
@@ -0,0 +1,241 @@
+import asyncio
+import json
+
+import pytest
+
+from app.config import settings
+from app.features.projects import stream
+from app.features.projects.stream import RESYNC, ProjectChangeFeed
+from app.features.projects.test_projects import AUTH_HEADER, PROJECT_ID, USER_ID, _mock_auth
+from app.main import app as fastapi_app
+from app.shared.broadcast import broadcaster
+
+OTHER_USER_ID = "ffffffff-e5f6-7890-abcd-ef1234567890"
+
+
+def _notification(op, user_id=USER_ID, project_id=PROJECT_ID):
+    return json.dumps(
+        {
+            "op": op,
+            "id": project_id,
+            "user_id": user_id,
+            "updated_at": "2026-01-01T00:00:00+00:00",
+        }
+    )
+
+
+class FakeConnection:
+    """Stands in for an asyncpg connection holding ``LISTEN project_changes``."""
+
+    def __init__(self):
+        self.listeners = {}
+        self.on_terminate = []
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    def add_termination_listener(self, callback):
+        self.on_terminate.append(callback)
+
+    def notify(self, payload):
+        self.listeners[stream.CHANNEL](self, 1, stream.CHANNEL, payload)
+
+    def terminate(self):
+        self.closed = True
+        for callback in self.on_terminate:
+            callback(self)
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.connections = []
+
+    async def connect(self):
+        self.connections.append(FakeConnection())
+        return self.connections[-1]
+
+
+@pytest.fixture
+def database(monkeypatch):
+    database = FakeDatabase()
+    feed = ProjectChangeFeed(broadcaster, database.connect)
+    feed.reconnect_delay = 0.01
+    monkeypatch.setattr(stream, "feed", feed)
+    return database
+
+
+async def _next(events):
+    return await asyncio.wait_for(events.__anext__(), 1)
+
+
+class TestProjectChangeFeed:
+    def test_changes_go_to_the_owner(self, database):
+        async def scenario():
+            mine, theirs = broadcaster.subscribe(USER_ID), broadcaster.subscribe(OTHER_USER_ID)
+            stream.feed.ensure_started()
+            await asyncio.wait_for(stream.feed.connected.wait(), 1)
+
+            database.connections[0].notify(_notification("INSERT"))
+            database.connections[0].notify(_notification("DELETE"))
+            database.connections[0].notify("not json")
+            received = [await mine.get(), await mine.get()]
+            await stream.feed.stop()
+            broadcaster.unsubscribe(mine)
+            broadcaster.unsubscribe(theirs)
+            return received, theirs
+
+        received, theirs = asyncio.run(scenario())
+        data = {"id": PROJECT_ID, "updated_at": "2026-01-01T00:00:00+00:00"}
+        assert received == [("created", data), ("deleted", data)]
+        assert theirs._queue.empty()
+
+    def test_reconnects_and_asks_streams_to_resync(self, database):
+        async def scenario():
+            subscription = broadcaster.subscribe(USER_ID)
+            stream.feed.ensure_started()
+            await asyncio.wait_for(stream.feed.connected.wait(), 1)
+
+            database.connections[0].terminate()
+            message = await asyncio.wait_for(subscription.get(), 1)
+            database.connections[1].notify(_notification("UPDATE"))
+            after = await asyncio.wait_for(subscription.get(), 1)
+            await stream.feed.stop()
+            broadcaster.unsubscribe(subscription)
+            return message, after
+
+        message, after = asyncio.run(scenario())
+        assert message == RESYNC
+        assert after[0] == "updated"
+        assert len(database.connections) == 2
+
+    def test_one_listener_serves_every_stream(self, database):
+        async def scenario():
+            streams = [stream.event_stream(USER_ID) for _ in range(3)]
+            for events in streams:
+                await _next(events)
+            await asyncio.wait_for(stream.feed.connected.wait(), 1)
+            for events in streams:
+                await events.aclose()
+            await stream.feed.stop()
+
+        asyncio.run(scenario())
+        assert len(database.connections) == 1
+        assert broadcaster.stats()["subscribers"] == 0
+
+
+class TestEventStream:
+    def test_formats_changes_as_server_sent_events(self, database):
+        async def scenario():
+            events = stream.event_stream(USER_ID)
+            first = await _next(events)
+            await asyncio.wait_for(stream.feed.connected.wait(), 1)
+            database.connections[0].notify(_notification("UPDATE"))
+            change = await _next(events)
+            await events.aclose()
+            await stream.feed.stop()
+            return first, change
+
+        first, change = asyncio.run(scenario())
+        assert first == "retry: 5000\n\n"
+        event, data = change.strip().split("\n")
+        assert event == "event: updated"
+        assert json.loads(data.removeprefix("data: "))["id"] == PROJECT_ID
+
+    def test_sends_keep_alive_when_idle(self, database, monkeypatch):
+        monkeypatch.setattr(settings, "stream_keepalive_seconds", 0.01)
+
+        async def scenario():
+            events = stream.event_stream(USER_ID)
+            await _next(events)
+            comment = await _next(events)
+            await events.aclose()
+            await stream.feed.stop()
+            return comment
+
+        assert asyncio.run(scenario()) == ": keep-alive\n\n"
+
+    def test_overflow_becomes_resync(self, database, monkeypatch):
+        monkeypatch.setattr(settings, "stream_buffer_size", 1)
+
+        async def scenario():
+            events = stream.event_stream(USER_ID)
+            await _next(events)
+            broadcaster.publish(USER_ID, ("updated", {"id": "a"}))
+            broadcaster.publish(USER_ID, ("updated", {"id": "b"}))
+            message = await _next(events)
+            await events.aclose()
+            await stream.feed.stop()
+            return message
+
+        assert asyncio.run(scenario()) == "event: resync\ndata: {}\n\n"
+
+
+class TestStreamRoute:
+    def test_disabled_by_default(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+
+        resp = client.get("/projects/stream", headers=AUTH_HEADER)
+        assert resp.status_code == 503
+
+    def test_requires_auth(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "project_stream_enabled", True)
+
+        resp = client.get("/projects/stream")
+        assert resp.status_code == 401
+
+    def test_streams_to_the_authenticated_user(self, mock_supabase, database, monkeypatch):
+        monkeypatch.setattr(settings, "project_stream_enabled", True)
+        _mock_auth(mock_supabase)
+
+        async def scenario():
+            sent = asyncio.Queue()
+            disconnected = asyncio.Event()
+
+            async def receive():
+                await disconnected.wait()
+                return {"type": "http.disconnect"}
+
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": "/projects/stream",
+                "raw_path": b"/projects/stream",
+                "query_string": b"",
+                "root_path": "",
+                "headers": [(b"authorization", AUTH_HEADER["Authorization"].encode())],
+                "client": ("testclient", 50000),
+                "server": ("testserver", 80),
+            }
+            app = asyncio.create_task(fastapi_app(scope, receive, sent.put))
+
+            start = await asyncio.wait_for(sent.get(), 1)
+            retry = await asyncio.wait_for(sent.get(), 1)
+            await asyncio.wait_for(stream.feed.connected.wait(), 1)
+            database.connections[0].notify(_notification("INSERT", user_id=OTHER_USER_ID))
+            database.connections[0].notify(_notification("INSERT"))
+            change = await asyncio.wait_for(sent.get(), 1)
+
+            disconnected.set()
+            await asyncio.wait_for(app, 1)
+            await stream.feed.stop()
+            return start, retry, change
+
+        start, retry, change = asyncio.run(scenario())
+        headers = dict(start["headers"])
+        assert start["status"] == 200
+        assert headers[b"content-type"].startswith(b"text/event-stream")
+        assert headers[b"cache-control"] == b"no-cache"
+        assert retry["body"] == b"retry: 5000\n\n"
+        assert change["body"].startswith(b"event: created\n")
+        assert broadcaster.stats()["subscribers"] == 0
+
@@ -0,0 +1,16 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ShoppingListSource(BaseModel):
+    id: UUID
+    title: str
+
+
+class ShoppingListItem(BaseModel):
+    name: str
+    quantity: float
+    total_cost: Optional[float] = None
+    projects: list[ShoppingListSource]
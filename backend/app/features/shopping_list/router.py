@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends
+
+from app.features.shopping_list.models import ShoppingListItem
+from app.shared.cache import read_through
+from app.shared.calls import execute
+from app.shared.dependencies import get_authenticated_client, get_current_user
+from app.supabase_client import PostgrestClient
+
+router = APIRouter()
+
+
+@router.get("", response_model=list[ShoppingListItem])
+async def get_shopping_list(
+    user: dict = Depends(get_current_user),
+    db: PostgrestClient = Depends(get_authenticated_client),
+):
+    async def load() -> list[dict]:
+        return (await execute(db.rpc("shopping_list", {}, get=True))).data
+
+    return await read_through(user["id"], "shopping-list", load)
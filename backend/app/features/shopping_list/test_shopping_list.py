@@ -0,0 +1,111 @@
+from unittest.mock import MagicMock
+
+from app.config import settings
+
+USER_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+AUTH_HEADER = {"Authorization": "Bearer valid-token"}
+
+FAUCET_PROJECT = {"id": "11111111-2222-3333-4444-555555555555", "title": "Replace kitchen faucet"}
+SINK_PROJECT = {"id": "22222222-2222-3333-4444-555555555555", "title": "Fix bathroom sink"}
+
+SAMPLE_SHOPPING_LIST = [
+    {
+        "name": "Plumber's tape",
+        "quantity": 3,
+        "total_cost": 7.98,
+        "projects": [FAUCET_PROJECT, SINK_PROJECT],
+    },
+    {
+        "name": "Moen faucet",
+        "quantity": 1,
+        "total_cost": 89.99,
+        "projects": [FAUCET_PROJECT],
+    },
+]
+
+
+def _mock_auth(mock_supabase):
+    mock_response = MagicMock()
+    mock_response.user.id = USER_ID
+    mock_response.user.email = "test@example.com"
+    mock_supabase.auth.get_user.return_value = mock_response
+
+
+def _mock_rpc(mock_supabase, return_data):
+    execute = MagicMock()
+    execute.data = return_data
+    mock_supabase.rpc.return_value.execute.return_value = execute
+
+
+class TestShoppingList:
+    def test_returns_aggregated_items(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_rpc(mock_supabase, SAMPLE_SHOPPING_LIST)
+
+        resp = client.get("/shopping-list", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data[0]["name"] == "Plumber's tape"
+        assert data[0]["quantity"] == 3
+        assert [p["title"] for p in data[0]["projects"]] == [
+            "Replace kitchen faucet",
+            "Fix bathroom sink",
+        ]
+
+    def test_aggregation_runs_in_database(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_rpc(mock_supabase, SAMPLE_SHOPPING_LIST)
+
+        client.get("/shopping-list", headers=AUTH_HEADER)
+        mock_supabase.rpc.assert_called_once_with("shopping_list", {}, get=True)
+        mock_supabase.table.assert_not_called()
+
+    def test_item_without_cost(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_rpc(
+            mock_supabase,
+            [{"name": "Screws", "quantity": 20, "total_cost": None, "projects": [FAUCET_PROJECT]}],
+        )
+
+        resp = client.get("/shopping-list", headers=AUTH_HEADER)
+        assert resp.json()[0]["total_cost"] is None
+
+    def test_empty(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_rpc(mock_supabase, [])
+
+        resp = client.get("/shopping-list", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert resp.json() == []
+
+    def test_without_token(self, client, mock_supabase):
+        resp = client.get("/shopping-list")
+        assert resp.status_code == 401
+
+    def test_cached_until_project_write(self, client, mock_supabase, monkeypatch):
+        monkeypatch.setattr(settings, "cache_enabled", True)
+        _mock_auth(mock_supabase)
+        _mock_rpc(mock_supabase, SAMPLE_SHOPPING_LIST)
+
+        client.get("/shopping-list", headers=AUTH_HEADER)
+        client.get("/shopping-list", headers=AUTH_HEADER)
+        assert mock_supabase.rpc.call_count == 1
+
+        update = mock_supabase.table.return_value.update.return_value
+        update.eq.return_value.select.return_value.execute.return_value.data = [
+            {
+                **FAUCET_PROJECT,
+                "user_id": USER_ID,
+                "status": "planning",
+                "priority": "medium",
+                "created_at": "2026-01-01T00:00:00+00:00",
+                "updated_at": "2026-01-01T00:00:00+00:00",
+            }
+        ]
+        client.patch(
+            f"/projects/{FAUCET_PROJECT['id']}",
+            json={"title": "Replace kitchen faucet"},
+            headers=AUTH_HEADER,
+        )
+        client.get("/shopping-list", headers=AUTH_HEADER)
+        assert mock_supabase.rpc.call_count == 2
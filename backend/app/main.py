@@ -1,23 +1,81 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from app import warmup
+from app.config import settings
 from app.features.auth.router import router as auth_router
+from app.features.dashboard.router import router as dashboard_router
+from app.features.materials.router import router as materials_router
+from app.features.projects import stream
 from app.features.projects.router import router as projects_router
+from app.features.shopping_list.router import router as shopping_list_router
+from app.shared import metrics
+from app.shared.admission import AdmissionMiddleware
+from app.shared.postgres import close_pool
+from app.shared.resilience import RequestBudgetMiddleware
+from app.supabase_client import close_async_http_client, close_http_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warmup.warm_up()
+    yield
+    warmup.state.ready = False
+    await stream.feed.stop()
+    close_http_client()
+    await close_async_http_client()
+    await close_pool()
 
-app = FastAPI(title="Home Central API")
 
+app = FastAPI(title="Home Central API", lifespan=lifespan)
+
+# The last middleware added runs first: CORS wraps everything so shed
+# responses stay readable by the browser.
+app.add_middleware(RequestBudgetMiddleware)
+if settings.admission_enabled:
+    app.add_middleware(AdmissionMiddleware)
+if settings.metrics_enabled:
+    app.add_middleware(metrics.TimingMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "Server-Timing", "Retry-After"],
 )
 
 app.include_router(auth_router, prefix="/auth", tags=["auth"])
+app.include_router(dashboard_router, prefix="/dashboard", tags=["dashboard"])
 app.include_router(projects_router, prefix="/projects", tags=["projects"])
+app.include_router(
+    materials_router,
+    prefix="/projects/{project_id}/materials",
+    tags=["materials"],
+)
+app.include_router(shopping_list_router, prefix="/shopping-list", tags=["shopping-list"])
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "ok"}
+
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 until warm-up has succeeded (retried per probe)."""
+    ready = warmup.state.ready or await warmup.warm_up()
+    return JSONResponse(
+        {"status": "ready" if ready else "starting", "checks": warmup.state.checks},
+        status_code=200 if ready else 503,
+    )
+
+
+if settings.metrics_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def prometheus_metrics():
+        return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,193 @@
+"""Admission control: bounded concurrency and queueing in front of the routers.
+
+Each request is admitted into one pool: the pool of the longest
+``ADMISSION_ROUTE_LIMITS`` prefix it matches (e.g. ``/projects/export``),
+or the default pool capped by ``ADMISSION_MAX_CONCURRENCY``. When a pool is
+full the request waits in that pool's queue, which is bounded in length and
+in wait time; past either bound it is shed with 503. Queued requests are
+admitted round-robin across callers, so one user's bulk script queues
+behind itself rather than in front of everyone, and a caller with
+``ADMISSION_MAX_PER_USER`` requests already in flight or queued gets 429.
+
+Callers are told apart by their ``Authorization`` header (the token is not
+verified this early) or, without one, by client address.
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+from typing import Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+
+DEFAULT_POOL = "default"
+
+
+class Shed(Exception):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class FairLimiter:
+    """At most ``limit`` holders; up to ``max_queue`` waiters, served round-robin by caller."""
+
+    def __init__(self, limit: int, max_queue: int):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self.queued = 0
+        self._waiters: OrderedDict[str, deque[asyncio.Future]] = OrderedDict()
+
+    async def acquire(self, caller: str, timeout: float) -> None:
+        """Take a slot, waiting at most ``timeout`` seconds; raises :class:`Shed`."""
+        if self.active < self.limit and not self.queued:
+            self.active += 1
+            return
+        if self.queued >= self.max_queue:
+            raise Shed("queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(caller, deque()).append(waiter)
+        self.queued += 1
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait ended.
+                self.release()
+            else:
+                self._remove(caller, waiter)
+            if isinstance(e, TimeoutError):
+                raise Shed("queue_timeout") from e
+            raise
+
+    def release(self) -> None:
+        """Hand the slot to the next caller in turn, or free it."""
+        while self._waiters:
+            caller, waiters = next(iter(self._waiters.items()))
+            waiter = waiters.popleft()
+            self.queued -= 1
+            if waiters:
+                self._waiters.move_to_end(caller)
+            else:
+                del self._waiters[caller]
+            # A waiter that timed out or was cancelled stays queued until its
+            # task runs again; it can't take the slot, so pass over it.
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _remove(self, caller: str, waiter: asyncio.Future) -> None:
+        waiters = self._waiters.get(caller)
+        if waiters is None or waiter not in waiters:
+            return
+        waiters.remove(waiter)
+        self.queued -= 1
+        if not waiters:
+            del self._waiters[caller]
+
+
+class Admission:
+    """The pools and per-caller counts, created on first use from settings."""
+
+    def __init__(self):
+        self.pools: dict[str, FairLimiter] = {}
+        self.shed: dict[tuple[str, str], int] = {}
+        self.per_caller: dict[str, int] = {}
+
+    def pool_for(self, path: str) -> str:
+        matches = [
+            prefix
+            for prefix in settings.admission_route_limits
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/")
+        ]
+        return max(matches, key=len) if matches else DEFAULT_POOL
+
+    def limiter(self, pool: str) -> FairLimiter:
+        limiter = self.pools.get(pool)
+        if limiter is None:
+            limit = settings.admission_route_limits.get(pool, settings.admission_max_concurrency)
+            limiter = self.pools[pool] = FairLimiter(limit, settings.admission_max_queue)
+        return limiter
+
+    def record_shed(self, pool: str, reason: str) -> None:
+        self.shed[(pool, reason)] = self.shed.get((pool, reason), 0) + 1
+
+    def stats(self) -> dict:
+        return {
+            "pools": {
+                pool: {"active": limiter.active, "queued": limiter.queued}
+                for pool, limiter in self.pools.items()
+            },
+            "shed": dict(self.shed),
+        }
+
+    def reset(self) -> None:
+        self.pools.clear()
+        self.shed.clear()
+        self.per_caller.clear()
+
+
+admission = Admission()
+
+
+def _caller(scope: Scope) -> str:
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            return value.decode("latin-1")
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _rejection(status: int, detail: str) -> JSONResponse:
+    return JSONResponse(
+        {"detail": detail},
+        status_code=status,
+        headers={"Retry-After": str(settings.admission_retry_after_seconds)},
+    )
+
+
+class AdmissionMiddleware:
+    """Admit, queue or shed each HTTP request (see module docstring)."""
+
+    def __init__(self, app: ASGIApp, state: Optional[Admission] = None):
+        self.app = app
+        self.state = state or admission
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in settings.admission_exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        state = self.state
+        pool = state.pool_for(scope["path"])
+        caller = _caller(scope)
+        if state.per_caller.get(caller, 0) >= settings.admission_max_per_user:
+            state.record_shed(pool, "user_limit")
+            await _rejection(429, "Too many concurrent requests")(scope, receive, send)
+            return
+
+        state.per_caller[caller] = state.per_caller.get(caller, 0) + 1
+        try:
+            limiter = state.limiter(pool)
+            try:
+                await limiter.acquire(caller, settings.admission_queue_timeout_seconds)
+            except Shed as e:
+                state.record_shed(pool, e.reason)
+                await _rejection(503, "Server is busy, try again shortly")(scope, receive, send)
+                return
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                limiter.release()
+        finally:
+            count = state.per_caller[caller] - 1
+            if count:
+                state.per_caller[caller] = count
+            else:
+                del state.per_caller[caller]
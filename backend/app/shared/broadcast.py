@@ -0,0 +1,85 @@
+"""In-process fan-out from one event source to many subscribers.
+
+Each subscriber gets a bounded buffer. A subscriber that falls behind is
+not allowed to hold memory or slow the publisher: its buffer is dropped and
+replaced by :data:`OVERFLOW`, telling it to resynchronise from the source of
+truth. An idle subscriber costs one small queue and one waiting coroutine.
+"""
+
+import asyncio
+from typing import Any
+
+from app.config import settings
+
+OVERFLOW = object()
+
+
+class Subscription:
+    __slots__ = ("topic", "_queue", "_overflowed")
+
+    def __init__(self, topic: str, size: int):
+        self.topic = topic
+        self._queue: asyncio.Queue = asyncio.Queue(size)
+        self._overflowed = False
+
+    def put(self, message: Any) -> bool:
+        """Buffer ``message``; False if it was dropped because the buffer is full."""
+        if self._overflowed:
+            return False
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(OVERFLOW)
+            self._overflowed = True
+            return False
+
+    async def get(self) -> Any:
+        message = await self._queue.get()
+        if message is OVERFLOW:
+            self._overflowed = False
+        return message
+
+
+class Broadcaster:
+    """Subscriptions grouped by topic (e.g. a user id)."""
+
+    def __init__(self):
+        self._topics: dict[str, set[Subscription]] = {}
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self, topic: str) -> Subscription:
+        subscription = Subscription(topic, settings.stream_buffer_size)
+        self._topics.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._topics.get(subscription.topic)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._topics[subscription.topic]
+
+    def publish(self, topic: str, message: Any) -> None:
+        self.published += 1
+        for subscription in self._topics.get(topic, ()):
+            if not subscription.put(message):
+                self.dropped += 1
+
+    def publish_all(self, message: Any) -> None:
+        for topic in list(self._topics):
+            self.publish(topic, message)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": sum(len(subscribers) for subscribers in self._topics.values()),
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+
+broadcaster = Broadcaster()
@@ -0,0 +1,162 @@
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Protocol
+
+from pydantic_core import to_json
+
+from app.config import settings
+from app.shared.singleflight import flights
+
+MISSING = object()
+
+
+class CacheBackend(Protocol):
+    """Storage behind :func:`read_through`.
+
+    Entries live in per-namespace buckets (one per user) so a write can drop
+    everything that user might see without touching anyone else's entries.
+    The interface is async so an out-of-process store can implement it.
+    """
+
+    async def get(self, namespace: str, key: str) -> Any: ...
+
+    async def set(self, namespace: str, key: str, value: Any) -> None: ...
+
+    async def invalidate(self, namespace: str) -> None: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+
+class MemoryCache:
+    """In-process LRU with a TTL and entry/byte limits.
+
+    Not shared between workers: a write only invalidates the worker that
+    served it, so other workers can serve data up to ``ttl`` seconds old.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, int, Any]] = OrderedDict()
+        self._namespaces: dict[str, set[str]] = {}
+        self._bytes = 0
+        self._counters = dict.fromkeys(
+            ("hits", "misses", "evictions", "expirations", "invalidations"), 0
+        )
+
+    async def get(self, namespace: str, key: str) -> Any:
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            self._counters["misses"] += 1
+            return MISSING
+
+        expires_at, _, value = entry
+        if expires_at <= self._clock():
+            self._remove((namespace, key))
+            self._counters["expirations"] += 1
+            self._counters["misses"] += 1
+            return MISSING
+
+        self._entries.move_to_end((namespace, key))
+        self._counters["hits"] += 1
+        return value
+
+    async def set(self, namespace: str, key: str, value: Any) -> None:
+        size = len(to_json(value))
+        if size > self.max_bytes:
+            return
+
+        self._remove((namespace, key))
+        self._entries[(namespace, key)] = (self._clock() + self.ttl, size, value)
+        self._namespaces.setdefault(namespace, set()).add(key)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._counters["evictions"] += 1
+
+    async def invalidate(self, namespace: str) -> None:
+        for key in list(self._namespaces.get(namespace, ())):
+            self._remove((namespace, key))
+        self._counters["invalidations"] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._namespaces.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {**self._counters, "entries": len(self._entries), "bytes": self._bytes}
+
+    def _remove(self, entry_key: tuple[str, str]) -> None:
+        entry = self._entries.pop(entry_key, None)
+        if entry is None:
+            return
+        self._bytes -= entry[1]
+        namespace, key = entry_key
+        keys = self._namespaces.get(namespace)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._namespaces[namespace]
+
+
+cache: CacheBackend = MemoryCache(
+    max_entries=settings.cache_max_entries,
+    max_bytes=settings.cache_max_bytes,
+    ttl=settings.cache_ttl_seconds,
+)
+
+
+# namespace -> [loads running, invalidations since the first of them began].
+# Only namespaces with a load in progress are tracked.
+_loading: dict[str, list[int]] = {}
+
+
+async def read_through(namespace: str, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached value for ``key`` or load, store and return it.
+
+    Concurrent misses for the same key share one load (see
+    :class:`app.shared.singleflight.SingleFlight`), cache or no cache. A load
+    that overlaps an :func:`invalidate` of its namespace may have read the
+    data from before the write, so its result is returned but not stored.
+    """
+    if settings.cache_enabled:
+        value = await cache.get(namespace, key)
+        if value is not MISSING:
+            return value
+
+    async def load_and_store() -> Any:
+        state = _loading.setdefault(namespace, [0, 0])
+        state[0] += 1
+        generation = state[1]
+        try:
+            value = await load()
+            if settings.cache_enabled and state[1] == generation:
+                await cache.set(namespace, key, value)
+            return value
+        finally:
+            state[0] -= 1
+            if not state[0]:
+                del _loading[namespace]
+
+    if not settings.singleflight_enabled:
+        return await load_and_store()
+    return await flights.do(namespace, key, load_and_store)
+
+
+async def invalidate(namespace: str) -> None:
+    state = _loading.get(namespace)
+    if state is not None:
+        state[1] += 1
+    flights.forget(namespace)
+    if settings.cache_enabled:
+        await cache.invalidate(namespace)
@@ -0,0 +1,125 @@
+import asyncio
+import inspect
+import math
+import random
+import time
+from functools import partial
+
+import anyio.to_thread
+import httpx
+from fastapi import HTTPException
+from postgrest import APIError
+from supabase_auth.errors import AuthRetryableError
+
+from app.config import settings
+from app.shared.metrics import (
+    SUPABASE_CALL_DURATION,
+    SUPABASE_REJECTIONS,
+    SUPABASE_RETRIES,
+    count_supabase_call,
+    timed,
+)
+from app.shared.resilience import breakers, remaining
+
+# PostgREST's own "could not reach the database" errors.
+_UNAVAILABLE_CODES = {"PGRST000", "PGRST001", "PGRST002"}
+
+
+def _is_failure(error: Exception) -> bool:
+    """Whether ``error`` means the upstream is unhealthy, not that the request was bad."""
+    if isinstance(error, (httpx.TransportError, TimeoutError, AuthRetryableError)):
+        return True
+    if isinstance(error, APIError):
+        # Non-JSON gateway errors surface with the HTTP status as the code.
+        code = error.code
+        return code in _UNAVAILABLE_CODES or (isinstance(code, int) and code >= 500)
+    return False
+
+
+def _unavailable(upstream: str, retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail=f"Supabase {upstream} is unavailable",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+def _timed_out(upstream: str) -> HTTPException:
+    return HTTPException(status_code=504, detail=f"Supabase {upstream} did not respond in time")
+
+
+async def _invoke(fn, args, kwargs):
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args, **kwargs)
+    # Abandon the worker thread on timeout instead of waiting for it; the
+    # thread itself is bounded by HTTP_TIMEOUT_SECONDS.
+    return await anyio.to_thread.run_sync(partial(fn, *args, **kwargs), abandon_on_cancel=True)
+
+
+async def call(fn, *args, upstream: str = "rest", idempotent: bool = False, **kwargs):
+    """Invoke a Supabase client method from an async handler.
+
+    Methods of the async clients are awaited on the event loop; blocking
+    methods of the sync clients are pushed to the threadpool so the loop
+    never stalls on network I/O. Each call is counted and timed as the
+    request's ``supabase`` stage.
+
+    Every attempt gets the smaller of ``SUPABASE_CALL_TIMEOUT_SECONDS`` and
+    what is left of the request budget. ``idempotent`` calls are retried on
+    upstream failures with jittered exponential backoff. Failures feed the
+    ``upstream`` circuit breaker; while it is open calls fail fast with 503.
+    Running out of time gives 504.
+    """
+    breaker = breakers.get(upstream)
+    attempts = 1 + (settings.supabase_retries if idempotent else 0)
+
+    for attempt in range(attempts):
+        if not breaker.allow():
+            SUPABASE_REJECTIONS.inc(upstream)
+            raise _unavailable(upstream, breaker.retry_after())
+
+        timeout = settings.supabase_call_timeout_seconds
+        left = remaining()
+        if left is not None:
+            if left <= 0:
+                raise _timed_out(upstream)
+            timeout = min(timeout, left)
+
+        count_supabase_call()
+        start = time.perf_counter()
+        try:
+            with timed("supabase"):
+                result = await asyncio.wait_for(_invoke(fn, args, kwargs), timeout)
+        except Exception as e:
+            if not _is_failure(e):
+                SUPABASE_CALL_DURATION.observe(time.perf_counter() - start, upstream, "error")
+                breaker.record_success()
+                raise
+            timed_out = isinstance(e, TimeoutError)
+            outcome = "timeout" if timed_out else "failure"
+            SUPABASE_CALL_DURATION.observe(time.perf_counter() - start, upstream, outcome)
+            breaker.record_failure()
+
+            backoff = random.uniform(0, settings.supabase_retry_backoff_seconds * 2**attempt)
+            left = remaining()
+            if attempt + 1 == attempts or (left is not None and left <= backoff):
+                if timed_out:
+                    raise _timed_out(upstream) from e
+                raise _unavailable(upstream, breaker.retry_after()) from e
+            SUPABASE_RETRIES.inc(upstream)
+            await asyncio.sleep(backoff)
+        else:
+            SUPABASE_CALL_DURATION.observe(time.perf_counter() - start, upstream, "ok")
+            breaker.record_success()
+            return result
+
+
+async def execute(query):
+    """Execute a PostgREST query built from either client flavour.
+
+    Reads (GET/HEAD) are retried here; postgrest's own retry loop is turned
+    off because it sleeps outside the request's deadline.
+    """
+    query.retry(False)
+    idempotent = query.request.http_method in ("GET", "HEAD")
+    return await call(query.execute, idempotent=idempotent)
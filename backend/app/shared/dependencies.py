@@ -1,28 +1,62 @@
+import jwt
 from fastapi import Depends, Header, HTTPException
-from supabase import Client, ClientOptions, create_client
+from starlette.concurrency import run_in_threadpool
 from supabase_auth.errors import AuthApiError
 
 from app.config import settings
-from app.supabase_client import supabase
-
-
-def get_current_user(authorization: str = Header(default=None)):
+from app.shared.calls import call
+from app.shared.metrics import timed
+from app.shared.tokens import decode_token, needs_jwks
+from app.supabase_client import (
+    PostgrestClient,
+    async_supabase,
+    create_async_postgrest_client,
+    create_postgrest_client,
+    supabase,
+)
+
+
+def get_supabase():
+    """The shared (anon-key) Supabase client for the configured client mode."""
+    if settings.supabase_client_mode == "async":
+        return async_supabase
+    return supabase
+
+
+async def get_current_user(authorization: str = Header(default=None)):
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Missing or invalid token")
 
     token = authorization.removeprefix("Bearer ")
 
+    if settings.auth_verification == "local":
+        try:
+            with timed("auth"):
+                if needs_jwks(token):
+                    # A JWKS cache miss fetches over HTTP; keep it off the event loop.
+                    claims = await run_in_threadpool(decode_token, token)
+                else:
+                    claims = decode_token(token)
+        except jwt.PyJWTError as e:
+            raise HTTPException(status_code=401, detail=str(e))
+
+        return {"id": claims["sub"], "email": claims.get("email"), "token": token}
+
     try:
-        response = supabase.auth.get_user(token)
+        with timed("auth"):
+            response = await call(
+                get_supabase().auth.get_user, token, upstream="auth", idempotent=True
+            )
     except AuthApiError as e:
         raise HTTPException(status_code=401, detail=str(e))
 
     return {"id": response.user.id, "email": response.user.email, "token": token}
 
 
-def get_authenticated_client(user: dict = Depends(get_current_user)) -> Client:
-    return create_client(
-        settings.supabase_url,
-        settings.supabase_key,
-        options=ClientOptions(headers={"Authorization": f"Bearer {user['token']}"}),
-    )
+async def get_authenticated_client(
+    user: dict = Depends(get_current_user),
+) -> PostgrestClient:
+    with timed("client"):
+        if settings.supabase_client_mode == "async":
+            return create_async_postgrest_client(user["token"])
+        return create_postgrest_client(user["token"])
@@ -0,0 +1,41 @@
+import hashlib
+from typing import Iterable, Optional
+
+
+def weak_etag(opaque: str) -> str:
+    return f'W/"{opaque}"'
+
+
+def digest_etag(parts: Iterable[str]) -> str:
+    """Weak ETag over an ordered sequence of version strings."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return weak_etag(digest.hexdigest())
+
+
+def parse_etags(header: Optional[str]) -> Optional[list[str]]:
+    """Opaque tags from an If-Match/If-None-Match header.
+
+    Returns None when the header is absent and ``["*"]`` for the wildcard.
+    Weak and strong tags compare the same way (RFC 9110 weak comparison).
+    """
+    if not header:
+        return None
+    tags = []
+    for part in header.split(","):
+        part = part.strip()
+        if part == "*":
+            return ["*"]
+        part = part.removeprefix("W/")
+        if len(part) >= 2 and part.startswith('"') and part.endswith('"'):
+            tags.append(part[1:-1])
+    return tags
+
+
+def matches(header: Optional[str], etag: str) -> bool:
+    tags = parse_etags(header)
+    if tags is None:
+        return False
+    return "*" in tags or etag.removeprefix("W/").strip('"') in tags
@@ -0,0 +1,317 @@
+"""Per-request stage timing and a Prometheus text-format registry.
+
+:class:`TimingMiddleware` opens a :class:`Timings` for each HTTP request;
+code on the request path wraps work in :func:`timed` to attribute time to a
+stage (``auth``, ``client``, ``supabase``, ``serialize``). When the response
+starts the stages are sent as a ``Server-Timing`` header, and when it ends
+they are folded into the histograms and counters rendered by
+:func:`render`.
+
+Recording is a few dict lookups and a bisect per stage.
+"""
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.shared.admission import admission
+from app.shared.broadcast import broadcaster
+from app.shared.cache import cache
+from app.shared.resilience import CLOSED, HALF_OPEN, OPEN, breakers
+from app.shared.singleflight import flights
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = (f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in self._values.items():
+            yield f"{self.name}{_labels(self.labels, labels)} {value}"
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        # Per label set: [count per bucket (+Inf last), sum].
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = series
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        names = self.labels + ("le",)
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f"{self.name}_bucket{_labels(names, labels + (repr(bound),))} {cumulative}"
+            cumulative += counts[-1]
+            yield f"{self.name}_bucket{_labels(names, labels + ('+Inf',))} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labels, labels)} {total[0]}"
+            yield f"{self.name}_count{_labels(self.labels, labels)} {cumulative}"
+
+
+REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route and status.", ("method", "route", "status")
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Time to serve a request, body included.", ("method", "route")
+)
+STAGE_DURATION = Histogram(
+    "http_request_stage_duration_seconds",
+    "Time spent in each stage of a request.",
+    ("route", "stage"),
+)
+SUPABASE_CALLS = Counter(
+    "supabase_calls_total", "Supabase API calls by route and status.", ("route", "status")
+)
+
+SUPABASE_CALL_DURATION = Histogram(
+    "supabase_call_duration_seconds",
+    "Latency of each Supabase call attempt by outcome (ok, error, failure, timeout).",
+    ("upstream", "outcome"),
+)
+SUPABASE_RETRIES = Counter(
+    "supabase_retries_total", "Supabase reads retried after a failure.", ("upstream",)
+)
+SUPABASE_REJECTIONS = Counter(
+    "supabase_circuit_rejections_total",
+    "Supabase calls refused by an open circuit breaker.",
+    ("upstream",),
+)
+
+_registry: list = [
+    REQUESTS,
+    REQUEST_DURATION,
+    STAGE_DURATION,
+    SUPABASE_CALLS,
+    SUPABASE_CALL_DURATION,
+    SUPABASE_RETRIES,
+    SUPABASE_REJECTIONS,
+]
+
+
+class Timings:
+    """Stage durations (seconds) and Supabase call count for one request."""
+
+    __slots__ = ("stages", "supabase_calls", "active")
+
+    def __init__(self):
+        self.stages: dict[str, float] = {}
+        self.supabase_calls = 0
+        self.active = False
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def header(self, total: float) -> str:
+        entries = [f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in self.stages.items()]
+        entries.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[Optional[Timings]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """Attribute the time spent in the block to ``stage`` of the current request.
+
+    Stages don't nest: inside another stage the block counts toward the outer
+    one, so the remote ``get_user`` call is ``auth`` time, not ``supabase``.
+    """
+    timings = _current.get()
+    if timings is None or timings.active:
+        yield
+        return
+    timings.active = True
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(stage, time.perf_counter() - start)
+        timings.active = False
+
+
+def count_supabase_call() -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.supabase_calls += 1
+
+
+def _route(scope: Scope) -> str:
+    """The matched route's template, e.g. ``/projects/{project_id}``.
+
+    Labels use templates rather than raw paths to keep cardinality bounded.
+    Built from the path and its parameters because a route included from a
+    router only knows its path relative to the router's prefix.
+    """
+    if scope.get("route") is None:
+        return "unmatched"
+    names = {str(value): name for name, value in scope.get("path_params", {}).items()}
+    segments = scope["path"].split("/")
+    return "/".join(f"{{{names[part]}}}" if part in names else part for part in segments)
+
+
+class TimingMiddleware:
+    """Time every HTTP request and publish its stages (see module docstring)."""
+
+    def __init__(self, app: ASGIApp, clock: Callable[[], float] = time.perf_counter):
+        self.app = app
+        self.clock = clock
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = Timings()
+        token = _current.set(timings)
+        start = self.clock()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                header = timings.header(self.clock() - start).encode("latin-1")
+                message["headers"] = [*message.get("headers", ()), (b"server-timing", header)]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            route = _route(scope)
+            REQUESTS.inc(scope["method"], route, str(status))
+            REQUEST_DURATION.observe(self.clock() - start, scope["method"], route)
+            for stage, seconds in timings.stages.items():
+                STAGE_DURATION.observe(seconds, route, stage)
+            if timings.supabase_calls:
+                SUPABASE_CALLS.inc(route, str(status), amount=timings.supabase_calls)
+
+
+def _cache_lines() -> Iterator[str]:
+    stats = cache.stats()
+    for name, value in stats.items():
+        kind = "gauge" if name in ("entries", "bytes") else "counter"
+        metric = f"cache_{name}" if kind == "gauge" else f"cache_{name}_total"
+        yield f"# TYPE {metric} {kind}"
+        yield f"{metric} {value}"
+
+
+def _singleflight_lines() -> Iterator[str]:
+    stats = flights.stats()
+    yield "# HELP singleflight_calls_total Loads started for cache misses."
+    yield "# TYPE singleflight_calls_total counter"
+    yield f"singleflight_calls_total {stats['calls']}"
+    yield "# HELP singleflight_coalesced_total Reads that joined a load already in flight."
+    yield "# TYPE singleflight_coalesced_total counter"
+    yield f"singleflight_coalesced_total {stats['coalesced']}"
+    yield "# TYPE singleflight_in_flight gauge"
+    yield f"singleflight_in_flight {stats['in_flight']}"
+
+
+_BREAKER_STATES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+def _breaker_lines() -> Iterator[str]:
+    stats = breakers.stats()
+    labels = {upstream: _labels(("upstream",), (upstream,)) for upstream in stats}
+    yield "# HELP supabase_circuit_state Circuit breaker state: 0 closed, 1 half-open, 2 open."
+    yield "# TYPE supabase_circuit_state gauge"
+    for upstream, breaker in stats.items():
+        yield f"supabase_circuit_state{labels[upstream]} {_BREAKER_STATES[breaker['state']]}"
+    yield "# HELP supabase_circuit_opened_total Times each circuit breaker opened."
+    yield "# TYPE supabase_circuit_opened_total counter"
+    for upstream, breaker in stats.items():
+        yield f"supabase_circuit_opened_total{labels[upstream]} {breaker['opened']}"
+
+
+def _admission_lines() -> Iterator[str]:
+    stats = admission.stats()
+    for name, help in (
+        ("active", "Requests being served, per admission pool."),
+        ("queued", "Requests waiting for a slot, per admission pool."),
+    ):
+        yield f"# HELP admission_{name} {help}"
+        yield f"# TYPE admission_{name} gauge"
+        for pool, values in stats["pools"].items():
+            yield f"admission_{name}{_labels(('pool',), (pool,))} {values[name]}"
+    yield "# HELP admission_shed_total Requests rejected by admission control, by reason."
+    yield "# TYPE admission_shed_total counter"
+    for labels, count in stats["shed"].items():
+        yield f"admission_shed_total{_labels(('pool', 'reason'), labels)} {count}"
+
+
+def _stream_lines() -> Iterator[str]:
+    stats = broadcaster.stats()
+    yield "# HELP stream_subscribers Open live-update streams."
+    yield "# TYPE stream_subscribers gauge"
+    yield f"stream_subscribers {stats['subscribers']}"
+    yield "# HELP stream_events_published_total Change events received for fan-out."
+    yield "# TYPE stream_events_published_total counter"
+    yield f"stream_events_published_total {stats['published']}"
+    yield "# HELP stream_events_dropped_total Events dropped for subscribers that fell behind."
+    yield "# TYPE stream_events_dropped_total counter"
+    yield f"stream_events_dropped_total {stats['dropped']}"
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    lines = [line for metric in _registry for line in metric.render()]
+    lines.extend(_cache_lines())
+    lines.extend(_singleflight_lines())
+    lines.extend(_breaker_lines())
+    lines.extend(_admission_lines())
+    lines.extend(_stream_lines())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,96 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException
+
+
+def encode_cursor(
+    column: str, value: Any, row_id: str, started_at: Optional[str] = None
+) -> str:
+    """Opaque cursor pointing just past the row with this sort value and id.
+
+    Cursors that expire also carry when their pagination run started; see
+    :func:`cursor_started_at`.
+    """
+    fields = [column, value, row_id]
+    if started_at is not None:
+        fields.append(started_at)
+    raw = json.dumps(fields, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _cursor_fields(cursor: str) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        fields = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        fields = None
+    if not isinstance(fields, list) or len(fields) not in (3, 4):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return fields
+
+
+def decode_cursor(cursor: str, column: str) -> tuple[Any, str]:
+    cursor_column, value, row_id = _cursor_fields(cursor)[:3]
+    if cursor_column != column:
+        raise HTTPException(status_code=400, detail="Cursor does not match sort order")
+    return value, str(row_id)
+
+
+def cursor_started_at(cursor: str) -> Optional[Any]:
+    fields = _cursor_fields(cursor)
+    return fields[3] if len(fields) == 4 else None
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """A timezone-aware ISO 8601 timestamp taken from a cursor, or 400."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        parsed = None
+    if parsed is None or parsed.tzinfo is None:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return parsed
+
+
+def _quote(value: Any) -> str:
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def keyset_filter(column: str, value: Any, row_id: str, descending: bool) -> str:
+    """PostgREST ``or`` filter selecting rows after ``(value, row_id)``.
+
+    Mirrors ``ORDER BY column, id`` in the given direction, so it pairs with
+    an index on ``(user_id, column, id)``.
+    """
+    op = "lt" if descending else "gt"
+    v, i = _quote(value), _quote(row_id)
+    return f"{column}.{op}.{v},and({column}.eq.{v},id.{op}.{i})"
+
+
+def paginate(query, column: str, descending: bool, limit: int, cursor: Optional[str]):
+    """Apply keyset ordering to a select query, fetching one extra row.
+
+    The extra row only tells :func:`next_cursor` whether another page exists.
+    """
+    if cursor:
+        value, row_id = decode_cursor(cursor, column)
+        query = query.or_(keyset_filter(column, value, row_id, descending))
+    return (
+        query.order(column, desc=descending)
+        .order("id", desc=descending)
+        .limit(limit + 1)
+    )
+
+
+def next_cursor(rows: list[dict], column: str, limit: int) -> Optional[str]:
+    """Trim the look-ahead row from ``rows`` and return the next page's cursor."""
+    if len(rows) <= limit:
+        return None
+    del rows[limit:]
+    last = rows[-1]
+    return encode_cursor(column, last[column], last["id"])
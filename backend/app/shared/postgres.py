@@ -0,0 +1,85 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from app.config import settings
+
+try:
+    import asyncpg
+except ImportError:  # optional: pip install ".[postgres]"
+    asyncpg = None
+
+_pool: Optional["asyncpg.Pool"] = None
+_pool_lock = asyncio.Lock()
+
+
+async def _init_connection(conn: "asyncpg.Connection") -> None:
+    # Decode json/jsonb to Python values, as PostgREST's JSON would.
+    for name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            name, encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+        )
+
+
+def _require_asyncpg(feature: str) -> None:
+    if asyncpg is None:
+        raise RuntimeError(f'{feature} needs asyncpg: pip install ".[postgres]"')
+
+
+async def open_pool() -> "asyncpg.Pool":
+    """Create the process-wide asyncpg pool (normally from the app lifespan).
+
+    ``DATABASE_URL`` should log in as a role that may ``SET ROLE
+    authenticated`` (Supabase's ``authenticator``, or ``postgres`` locally).
+    Behind a transaction-mode pooler set ``DATABASE_STATEMENT_CACHE_SIZE=0``.
+    """
+    global _pool
+    _require_asyncpg("PROJECT_STORAGE=postgres")
+    async with _pool_lock:
+        if _pool is None:
+            _pool = await asyncpg.create_pool(
+                settings.database_url,
+                min_size=settings.database_pool_min_size,
+                max_size=settings.database_pool_max_size,
+                statement_cache_size=settings.database_statement_cache_size,
+                init=_init_connection,
+            )
+    return _pool
+
+
+async def connect() -> "asyncpg.Connection":
+    """A dedicated connection outside the pool, for long-lived ``LISTEN``.
+
+    Notifications need a session, so ``DATABASE_URL`` must not point at a
+    transaction-mode pooler for this.
+    """
+    _require_asyncpg("PROJECT_STREAM_ENABLED")
+    return await asyncpg.connect(settings.database_url)
+
+
+async def close_pool() -> None:
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+@asynccontextmanager
+async def user_transaction(user: dict) -> AsyncIterator["asyncpg.Connection"]:
+    """A transaction running as ``user`` under the same RLS policies as PostgREST.
+
+    Mirrors what PostgREST does per request: the role and JWT claims are set
+    transaction-locally (``SET LOCAL`` via ``set_config(..., true)``), so
+    ``auth.uid()`` resolves and nothing leaks to the next borrower of the
+    connection.
+    """
+    claims = json.dumps({"sub": user["id"], "email": user.get("email"), "role": "authenticated"})
+    pool = _pool or await open_pool()
+    async with pool.acquire() as conn, conn.transaction():
+        await conn.execute(
+            "SELECT set_config('role', 'authenticated', true),"
+            " set_config('request.jwt.claims', $1, true)",
+            claims,
+        )
+        yield conn
@@ -0,0 +1,135 @@
+"""Circuit breakers and per-request time budgets for outbound Supabase calls.
+
+:class:`RequestBudgetMiddleware` gives every HTTP request a deadline;
+:func:`budget` starts a fresh one for work that outlives a normal request,
+such as each page of a streamed export. :func:`remaining` tells
+:func:`app.shared.calls.call` how much of the budget is left, so each
+attempt's timeout is the smaller of the per-call timeout and the rest of
+it. One :class:`CircuitBreaker` per upstream (``auth``, ``rest``) stops
+calls for a while once the upstream keeps failing, so requests fail fast
+instead of queueing behind a dead dependency.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a single probe per reset window.
+
+    After ``failure_threshold`` failures in a row the breaker opens and
+    :meth:`allow` refuses calls. Once ``reset_seconds`` have passed it lets
+    one probe through (half-open): success closes it, failure re-opens it.
+    A probe that never reports back (e.g. cancelled) just re-arms the
+    window, so the breaker cannot get stuck half-open.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        if self.state == CLOSED:
+            return True
+        if self.clock() - self._opened_at < self.reset_seconds:
+            return False
+        self.state = HALF_OPEN
+        self._opened_at = self.clock()
+        return True
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)."""
+        if self.state == CLOSED:
+            return 0.0
+        return max(0.0, self.reset_seconds - (self.clock() - self._opened_at))
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.opened += 1
+            self.state = OPEN
+            self._opened_at = self.clock()
+
+
+class Breakers:
+    """One breaker per upstream, created on first use from settings."""
+
+    def __init__(self):
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, upstream: str) -> CircuitBreaker:
+        breaker = self._breakers.get(upstream)
+        if breaker is None:
+            breaker = self._breakers[upstream] = CircuitBreaker(
+                settings.circuit_breaker_failure_threshold,
+                settings.circuit_breaker_reset_seconds,
+            )
+        return breaker
+
+    def stats(self) -> dict[str, dict]:
+        return {
+            upstream: {"state": breaker.state, "opened": breaker.opened}
+            for upstream, breaker in self._breakers.items()
+        }
+
+    def reset(self) -> None:
+        self._breakers.clear()
+
+
+breakers = Breakers()
+
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current request's budget, or None outside a request."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@contextmanager
+def budget() -> Iterator[None]:
+    """Give the calls in this block ``REQUEST_BUDGET_SECONDS`` of their own."""
+    token = _deadline.set(time.monotonic() + settings.request_budget_seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+class RequestBudgetMiddleware:
+    """Give each HTTP request ``REQUEST_BUDGET_SECONDS`` for its upstream calls."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with budget():
+            await self.app(scope, receive, send)
@@ -0,0 +1,61 @@
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+from app.config import settings
+from app.shared.metrics import timed
+
+try:
+    import orjson
+except ImportError:  # optional: pip install ".[fast]"
+    orjson = None
+
+
+@lru_cache(maxsize=256)
+def _adapter(model: type[BaseModel], many: bool) -> TypeAdapter:
+    return TypeAdapter(list[model] if many else model)
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return to_json(data)
+
+
+def _trim(data: Any, model: type[BaseModel]) -> Any:
+    """Keep only ``model``'s top-level keys, leaving values as PostgREST sent them."""
+    fields = model.model_fields
+    if isinstance(data, list):
+        return [{name: row[name] for name in fields if name in row} for row in data]
+    return {name: data[name] for name in fields if name in data}
+
+
+def model_response(
+    data: Any,
+    model: type[BaseModel],
+    *,
+    status_code: int = 200,
+    headers: Optional[dict] = None,
+) -> Response:
+    """Validate ``data`` against ``model`` once and emit it as JSON bytes.
+
+    Used where the response model is chosen per request, so FastAPI's
+    static ``response_model`` handling can't apply. With
+    ``trusted_serialization`` on, rows read back from our own queries skip
+    validation: they are trimmed to the model's fields and encoded as-is.
+    """
+    with timed("serialize"):
+        if settings.trusted_serialization:
+            content = _dumps(_trim(data, model))
+        else:
+            adapter = _adapter(model, isinstance(data, list))
+            content = adapter.dump_json(adapter.validate_python(data))
+    return Response(
+        content,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
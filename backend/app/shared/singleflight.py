@@ -0,0 +1,63 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one in-flight load between concurrent callers with the same key.
+
+    The first caller starts ``load`` in its own task; callers that arrive
+    while it runs await the same task, so they get its result or its
+    exception. Nothing is kept once the task finishes, so errors are never
+    reused. A cancelled caller only stops waiting. The load itself is
+    cancelled only when every caller has gone.
+
+    Keys are ``(namespace, key)`` as in :mod:`app.shared.cache`, and
+    :meth:`forget` detaches a namespace's in-flight loads after a write. Later
+    callers then start a fresh load instead of joining one that may have read
+    the data before the write.
+    """
+
+    def __init__(self):
+        self._flights: dict[tuple[str, str], _Flight] = {}
+        self._counters = dict.fromkeys(("calls", "coalesced"), 0)
+
+    async def do(self, namespace: str, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        flight_key = (namespace, key)
+        flight = self._flights.get(flight_key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(load()))
+            self._flights[flight_key] = flight
+            flight.task.add_done_callback(lambda _: self._discard(flight_key, flight))
+            self._counters["calls"] += 1
+        else:
+            self._counters["coalesced"] += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel()
+
+    def forget(self, namespace: str) -> None:
+        for flight_key in [k for k in self._flights if k[0] == namespace]:
+            del self._flights[flight_key]
+
+    def stats(self) -> dict[str, int]:
+        return {**self._counters, "in_flight": len(self._flights)}
+
+    def _discard(self, flight_key: tuple[str, str], flight: _Flight) -> None:
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
+
+
+flights = SingleFlight()
@@ -0,0 +1,49 @@
+from functools import lru_cache
+
+import jwt
+
+from app.config import settings
+
+_ASYMMETRIC_ALGORITHMS = ["RS256", "ES256"]
+
+
+@lru_cache
+def _get_jwks_client() -> jwt.PyJWKClient:
+    return jwt.PyJWKClient(
+        f"{settings.supabase_url}/auth/v1/.well-known/jwks.json",
+        cache_keys=True,
+        lifespan=settings.jwks_cache_seconds,
+    )
+
+
+def needs_jwks(token: str) -> bool:
+    """Whether verifying ``token`` may fetch the JWKS, a blocking HTTP call."""
+    return jwt.get_unverified_header(token).get("alg") in _ASYMMETRIC_ALGORITHMS
+
+
+def decode_token(token: str) -> dict:
+    """Verify a Supabase access token locally and return its claims.
+
+    HS256 tokens are checked against the project's JWT secret; asymmetric
+    tokens are checked against the project's JWKS, which is cached.
+    """
+    algorithm = jwt.get_unverified_header(token).get("alg")
+
+    if algorithm == "HS256":
+        if not settings.supabase_jwt_secret:
+            raise jwt.InvalidTokenError("HS256 token but no JWT secret configured")
+        key = settings.supabase_jwt_secret
+        algorithms = ["HS256"]
+    elif algorithm in _ASYMMETRIC_ALGORITHMS:
+        key = _get_jwks_client().get_signing_key_from_jwt(token).key
+        algorithms = _ASYMMETRIC_ALGORITHMS
+    else:
+        raise jwt.InvalidAlgorithmError(f"Unsupported token algorithm: {algorithm}")
+
+    return jwt.decode(
+        token,
+        key,
+        algorithms=algorithms,
+        audience="authenticated",
+        options={"require": ["sub", "exp"]},
+    )
@@ -1,20 +1,158 @@
+import threading
 from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
-from supabase import Client, create_client
+import httpx
+from postgrest import AsyncPostgrestClient, SyncPostgrestClient
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_HEADERS
 
 from app.config import settings
 
+if TYPE_CHECKING:
+    # The supabase package pulls in realtime and storage3 too; it is imported
+    # when the first full client is built (normally by the app lifespan).
+    from supabase import AsyncClient, Client, ClientOptions
+
+PostgrestClient = Union[SyncPostgrestClient, AsyncPostgrestClient]
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+_async_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _http_client_kwargs() -> dict:
+    return {
+        "http2": True,
+        "follow_redirects": True,
+        "timeout": settings.http_timeout_seconds,
+        "limits": httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+        ),
+    }
+
+
+def get_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client shared by every Supabase sub-client.
+
+    Normally opened by the app lifespan; created on first use otherwise so
+    scripts and tests that skip the lifespan still get a pooled transport.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.Client(**_http_client_kwargs())
+        return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Async counterpart of :func:`get_http_client`, used in async client mode."""
+    global _async_http_client
+    if _async_http_client is None or _async_http_client.is_closed:
+        _async_http_client = httpx.AsyncClient(**_http_client_kwargs())
+    return _async_http_client
+
+
+def close_http_client() -> None:
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+    _get_client.cache_clear()
+    get_user_client.cache_clear()
+
+
+async def close_async_http_client() -> None:
+    global _async_http_client
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+    _get_async_client.cache_clear()
+
+
+def _client_options(headers: Optional[dict] = None) -> "ClientOptions":
+    from supabase import ClientOptions
+
+    options = ClientOptions(httpx_client=get_http_client())
+    if headers:
+        options.headers = {**options.headers, **headers}
+    return options
+
 
 @lru_cache
-def _get_client() -> Client:
-    return create_client(settings.supabase_url, settings.supabase_key)
+def _get_client() -> "Client":
+    from supabase import create_client
+
+    return create_client(settings.supabase_url, settings.supabase_key, _client_options())
+
+
+@lru_cache
+def _get_async_client() -> "AsyncClient":
+    from supabase import AsyncClient, AsyncClientOptions
+
+    return AsyncClient(
+        settings.supabase_url,
+        settings.supabase_key,
+        AsyncClientOptions(httpx_client=get_async_http_client()),
+    )
 
 
 class _LazyClient:
     """Proxy that defers Supabase client creation until first attribute access."""
 
+    def __init__(self, factory: Callable[[], object]):
+        self._factory = factory
+
     def __getattr__(self, name: str):
-        return getattr(_get_client(), name)
+        return getattr(self._factory(), name)
+
+
+supabase: "Client" = _LazyClient(_get_client)  # type: ignore[assignment]
+async_supabase: "AsyncClient" = _LazyClient(_get_async_client)  # type: ignore[assignment]
+
+
+def _postgrest_headers(token: str) -> dict:
+    return {
+        **DEFAULT_POSTGREST_CLIENT_HEADERS,
+        "apikey": settings.supabase_key,
+        "Authorization": f"Bearer {token}",
+    }
+
+
+def create_postgrest_client(token: str) -> SyncPostgrestClient:
+    """Build a PostgREST client that acts as the given user.
+
+    Construction only allocates a header map; requests go out over the
+    shared connection pool from :func:`get_http_client`.
+    """
+    return SyncPostgrestClient(
+        f"{settings.supabase_url}/rest/v1",
+        headers=_postgrest_headers(token),
+        http_client=get_http_client(),
+    )
+
+
+def create_async_postgrest_client(token: str) -> AsyncPostgrestClient:
+    """Async counterpart of :func:`create_postgrest_client`."""
+    return AsyncPostgrestClient(
+        f"{settings.supabase_url}/rest/v1",
+        headers=_postgrest_headers(token),
+        http_client=get_async_http_client(),
+    )
+
+
+@lru_cache(maxsize=settings.user_client_cache_size)
+def get_user_client(token: str) -> "Client":
+    """Full Supabase client (storage, functions, ...) for one user's token.
 
+    Bounded LRU so repeat requests with the same token reuse the client;
+    every cached client shares the pooled HTTP transport.
+    """
+    from supabase import create_client
 
-supabase: Client = _LazyClient()  # type: ignore[assignment]
+    return create_client(
+        settings.supabase_url,
+        settings.supabase_key,
+        _client_options({"Authorization": f"Bearer {token}"}),
+    )
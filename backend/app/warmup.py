@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.shared.postgres import open_pool
+from app.shared.tokens import _get_jwks_client
+from app.supabase_client import (
+    _get_async_client,
+    _get_client,
+    get_async_http_client,
+    get_http_client,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """Outcome of the last warm-up: per-step status and duration."""
+
+    def __init__(self):
+        self.ready = False
+        self.checks: dict[str, dict] = {}
+        self.lock = asyncio.Lock()
+
+
+state = Readiness()
+
+
+def _health_url() -> str:
+    return f"{settings.supabase_url}/auth/v1/health"
+
+
+async def _build_clients() -> None:
+    if settings.supabase_client_mode == "async":
+        get_async_http_client()
+        # Constructing the client is CPU-bound (and imports supabase).
+        await run_in_threadpool(_get_async_client)
+    else:
+        get_http_client()
+        await run_in_threadpool(_get_client)
+
+
+async def _open_connections() -> None:
+    # Concurrent requests make the pool open several HTTP/1.1 connections
+    # (or one multiplexed HTTP/2 connection) before real traffic arrives.
+    headers = {"apikey": settings.supabase_key}
+    count = settings.warmup_connections
+    if settings.supabase_client_mode == "async":
+        client = get_async_http_client()
+        responses = await asyncio.gather(
+            *(client.get(_health_url(), headers=headers) for _ in range(count))
+        )
+    else:
+        client = get_http_client()
+        responses = await asyncio.gather(
+            *(run_in_threadpool(client.get, _health_url(), headers=headers) for _ in range(count))
+        )
+    for response in responses:
+        response.raise_for_status()
+
+
+async def _prefetch_jwks() -> None:
+    await run_in_threadpool(_get_jwks_client().fetch_data)
+
+
+async def _open_database_pool() -> None:
+    pool = await open_pool()
+    await pool.fetchval("SELECT 1")
+
+
+def _steps() -> dict[str, Callable[[], Awaitable[None]]]:
+    steps = {"clients": _build_clients, "connections": _open_connections}
+    if settings.project_storage == "postgres":
+        steps["database"] = _open_database_pool
+    if settings.auth_verification == "local" and settings.jwks_prefetch:
+        steps["jwks"] = _prefetch_jwks
+    return steps
+
+
+async def warm_up() -> bool:
+    """Build the shared clients, fill the connection pools and prefetch JWKS.
+
+    Failures are recorded rather than raised so the worker still starts and
+    answers ``/health``; ``/ready`` reports not-ready and retries instead.
+    """
+    async with state.lock:
+        if state.ready:
+            return True
+
+        checks = {}
+        for name, step in _steps().items():
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(step(), settings.warmup_timeout_seconds)
+                status = "ok"
+            except Exception as e:
+                logger.warning("Warm-up step %s failed: %r", name, e)
+                status = f"error: {e!r}"
+            checks[name] = {
+                "status": status,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+            }
+
+        state.checks = checks
+        state.ready = all(check["status"] == "ok" for check in checks.values())
+        logger.info("Warm-up finished (ready=%s): %s", state.ready, checks)
+        return state.ready
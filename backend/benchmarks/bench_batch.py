@@ -0,0 +1,125 @@
+"""1,000 single POST /projects calls vs one POST /projects/batch call.
+
+Runs the app in-process with local JWT verification and a stand-in
+PostgREST client that sleeps ``--latency-ms`` per statement, so the
+numbers reflect per-request overhead plus backend round trips:
+
+    python -m benchmarks.bench_batch --items 1000 --latency-ms 2
+"""
+
+import argparse
+import json
+import time
+import uuid
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import jwt
+from fastapi.testclient import TestClient
+
+import app.shared.dependencies as dependencies_module
+from app.config import settings
+from app.main import app
+
+USER_ID = str(uuid.uuid4())
+JWT_SECRET = "benchmark-jwt-secret-with-at-least-32-bytes"
+
+
+class _FakeQuery:
+    def __init__(self, rows: list[dict], latency: float, counter: list):
+        self.rows = rows
+        self.latency = latency
+        self.counter = counter
+        self.request = SimpleNamespace(http_method="POST")
+
+    def select(self, *columns):
+        return self
+
+    def retry(self, enabled: bool):
+        return self
+
+    def execute(self):
+        self.counter[0] += 1
+        time.sleep(self.latency)
+        return SimpleNamespace(data=self.rows, count=len(self.rows))
+
+
+class _FakePostgrest:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.statements = [0]
+
+    def table(self, name: str):
+        return self
+
+    def insert(self, data):
+        rows = self._created(data if isinstance(data, list) else [data])
+        return _FakeQuery(rows, self.latency, self.statements)
+
+    def rpc(self, name: str, params: dict):
+        if name != "create_projects":
+            raise NotImplementedError(f"No fake for RPC {name!r}")
+        rows = self._created(
+            {
+                **row,
+                "materials": [{**item, "id": str(uuid.uuid4())} for item in row["materials"]],
+            }
+            for row in params["new_projects"]
+        )
+        return _FakeQuery(rows, self.latency, self.statements)
+
+    def _created(self, rows) -> list[dict]:
+        now = "2026-01-01T00:00:00+00:00"
+        return [
+            {**row, "id": str(uuid.uuid4()), "created_at": now, "updated_at": now}
+            for row in rows
+        ]
+
+
+def _run(client: TestClient, fake: _FakePostgrest, headers: dict, items: int) -> dict:
+    payloads = [{"title": f"Project {i}", "materials": [{"name": "Screws"}]} for i in range(items)]
+
+    fake.statements[0] = 0
+    start = time.perf_counter()
+    for payload in payloads:
+        assert client.post("/projects", json=payload, headers=headers).status_code == 200
+    single = {"seconds": time.perf_counter() - start, "statements": fake.statements[0]}
+
+    fake.statements[0] = 0
+    start = time.perf_counter()
+    resp = client.post("/projects/batch", json=payloads, headers=headers)
+    assert resp.status_code == 200
+    batch = {"seconds": time.perf_counter() - start, "statements": fake.statements[0]}
+
+    return {
+        "single_calls": {**single, "seconds": round(single["seconds"], 3)},
+        "batch_call": {**batch, "seconds": round(batch["seconds"], 3)},
+        "speedup": round(single["seconds"] / batch["seconds"], 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    settings.auth_verification = "local"
+    settings.supabase_jwt_secret = JWT_SECRET
+    settings.projects_batch_max_items = max(settings.projects_batch_max_items, args.items)
+    token = jwt.encode(
+        {"sub": USER_ID, "aud": "authenticated", "exp": int(time.time()) + 3600},
+        JWT_SECRET,
+        algorithm="HS256",
+    )
+
+    fake = _FakePostgrest(args.latency_ms / 1000)
+    with patch.object(dependencies_module, "create_postgrest_client", return_value=fake):
+        with TestClient(app) as client:
+            results = _run(client, fake, {"Authorization": f"Bearer {token}"}, args.items)
+
+    print(json.dumps({"items": args.items, "latency_ms": args.latency_ms, **results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
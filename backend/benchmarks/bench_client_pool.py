@@ -0,0 +1,99 @@
+"""Per-request Supabase client construction: fresh Client vs pooled transport.
+
+Starts a throwaway HTTP/1.1 server that answers PostgREST-style requests,
+then compares the old dependency (``create_client`` per request) with the
+pooled one (``create_postgrest_client`` over the shared ``httpx.Client``):
+
+    python -m benchmarks.bench_client_pool --requests 500
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from supabase import ClientOptions, create_client
+
+import app.supabase_client as supabase_client_module
+from app.config import settings
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with _Handler.lock:
+            _Handler.connections += 1
+
+    def do_GET(self):
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _per_request_client(token: str):
+    return create_client(
+        settings.supabase_url,
+        settings.supabase_key,
+        options=ClientOptions(headers={"Authorization": f"Bearer {token}"}),
+    )
+
+
+def _measure(build, requests: int) -> dict:
+    _Handler.connections = 0
+
+    start = time.perf_counter()
+    for i in range(requests):
+        build(f"token-{i % 10}")
+    construct = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(requests):
+        build(f"token-{i % 10}").table("projects").select("*").execute()
+    total = time.perf_counter() - start
+
+    return {
+        "construct_us": round(construct / requests * 1e6, 1),
+        "request_us": round(total / requests * 1e6, 1),
+        "connections_opened": _Handler.connections,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    settings.supabase_url = f"http://127.0.0.1:{server.server_address[1]}"
+    settings.supabase_key = "anon-key"
+
+    try:
+        results = {
+            "per_request_create_client": _measure(_per_request_client, args.requests),
+            "pooled_postgrest_client": _measure(
+                supabase_client_module.create_postgrest_client, args.requests
+            ),
+        }
+    finally:
+        supabase_client_module.close_http_client()
+        server.shutdown()
+
+    print(json.dumps({"requests": args.requests, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
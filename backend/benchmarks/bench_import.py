@@ -0,0 +1,70 @@
+"""Worker boot cost: how long ``import app.main`` takes and what dominates it.
+
+Runs ``python -X importtime -c "import app.main"`` in fresh interpreters,
+keeps the fastest run per module (the least noisy estimate), and prints the
+total plus the modules with the largest cumulative import time. With
+``--budget-ms`` it exits non-zero when the total is over budget, so it can
+guard boot time in CI:
+
+    python -m benchmarks.bench_import --runs 5 --top 15 --budget-ms 1500
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+TARGET = "app.main"
+
+
+def _profile() -> dict[str, tuple[int, int, int]]:
+    """One fresh-interpreter import: module -> (self_us, cumulative_us, depth)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue  # header row
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, help="fail when the total exceeds this")
+    args = parser.parse_args()
+
+    best: dict[str, tuple[int, int, int]] = {}
+    for _ in range(args.runs):
+        for name, timing in _profile().items():
+            if name not in best or timing[1] < best[name][1]:
+                best[name] = timing
+
+    total_ms = best[TARGET][1] / 1000
+    print(f"import {TARGET}: {total_ms:.0f} ms (best of {args.runs})\n")
+    print(f"{'cumulative':>12} {'self':>9}  module")
+    ranked = sorted(best.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us, depth) in ranked[: args.top]:
+        print(f"{cumulative_us / 1000:>9.1f} ms {self_us / 1000:>6.1f} ms  {'  ' * depth}{name}")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"\nOver budget: {total_ms:.0f} ms > {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""End-to-end load benchmark: the app under uvicorn against a fake Supabase.
+
+Starts :class:`benchmarks.fake_supabase.FakeSupabase` with injected
+latency, runs the app in a uvicorn subprocess pointed at it, then drives a
+weighted mix of login/list/get/create/update/delete at each concurrency
+level and reports p50/p95/p99 latency and requests per second per
+endpoint. Results are JSON, so runs can be stored as baselines and diffed:
+
+    python -m benchmarks.bench_load --concurrency 1 10 50 --output before.json
+    python -m benchmarks.bench_load --concurrency 1 10 50 --compare before.json
+    python -m benchmarks.bench_load --diff before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import httpx
+
+from benchmarks.fake_supabase import FakeSupabase
+
+JWT_SECRET = "benchmark-jwt-secret-with-at-least-32-bytes"
+PASSWORD = "benchmark-password"
+
+MIX = {
+    "login": 5,
+    "list": 35,
+    "get": 30,
+    "create": 10,
+    "update": 15,
+    "delete": 5,
+}
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_app(port: int, supabase_url: str, args) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "SUPABASE_URL": supabase_url,
+        "SUPABASE_KEY": "anon-key",
+        "SUPABASE_JWT_SECRET": JWT_SECRET,
+        "AUTH_VERIFICATION": args.auth_verification,
+        "SUPABASE_CLIENT_MODE": args.client_mode,
+        "CACHE_ENABLED": str(args.cache).lower(),
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+
+
+def _wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/ready").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError("App did not become ready")
+
+
+class _User:
+    def __init__(self, client: httpx.AsyncClient, index: int, rng: random.Random):
+        self.client = client
+        self.email = f"load-{index}@example.com"
+        self.rng = rng
+        self.headers: dict = {}
+        self.project_ids: list[str] = []
+
+    async def login(self) -> httpx.Response:
+        resp = await self.client.post(
+            "/auth/login", json={"email": self.email, "password": PASSWORD}
+        )
+        if resp.status_code == 200:
+            token = resp.json()["session"]["access_token"]
+            self.headers = {"Authorization": f"Bearer {token}"}
+        return resp
+
+    async def list(self) -> httpx.Response:
+        return await self.client.get("/projects?limit=50", headers=self.headers)
+
+    async def get(self) -> httpx.Response:
+        project_id = self.rng.choice(self.project_ids)
+        return await self.client.get(f"/projects/{project_id}", headers=self.headers)
+
+    async def create(self) -> httpx.Response:
+        resp = await self.client.post(
+            "/projects",
+            json={
+                "title": f"Project {self.rng.randrange(1_000_000)}",
+                "description": "Weekend job around the house",
+                "estimated_cost": 120.0,
+                "instructions": [
+                    {"step": step, "text": f"Step {step}"} for step in range(1, 6)
+                ],
+            },
+            headers=self.headers,
+        )
+        if resp.status_code == 200:
+            self.project_ids.append(resp.json()["id"])
+        return resp
+
+    async def update(self) -> httpx.Response:
+        project_id = self.rng.choice(self.project_ids)
+        return await self.client.patch(
+            f"/projects/{project_id}",
+            json={"priority": self.rng.choice(["low", "medium", "high"])},
+            headers=self.headers,
+        )
+
+    async def delete(self) -> httpx.Response:
+        project_id = self.project_ids.pop(self.rng.randrange(len(self.project_ids)))
+        return await self.client.delete(f"/projects/{project_id}", headers=self.headers)
+
+    def pick(self) -> str:
+        operation = self.rng.choices(list(MIX), weights=list(MIX.values()))[0]
+        if operation in ("get", "update", "delete") and len(self.project_ids) < 2:
+            return "create"
+        return operation
+
+
+def _summary(latencies: list[float], errors: int, seconds: float) -> dict:
+    ordered = sorted(latencies)
+    if len(ordered) >= 2:
+        cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = ordered[0] if ordered else 0.0
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / seconds, 1),
+        "p50_ms": round(p50 * 1000, 2),
+        "p95_ms": round(p95 * 1000, 2),
+        "p99_ms": round(p99 * 1000, 2),
+    }
+
+
+async def _run_level(base_url: str, concurrency: int, duration: float, seed: int) -> dict:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        users = [
+            _User(client, index, random.Random(seed + index)) for index in range(concurrency)
+        ]
+        for user in users:
+            await user.login()
+            for _ in range(5):
+                await user.create()
+
+        latencies: dict[str, list[float]] = defaultdict(list)
+        errors: dict[str, int] = defaultdict(int)
+        deadline = time.perf_counter() + duration
+
+        async def worker(user: _User) -> None:
+            while time.perf_counter() < deadline:
+                operation = user.pick()
+                start = time.perf_counter()
+                resp = await getattr(user, operation)()
+                latencies[operation].append(time.perf_counter() - start)
+                if resp.status_code >= 400:
+                    errors[operation] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(user) for user in users))
+        elapsed = time.perf_counter() - start
+
+    endpoints = {
+        operation: _summary(latencies[operation], errors[operation], elapsed)
+        for operation in MIX
+        if latencies[operation]
+    }
+    everything = [value for values in latencies.values() for value in values]
+    endpoints["total"] = _summary(everything, sum(errors.values()), elapsed)
+    return endpoints
+
+
+def _diff(old: dict, new: dict) -> dict:
+    """Percent change per level/endpoint; positive p95 and negative rps are worse."""
+
+    def change(before: float, after: float):
+        return round((after - before) / before * 100, 1) if before else None
+
+    report = {}
+    for level, endpoints in new["results"].items():
+        for endpoint, stats in endpoints.items():
+            before = old["results"].get(level, {}).get(endpoint)
+            if before is None:
+                continue
+            report.setdefault(level, {})[endpoint] = {
+                "p50_pct": change(before["p50_ms"], stats["p50_ms"]),
+                "p95_pct": change(before["p95_ms"], stats["p95_ms"]),
+                "p99_pct": change(before["p99_ms"], stats["p99_ms"]),
+                "rps_pct": change(before["rps"], stats["rps"]),
+            }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per level")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--auth-verification", choices=["local", "remote"], default="remote")
+    parser.add_argument("--client-mode", choices=["sync", "async"], default="sync")
+    parser.add_argument("--cache", action="store_true")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to diff against")
+    parser.add_argument("--diff", type=Path, nargs=2, metavar=("OLD", "NEW"))
+    args = parser.parse_args()
+
+    if args.diff:
+        old, new = (json.loads(path.read_text()) for path in args.diff)
+        print(json.dumps(_diff(old, new), indent=2))
+        return
+
+    fake = FakeSupabase(JWT_SECRET, args.latency_ms / 1000).start()
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    app = _start_app(port, fake.url, args)
+    try:
+        _wait_ready(base_url)
+        results = {
+            f"c{level}": asyncio.run(_run_level(base_url, level, args.duration, args.seed))
+            for level in args.concurrency
+        }
+    finally:
+        app.terminate()
+        app.wait(timeout=10)
+        fake.stop()
+
+    run = {
+        "config": {
+            "duration_s": args.duration,
+            "latency_ms": args.latency_ms,
+            "auth_verification": args.auth_verification,
+            "client_mode": args.client_mode,
+            "cache": args.cache,
+            "mix": MIX,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(run, indent=2) + "\n")
+    if args.compare:
+        run["diff"] = _diff(json.loads(args.compare.read_text()), run)
+    print(json.dumps(run, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Validated vs trusted serialization of 1 / 100 / 10,000-project responses.
+
+Times ``model_response`` on PostgREST-shaped rows (five instructions and
+five materials each) with ``trusted_serialization`` off and on:
+
+    python -m benchmarks.bench_serialization --sizes 1 100 10000
+"""
+
+import argparse
+import json
+import time
+import uuid
+
+import app.shared.serialization as serialization
+from app.config import settings
+from app.features.projects.models import ProjectResponse
+from app.shared.serialization import model_response
+
+
+def _rows(count: int) -> list[dict]:
+    user_id = str(uuid.uuid4())
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "title": f"Project {i}",
+            "description": "Weekend job around the house",
+            "status": "planning",
+            "priority": "medium",
+            "estimated_duration_hours": 4,
+            "estimated_cost": 125.5,
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "updated_at": "2026-01-02T00:00:00+00:00",
+            "instructions": [{"step": s, "text": f"Step {s} of the job"} for s in range(1, 6)],
+            "materials": [
+                {
+                    "id": str(uuid.uuid4()),
+                    "name": f"Material {m}",
+                    "quantity": 2,
+                    "cost": 9.99,
+                    "owned": m % 2 == 0,
+                }
+                for m in range(5)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def _time(rows: list[dict], trusted: bool, min_seconds: float) -> float:
+    settings.trusted_serialization = trusted
+    runs, start = 0, time.perf_counter()
+    while True:
+        model_response(rows, ProjectResponse)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10_000])
+    parser.add_argument("--min-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        rows = _rows(size)
+        validated = _time(rows, False, args.min_seconds)
+        trusted = _time(rows, True, args.min_seconds)
+        results.append(
+            {
+                "projects": size,
+                "validated_ms": round(validated * 1000, 3),
+                "trusted_ms": round(trusted * 1000, 3),
+                "speedup": round(validated / trusted, 1),
+            }
+        )
+
+    encoder = "orjson" if serialization.orjson is not None else "pydantic_core"
+    print(json.dumps({"encoder": encoder, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
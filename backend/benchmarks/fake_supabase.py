@@ -0,0 +1,292 @@
+"""In-process stand-in for the Supabase auth (GoTrue) and REST (PostgREST) APIs.
+
+Implements just enough of both for the app's auth and projects routes:
+password sign-in/sign-up issuing HS256 tokens, ``/auth/v1/user``, the
+health and JWKS endpoints, and ``/rest/v1/projects`` reads and writes scoped
+to the caller's token the way RLS would. Every request sleeps ``latency``
+seconds first, standing in for the network and database time of a hosted
+project. :meth:`FakeSupabase.inject` adds faults (extra delay, gateway
+errors, dropped connections) for resilience tests.
+"""
+
+import json
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+import jwt
+
+TOKEN_TTL_SECONDS = 3600
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class Fault:
+    prefix: str
+    delay: float = 0.0
+    status: Optional[int] = None
+    drop: bool = False
+    times: Optional[int] = None
+
+
+class FakeSupabase:
+    def __init__(self, jwt_secret: str, latency: float = 0.0):
+        self.jwt_secret = jwt_secret
+        self.latency = latency
+        self.projects: dict[str, dict] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.faults: list[Fault] = []
+        self.lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeSupabase":
+        fake = self
+
+        class Handler(_Handler):
+            supabase = fake
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def inject(
+        self,
+        prefix: str,
+        *,
+        delay: float = 0.0,
+        status: Optional[int] = None,
+        drop: bool = False,
+        times: Optional[int] = None,
+    ) -> None:
+        """Disturb requests whose path starts with ``prefix``.
+
+        Each matching request sleeps ``delay`` more, then gets a plain-text
+        ``status`` response (as a gateway would send) or, with ``drop``, a
+        closed connection. ``times`` limits the fault to that many requests.
+        """
+        with self.lock:
+            self.faults.append(Fault(prefix, delay, status, drop, times))
+
+    def clear_faults(self) -> None:
+        with self.lock:
+            self.faults.clear()
+
+    def _take_fault(self, method: str, path: str) -> Optional[Fault]:
+        with self.lock:
+            self.requests.append((method, path))
+            for fault in self.faults:
+                if path.startswith(fault.prefix) and fault.times != 0:
+                    if fault.times is not None:
+                        fault.times -= 1
+                    return fault
+        return None
+
+    def user(self, email: str) -> dict:
+        return {
+            "id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"mailto:{email}")),
+            "aud": "authenticated",
+            "role": "authenticated",
+            "email": email,
+            "app_metadata": {"provider": "email"},
+            "user_metadata": {},
+            "created_at": "2026-01-01T00:00:00+00:00",
+        }
+
+    def session(self, email: str) -> dict:
+        user = self.user(email)
+        now = int(time.time())
+        token = jwt.encode(
+            {
+                "sub": user["id"],
+                "email": email,
+                "aud": "authenticated",
+                "role": "authenticated",
+                "iat": now,
+                "exp": now + TOKEN_TTL_SECONDS,
+            },
+            self.jwt_secret,
+            algorithm="HS256",
+        )
+        return {
+            "access_token": token,
+            "token_type": "bearer",
+            "expires_in": TOKEN_TTL_SECONDS,
+            "expires_at": now + TOKEN_TTL_SECONDS,
+            "refresh_token": uuid.uuid4().hex,
+            "user": user,
+        }
+
+    def claims(self, authorization: Optional[str]) -> Optional[dict]:
+        if not authorization or not authorization.startswith("Bearer "):
+            return None
+        try:
+            return jwt.decode(
+                authorization.removeprefix("Bearer "),
+                self.jwt_secret,
+                algorithms=["HS256"],
+                audience="authenticated",
+            )
+        except jwt.PyJWTError:
+            return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    supabase: FakeSupabase
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, body=None, headers: Optional[dict] = None) -> None:
+        payload = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _reply_text(self, status: int, text: str) -> None:
+        payload = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _body(self):
+        return json.loads(self.raw_body) if self.raw_body else None
+
+    def _route(self, method: str) -> None:
+        # Always drain the body: some clients send one with GET, and leftovers
+        # would corrupt the next request on this keep-alive connection.
+        self.raw_body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        time.sleep(self.supabase.latency)
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+
+        fault = self.supabase._take_fault(method, url.path)
+        if fault is not None:
+            time.sleep(fault.delay)
+            if fault.drop:
+                self.close_connection = True
+                return
+            if fault.status is not None:
+                return self._reply_text(fault.status, "upstream unavailable")
+
+        if url.path.startswith("/auth/v1/"):
+            return self._auth(method, url.path.removeprefix("/auth/v1/"))
+        if url.path == "/rest/v1/projects":
+            claims = self.supabase.claims(self.headers.get("Authorization"))
+            if claims is None:
+                return self._reply(401, {"code": "PGRST301", "message": "JWT invalid"})
+            return self._projects(method, claims["sub"], query)
+        self._reply(404, {"message": f"No route for {method} {url.path}"})
+
+    def _auth(self, method: str, path: str) -> None:
+        if method == "POST" and path in ("token", "signup"):
+            body = self._body() or {}
+            if not body.get("email") or not body.get("password"):
+                return self._reply(400, {"error": "invalid_grant", "msg": "Missing credentials"})
+            return self._reply(200, self.supabase.session(body["email"]))
+        if method == "GET" and path == "health":
+            return self._reply(200, {"name": "GoTrue", "description": "fake"})
+        if method == "GET" and path == ".well-known/jwks.json":
+            return self._reply(200, {"keys": []})
+        if method == "GET" and path == "user":
+            claims = self.supabase.claims(self.headers.get("Authorization"))
+            if claims is None:
+                return self._reply(401, {"code": 401, "msg": "invalid JWT"})
+            return self._reply(200, self.supabase.user(claims["email"]))
+        self._reply(404, {"msg": "not found"})
+
+    def _projects(self, method: str, user_id: str, query: dict) -> None:
+        store, lock = self.supabase.projects, self.supabase.lock
+        project_id = query.get("id", [""])[0].removeprefix("eq.") or None
+        prefer = self.headers.get("Prefer", "")
+
+        with lock:
+            if method == "GET":
+                rows = [
+                    row
+                    for row in store.values()
+                    if row["user_id"] == user_id and project_id in (None, row["id"])
+                ]
+                rows.sort(key=lambda row: (row["updated_at"], row["id"]), reverse=True)
+                limit = int(query.get("limit", ["1000"])[0])
+                return self._reply(200, rows[:limit])
+
+            if method == "POST":
+                body = self._body()
+                now = _now()
+                created = []
+                for item in body if isinstance(body, list) else [body]:
+                    row = {
+                        "description": None,
+                        "status": "planning",
+                        "priority": "medium",
+                        "estimated_duration_hours": None,
+                        "estimated_cost": None,
+                        "instructions": [],
+                        **item,
+                        "id": str(uuid.uuid4()),
+                        "user_id": user_id,
+                        "materials": [],
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    store[row["id"]] = row
+                    created.append(row)
+                return self._reply(201, created)
+
+            row = store.get(project_id)
+            matched = [row] if row is not None and row["user_id"] == user_id else []
+
+            if method == "PATCH":
+                changes = self._body() or {}
+                for row in matched:
+                    row.update(changes, updated_at=_now())
+                return self._reply(200, matched)
+
+            if method == "DELETE":
+                for row in matched:
+                    del store[row["id"]]
+                headers = {"Content-Range": f"*/{len(matched)}"}
+                if "return=minimal" in prefer:
+                    return self._reply(204, headers=headers)
+                return self._reply(200, matched, headers)
+
+        self._reply(405, {"message": f"{method} not supported"})
+
+    def do_GET(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def do_PATCH(self):
+        self._route("PATCH")
+
+    def do_DELETE(self):
+        self._route("DELETE")
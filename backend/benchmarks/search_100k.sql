@@ -0,0 +1,59 @@
+-- Full-text search against 100k seeded projects.
+--
+--   supabase db reset
+--   psql "$DATABASE_URL" -f benchmarks/search_100k.sql
+--
+-- Seeds inside a transaction that is rolled back, so it leaves no data
+-- behind. Compare the ILIKE scan the client-side filter stood in for with
+-- the indexed search_projects() call.
+\timing on
+BEGIN;
+
+INSERT INTO auth.users (id, email, aud, role)
+VALUES ('00000000-0000-0000-0000-000000000b0b', 'bench@example.com', 'authenticated', 'authenticated');
+
+INSERT INTO projects (user_id, title, description, instructions)
+SELECT
+    '00000000-0000-0000-0000-000000000b0b',
+    (ARRAY['Replace', 'Fix', 'Paint', 'Install', 'Clean'])[1 + i % 5] || ' ' ||
+        (ARRAY['kitchen faucet', 'fence', 'gutter', 'ceiling fan', 'deck', 'shower drain'])[1 + i % 6] ||
+        ' #' || i,
+    'Weekend job number ' || i || ' around the ' ||
+        (ARRAY['garage', 'yard', 'bathroom', 'attic'])[1 + i % 4],
+    jsonb_build_array(
+        jsonb_build_object('step', 1, 'text', 'Turn off the water supply'),
+        jsonb_build_object('step', 2, 'text', 'Remove the old fixture ' || i)
+    )
+FROM generate_series(1, 100000) AS i;
+
+INSERT INTO materials (project_id, user_id, name, owned)
+SELECT id, user_id,
+       (ARRAY['Plumber tape', 'Wood stain', 'Caulk', 'Wire nuts'])[1 + abs(hashtext(id::text)) % 4],
+       random() < 0.3
+FROM projects
+WHERE user_id = '00000000-0000-0000-0000-000000000b0b';
+
+ANALYZE projects;
+ANALYZE materials;
+
+SET LOCAL ROLE authenticated;
+SELECT set_config('request.jwt.claims', '{"sub": "00000000-0000-0000-0000-000000000b0b"}', true);
+
+-- Baseline: substring scan across every text column.
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT id, title FROM projects
+WHERE title ILIKE '%faucet%'
+   OR description ILIKE '%faucet%'
+   OR instructions::text ILIKE '%faucet%'
+   OR EXISTS (SELECT 1 FROM materials m WHERE m.project_id = projects.id AND m.name ILIKE '%faucet%')
+LIMIT 51;
+
+-- Indexed, ranked search (first page).
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM search_projects('kitchen faucet', 51);
+
+-- Misspelt query: "ceilng" only matches through the trigram index.
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM search_projects('ceilng fan', 51);
+
+ROLLBACK;
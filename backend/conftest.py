@@ -3,17 +3,40 @@ from unittest.mock import MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
-import app.features.auth.router as auth_router_module
 import app.shared.dependencies as dependencies_module
 from app.main import app as fastapi_app
+from app.shared.admission import admission
+from app.shared.cache import cache
+from app.shared.resilience import breakers
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    yield
+    breakers.reset()
+    admission.reset()
 
 
 @pytest.fixture
 def mock_supabase():
     mock = MagicMock()
-    with patch.object(auth_router_module, "supabase", mock), \
-         patch.object(dependencies_module, "supabase", mock), \
-         patch.object(dependencies_module, "create_client", return_value=mock):
+    with patch.object(dependencies_module, "supabase", mock), \
+         patch.object(dependencies_module, "create_postgrest_client", return_value=mock):
+        yield mock
+
+
+@pytest.fixture
+def mock_async_supabase(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr(dependencies_module.settings, "supabase_client_mode", "async")
+    with patch.object(dependencies_module, "async_supabase", mock), \
+         patch.object(dependencies_module, "create_async_postgrest_client", return_value=mock):
         yield mock
 
 
@@ -0,0 +1,244 @@
+import asyncio
+
+import httpx
+import pytest
+from starlette.responses import PlainTextResponse
+
+from app.config import settings
+from app.shared import metrics
+from app.shared.admission import Admission, AdmissionMiddleware, FairLimiter, Shed, admission
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestFairLimiter:
+    def test_queued_callers_take_turns(self):
+        async def scenario():
+            limiter, order = FairLimiter(limit=1, max_queue=10), []
+            await limiter.acquire("holder", timeout=1)
+
+            async def request(caller, name):
+                await limiter.acquire(caller, timeout=1)
+                order.append(name)
+                limiter.release()
+
+            tasks = [asyncio.create_task(request("bulk", f"bulk{i}")) for i in range(3)]
+            await _settle()
+            tasks.append(asyncio.create_task(request("other", "other")))
+            await _settle()
+            limiter.release()
+            await asyncio.gather(*tasks)
+            return order, limiter
+
+        order, limiter = asyncio.run(scenario())
+        assert order == ["bulk0", "other", "bulk1", "bulk2"]
+        assert (limiter.active, limiter.queued) == (0, 0)
+
+    def test_full_queue_sheds(self):
+        async def scenario():
+            limiter = FairLimiter(limit=1, max_queue=1)
+            await limiter.acquire("a", timeout=1)
+            waiting = asyncio.create_task(limiter.acquire("b", timeout=1))
+            await _settle()
+            with pytest.raises(Shed) as shed:
+                await limiter.acquire("c", timeout=1)
+            limiter.release()
+            await waiting
+            return shed.value
+
+        assert asyncio.run(scenario()).reason == "queue_full"
+
+    def test_wait_is_bounded(self):
+        async def scenario():
+            limiter = FairLimiter(limit=1, max_queue=5)
+            await limiter.acquire("a", timeout=1)
+            with pytest.raises(Shed) as shed:
+                await limiter.acquire("b", timeout=0.01)
+            return shed.value, limiter
+
+        shed, limiter = asyncio.run(scenario())
+        assert shed.reason == "queue_timeout"
+        assert (limiter.active, limiter.queued) == (1, 0)
+
+    def test_cancelled_waiter_leaves_queue(self):
+        async def scenario():
+            limiter = FairLimiter(limit=1, max_queue=5)
+            await limiter.acquire("a", timeout=1)
+            waiting = asyncio.create_task(limiter.acquire("b", timeout=1))
+            await _settle()
+            waiting.cancel()
+            await asyncio.gather(waiting, return_exceptions=True)
+            limiter.release()
+            return limiter
+
+        limiter = asyncio.run(scenario())
+        assert (limiter.active, limiter.queued) == (0, 0)
+
+    def test_release_skips_waiter_cancelled_in_same_tick(self):
+        async def scenario():
+            limiter = FairLimiter(limit=1, max_queue=5)
+            await limiter.acquire("a", timeout=1)
+            cancelled = asyncio.create_task(limiter.acquire("b", timeout=1))
+            live = asyncio.create_task(limiter.acquire("c", timeout=1))
+            await _settle()
+            # The cancellation is pending (the task hasn't run its except
+            # block yet) when the holder releases.
+            cancelled.cancel()
+            limiter.release()
+            await asyncio.gather(cancelled, return_exceptions=True)
+            await live
+            after_handover = (limiter.active, limiter.queued)
+            limiter.release()
+            return after_handover, limiter
+
+        after_handover, limiter = asyncio.run(scenario())
+        assert after_handover == (1, 0)
+        assert (limiter.active, limiter.queued) == (0, 0)
+
+    def test_release_with_only_cancelled_waiters_frees_the_slot(self):
+        async def scenario():
+            limiter = FairLimiter(limit=1, max_queue=5)
+            await limiter.acquire("a", timeout=1)
+            waiting = asyncio.create_task(limiter.acquire("b", timeout=1))
+            await _settle()
+            waiting.cancel()
+            limiter.release()
+            await asyncio.gather(waiting, return_exceptions=True)
+            return limiter
+
+        limiter = asyncio.run(scenario())
+        assert (limiter.active, limiter.queued) == (0, 0)
+
+
+class Blocking:
+    """An ASGI app whose responses wait until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.entered = 0
+
+    async def __call__(self, scope, receive, send):
+        self.entered += 1
+        if scope["path"] != "/health":
+            await self.release.wait()
+        await PlainTextResponse("ok")(scope, receive, send)
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    monkeypatch.setattr(settings, "admission_max_concurrency", 2)
+    monkeypatch.setattr(settings, "admission_max_queue", 1)
+    monkeypatch.setattr(settings, "admission_queue_timeout_seconds", 1.0)
+    monkeypatch.setattr(settings, "admission_max_per_user", 10)
+    monkeypatch.setattr(settings, "admission_route_limits", {"/projects/export": 1})
+
+
+def _run(scenario):
+    async def main():
+        app, state = Blocking(), Admission()
+        transport = httpx.ASGITransport(app=AdmissionMiddleware(app, state))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await scenario(client, app, state)
+
+    return asyncio.run(main())
+
+
+def _get(client, path="/projects", user="a"):
+    return asyncio.create_task(client.get(path, headers={"Authorization": f"Bearer {user}"}))
+
+
+class TestAdmissionMiddleware:
+    def test_sheds_with_503_once_queue_is_full(self, limits):
+        async def scenario(client, app, state):
+            admitted = [_get(client, user=f"u{i}") for i in range(3)]
+            await _settle()
+            stats = state.stats()["pools"]["default"]
+            rejected = await client.get("/projects")
+            app.release.set()
+            return rejected, [await task for task in admitted], stats, state
+
+        rejected, admitted, stats, state = _run(scenario)
+        assert rejected.status_code == 503
+        assert rejected.headers["Retry-After"] == "1"
+        assert [resp.status_code for resp in admitted] == [200, 200, 200]
+        assert stats == {"active": 2, "queued": 1}
+        assert state.stats()["shed"] == {("default", "queue_full"): 1}
+
+    def test_sheds_when_queue_wait_runs_out(self, limits, monkeypatch):
+        monkeypatch.setattr(settings, "admission_queue_timeout_seconds", 0.01)
+
+        async def scenario(client, app, state):
+            admitted = [_get(client, user=f"u{i}") for i in range(2)]
+            await _settle()
+            rejected = await client.get("/projects")
+            app.release.set()
+            await asyncio.gather(*admitted)
+            return rejected, state
+
+        rejected, state = _run(scenario)
+        assert rejected.status_code == 503
+        assert state.stats()["shed"] == {("default", "queue_timeout"): 1}
+
+    def test_one_caller_is_capped(self, limits, monkeypatch):
+        monkeypatch.setattr(settings, "admission_max_per_user", 2)
+
+        async def scenario(client, app, state):
+            bulk = [_get(client, user="bulk") for _ in range(2)]
+            await _settle()
+            capped = await client.get("/projects", headers={"Authorization": "Bearer bulk"})
+            other = _get(client, user="other")
+            await _settle()
+            app.release.set()
+            await asyncio.gather(*bulk)
+            return capped, await other
+
+        capped, other = _run(scenario)
+        assert capped.status_code == 429
+        assert "Retry-After" in capped.headers
+        assert other.status_code == 200
+
+    def test_route_pools_are_separate(self, limits):
+        async def scenario(client, app, state):
+            export = _get(client, "/projects/export")
+            await _settle()
+            listing = _get(client, "/projects")
+            queued_export = _get(client, "/projects/export", user="b")
+            await _settle()
+            stats = state.stats()["pools"]
+            app.release.set()
+            await asyncio.gather(export, listing, queued_export)
+            return stats
+
+        stats = _run(scenario)
+        assert stats["/projects/export"] == {"active": 1, "queued": 1}
+        assert stats["default"] == {"active": 1, "queued": 0}
+
+    def test_health_is_exempt(self, limits, monkeypatch):
+        monkeypatch.setattr(settings, "admission_max_concurrency", 1)
+        monkeypatch.setattr(settings, "admission_max_queue", 0)
+
+        async def scenario(client, app, state):
+            busy = _get(client)
+            await _settle()
+            shed = await client.get("/projects")
+            health = await client.get("/health")
+            app.release.set()
+            await busy
+            return shed, health
+
+        shed, health = _run(scenario)
+        assert shed.status_code == 503
+        assert health.status_code == 200
+
+
+def test_admission_metrics_are_exported():
+    admission.limiter("default")
+    admission.record_shed("default", "queue_full")
+
+    text = metrics.render()
+    assert 'admission_queued{pool="default"} 0' in text
+    assert 'admission_active{pool="default"} 0' in text
+    assert 'admission_shed_total{pool="default",reason="queue_full"} 1' in text
@@ -0,0 +1,71 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from supabase_auth.errors import AuthApiError
+
+USER_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+PROJECT_ID = "11111111-2222-3333-4444-555555555555"
+AUTH_HEADER = {"Authorization": "Bearer valid-token"}
+
+SAMPLE_PROJECT = {
+    "id": PROJECT_ID,
+    "user_id": USER_ID,
+    "title": "Replace kitchen faucet",
+    "status": "planning",
+    "priority": "medium",
+    "created_at": "2026-01-01T00:00:00+00:00",
+    "updated_at": "2026-01-01T00:00:00+00:00",
+}
+
+
+def _mock_auth(mock):
+    response = MagicMock()
+    response.user.id = USER_ID
+    response.user.email = "test@example.com"
+    mock.auth.get_user = AsyncMock(return_value=response)
+
+
+class TestAsyncMode:
+    def test_me_awaits_async_auth_client(self, client, mock_supabase, mock_async_supabase):
+        _mock_auth(mock_async_supabase)
+
+        resp = client.get("/auth/me", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert resp.json()["id"] == USER_ID
+        mock_async_supabase.auth.get_user.assert_awaited_once_with("valid-token")
+        mock_supabase.auth.get_user.assert_not_called()
+
+    def test_invalid_token(self, client, mock_supabase, mock_async_supabase):
+        mock_async_supabase.auth.get_user = AsyncMock(
+            side_effect=AuthApiError("Invalid token", 401, code=None)
+        )
+
+        resp = client.get("/auth/me", headers=AUTH_HEADER)
+        assert resp.status_code == 401
+
+    def test_login(self, client, mock_supabase, mock_async_supabase):
+        response = MagicMock()
+        response.user.id = USER_ID
+        response.user.email = "test@example.com"
+        response.session.access_token = "token-abc"
+        mock_async_supabase.auth.sign_in_with_password = AsyncMock(return_value=response)
+
+        resp = client.post(
+            "/auth/login",
+            json={"email": "test@example.com", "password": "securepass123"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["session"]["access_token"] == "token-abc"
+
+    def test_list_projects(self, client, mock_supabase, mock_async_supabase):
+        _mock_auth(mock_async_supabase)
+        query = mock_async_supabase.table.return_value.select.return_value
+        query.order.return_value = query
+        query.limit.return_value = query
+        execute = AsyncMock(return_value=MagicMock(data=[SAMPLE_PROJECT]))
+        query.execute = execute
+
+        resp = client.get("/projects", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert resp.json()[0]["id"] == PROJECT_ID
+        execute.assert_awaited_once()
+        mock_supabase.table.assert_not_called()
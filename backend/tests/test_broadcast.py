@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.shared.broadcast import OVERFLOW, Broadcaster
+
+
+@pytest.fixture(autouse=True)
+def small_buffers(monkeypatch):
+    monkeypatch.setattr(settings, "stream_buffer_size", 2)
+
+
+class TestBroadcaster:
+    def test_fans_out_within_a_topic(self):
+        async def scenario():
+            broadcaster = Broadcaster()
+            first, second = broadcaster.subscribe("u1"), broadcaster.subscribe("u1")
+            other = broadcaster.subscribe("u2")
+            broadcaster.publish("u1", "changed")
+            return await first.get(), await second.get(), other, broadcaster
+
+        first, second, other, broadcaster = asyncio.run(scenario())
+        assert first == second == "changed"
+        assert other._queue.empty()
+        assert broadcaster.stats() == {"subscribers": 3, "published": 1, "dropped": 0}
+
+    def test_slow_subscriber_is_told_to_resync(self):
+        async def scenario():
+            broadcaster = Broadcaster()
+            slow, fast = broadcaster.subscribe("u1"), broadcaster.subscribe("u1")
+            received = []
+            for message in ("a", "b", "c", "d"):
+                broadcaster.publish("u1", message)
+                received.append(await fast.get())
+            overflowed = await slow.get()
+            broadcaster.publish("u1", "e")
+            return received, overflowed, await slow.get(), slow, broadcaster
+
+        received, overflowed, after, slow, broadcaster = asyncio.run(scenario())
+        assert received == ["a", "b", "c", "d"]
+        # Buffered events are dropped rather than delivered stale.
+        assert overflowed is OVERFLOW
+        assert after == "e"
+        assert slow._queue.empty()
+        assert broadcaster.stats()["dropped"] == 2
+
+    def test_unsubscribe_forgets_empty_topics(self):
+        broadcaster = Broadcaster()
+        subscription = broadcaster.subscribe("u1")
+
+        broadcaster.unsubscribe(subscription)
+        broadcaster.unsubscribe(subscription)
+        broadcaster.publish("u1", "changed")
+
+        assert broadcaster._topics == {}
+        assert broadcaster.stats()["subscribers"] == 0
+
+    def test_publish_all_reaches_every_topic(self):
+        async def scenario():
+            broadcaster = Broadcaster()
+            subscriptions = [broadcaster.subscribe(topic) for topic in ("u1", "u2")]
+            broadcaster.publish_all("resync")
+            return [await subscription.get() for subscription in subscriptions]
+
+        assert asyncio.run(scenario()) == ["resync", "resync"]
@@ -0,0 +1,86 @@
+import asyncio
+
+from app.shared.cache import MISSING, MemoryCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestMemoryCache:
+    def test_hit_and_miss(self):
+        cache = MemoryCache(max_entries=10, max_bytes=10_000, ttl=60)
+
+        assert _run(cache.get("user-a", "list")) is MISSING
+        _run(cache.set("user-a", "list", [{"id": 1}]))
+        assert _run(cache.get("user-a", "list")) == [{"id": 1}]
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_namespaces_are_isolated(self):
+        cache = MemoryCache(max_entries=10, max_bytes=10_000, ttl=60)
+        _run(cache.set("user-a", "list", ["a"]))
+
+        assert _run(cache.get("user-b", "list")) is MISSING
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = MemoryCache(max_entries=10, max_bytes=10_000, ttl=30, clock=clock)
+        _run(cache.set("user-a", "list", ["a"]))
+
+        clock.now = 29.9
+        assert _run(cache.get("user-a", "list")) == ["a"]
+        clock.now = 30
+        assert _run(cache.get("user-a", "list")) is MISSING
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_by_entries(self):
+        cache = MemoryCache(max_entries=2, max_bytes=10_000, ttl=60)
+        _run(cache.set("u", "a", 1))
+        _run(cache.set("u", "b", 2))
+        _run(cache.get("u", "a"))
+        _run(cache.set("u", "c", 3))
+
+        assert _run(cache.get("u", "b")) is MISSING
+        assert _run(cache.get("u", "a")) == 1
+        assert _run(cache.get("u", "c")) == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        cache = MemoryCache(max_entries=100, max_bytes=20, ttl=60)
+        _run(cache.set("u", "a", "x" * 10))
+        _run(cache.set("u", "b", "y" * 10))
+
+        assert _run(cache.get("u", "a")) is MISSING
+        assert cache.stats()["bytes"] <= 20
+
+    def test_oversized_value_is_not_stored(self):
+        cache = MemoryCache(max_entries=100, max_bytes=10, ttl=60)
+        _run(cache.set("u", "a", "x" * 50))
+
+        assert cache.stats()["entries"] == 0
+
+    def test_invalidate_drops_only_that_namespace(self):
+        cache = MemoryCache(max_entries=10, max_bytes=10_000, ttl=60)
+        _run(cache.set("user-a", "list", ["a"]))
+        _run(cache.set("user-a", "get:1", ["a1"]))
+        _run(cache.set("user-b", "list", ["b"]))
+
+        _run(cache.invalidate("user-a"))
+
+        assert _run(cache.get("user-a", "list")) is MISSING
+        assert _run(cache.get("user-a", "get:1")) is MISSING
+        assert _run(cache.get("user-b", "list")) == ["b"]
+        assert cache.stats()["invalidations"] == 1
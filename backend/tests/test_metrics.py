@@ -0,0 +1,127 @@
+import asyncio
+
+from app.features.projects.test_projects import (
+    AUTH_HEADER,
+    SAMPLE_PROJECT,
+    _mock_auth,
+    _mock_table_select,
+)
+from app.shared.metrics import (
+    REQUESTS,
+    SUPABASE_CALLS,
+    Counter,
+    Histogram,
+    Timings,
+    _current,
+    timed,
+)
+
+
+class TestHistogram:
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram("h", "help", ("route",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, "/a")
+        histogram.observe(0.1, "/a")
+        histogram.observe(5.0, "/a")
+
+        lines = list(histogram.render())
+        assert 'h_bucket{route="/a",le="0.1"} 2' in lines
+        assert 'h_bucket{route="/a",le="1.0"} 2' in lines
+        assert 'h_bucket{route="/a",le="+Inf"} 3' in lines
+        assert 'h_count{route="/a"} 3' in lines
+        assert histogram.count("/a") == 3
+
+    def test_counter_escapes_label_values(self):
+        counter = Counter("c", "help", ("route",))
+        counter.inc('say "hi"')
+        assert 'c{route="say \\"hi\\""} 1' in list(counter.render())
+
+
+class TestTimed:
+    def test_accumulates_per_stage(self):
+        timings = Timings()
+        token = _current.set(timings)
+        try:
+            with timed("supabase"):
+                pass
+            with timed("supabase"):
+                pass
+        finally:
+            _current.reset(token)
+        assert list(timings.stages) == ["supabase"]
+        assert timings.header(0.01).endswith("total;dur=10.0")
+
+    def test_nested_stages_count_toward_the_outer_one(self):
+        timings = Timings()
+        token = _current.set(timings)
+        try:
+            with timed("auth"):
+                with timed("supabase"):
+                    pass
+        finally:
+            _current.reset(token)
+        assert list(timings.stages) == ["auth"]
+
+    def test_noop_outside_a_request(self):
+        with timed("supabase"):
+            pass
+        assert _current.get() is None
+
+
+class TestTimingMiddleware:
+    def test_server_timing_header_lists_stages(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select(mock_supabase, [SAMPLE_PROJECT])
+
+        resp = client.get("/projects", headers=AUTH_HEADER)
+
+        assert resp.status_code == 200
+        stages = [entry.split(";")[0] for entry in resp.headers["server-timing"].split(", ")]
+        assert stages == ["auth", "client", "supabase", "serialize", "total"]
+
+    def test_counts_requests_and_supabase_calls_per_route(self, client, mock_supabase):
+        _mock_auth(mock_supabase)
+        _mock_table_select(mock_supabase, [SAMPLE_PROJECT])
+        before = REQUESTS.value("GET", "/projects", "200")
+        calls_before = SUPABASE_CALLS.value("/projects", "200")
+
+        client.get("/projects", headers=AUTH_HEADER)
+
+        assert REQUESTS.value("GET", "/projects", "200") == before + 1
+        # One for get_user, one for the select.
+        assert SUPABASE_CALLS.value("/projects", "200") == calls_before + 2
+
+    def test_route_label_is_the_template(self, client, mock_supabase):
+        before = REQUESTS.value("GET", "/projects/{project_id}", "401")
+        client.get(f"/projects/{SAMPLE_PROJECT['id']}")
+        assert REQUESTS.value("GET", "/projects/{project_id}", "401") == before + 1
+
+    def test_unmatched_paths_share_one_label(self, client):
+        before = REQUESTS.value("GET", "unmatched", "404")
+        client.get("/no-such-route/123")
+        assert REQUESTS.value("GET", "unmatched", "404") == before + 1
+
+
+class TestMetricsEndpoint:
+    def test_prometheus_text(self, client, mock_supabase):
+        client.get("/health")
+
+        resp = client.get("/metrics")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        body = resp.text
+        assert "# TYPE http_request_duration_seconds histogram" in body
+        assert 'http_requests_total{method="GET",route="/health",status="200"}' in body
+        assert "cache_hits_total" in body
+
+
+def test_recording_is_cheap():
+    histogram = Histogram("h", "help", ("route", "stage"))
+
+    async def record():
+        for _ in range(10_000):
+            histogram.observe(0.003, "/projects", "supabase")
+
+    asyncio.run(record())
+    assert histogram.count("/projects", "supabase") == 10_000
@@ -0,0 +1,221 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from postgrest import APIError
+
+import app.supabase_client as supabase_client_module
+import app.warmup as warmup
+from app.config import settings
+from app.main import app as fastapi_app
+from app.shared.metrics import SUPABASE_REJECTIONS, SUPABASE_RETRIES
+from app.shared.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, breakers
+from benchmarks.fake_supabase import FakeSupabase
+
+JWT_SECRET = "resilience-test-secret-with-at-least-32-bytes"
+REST = "/rest/v1/projects"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_seconds=10, clock=FakeClock())
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CLOSED and breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+        assert breaker.retry_after() == 10
+
+    def test_half_open_probe_closes_on_success(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.allow()
+        assert breaker.state == HALF_OPEN
+        # Only one probe per window.
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CLOSED and breaker.allow()
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=5, reset_seconds=10, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert breaker.opened == 2
+
+        clock.now = 15
+        assert not breaker.allow()
+
+    def test_lost_probe_rearms_window(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 10
+        assert breaker.allow()
+        # The probe never reports back; another one goes after a full window.
+        clock.now = 19
+        assert not breaker.allow()
+        clock.now = 20
+        assert breaker.allow()
+
+
+@pytest.fixture
+def fake():
+    server = FakeSupabase(JWT_SECRET).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(params=["sync", "async"])
+def api(request, fake, monkeypatch):
+    """The app, with lifespan, talking to a fault-injecting fake Supabase."""
+    monkeypatch.setattr(settings, "supabase_url", fake.url)
+    monkeypatch.setattr(settings, "supabase_key", "anon-key")
+    monkeypatch.setattr(settings, "supabase_jwt_secret", JWT_SECRET)
+    monkeypatch.setattr(settings, "auth_verification", "local")
+    monkeypatch.setattr(settings, "jwks_prefetch", False)
+    monkeypatch.setattr(settings, "supabase_client_mode", request.param)
+    monkeypatch.setattr(settings, "supabase_retry_backoff_seconds", 0.01)
+    monkeypatch.setattr(warmup, "state", warmup.Readiness())
+    supabase_client_module.close_http_client()
+    with TestClient(fastapi_app) as client:
+        client.headers["Authorization"] = f"Bearer {fake.session('a@example.com')['access_token']}"
+        yield client
+    supabase_client_module.close_http_client()
+
+
+def _hits(fake: FakeSupabase, method: str, path: str = REST) -> int:
+    return fake.requests.count((method, path))
+
+
+class TestRetries:
+    def test_read_is_retried_after_gateway_error(self, api, fake):
+        fake.inject(REST, status=503, times=1)
+        retries = SUPABASE_RETRIES.value("rest")
+
+        resp = api.get("/projects")
+        assert resp.status_code == 200
+        assert _hits(fake, "GET") == 2
+        assert SUPABASE_RETRIES.value("rest") == retries + 1
+
+    def test_read_is_retried_after_dropped_connection(self, api, fake):
+        fake.inject(REST, drop=True, times=1)
+
+        resp = api.get("/projects")
+        assert resp.status_code == 200
+        assert _hits(fake, "GET") == 2
+
+    def test_write_is_not_retried(self, api, fake):
+        fake.inject(REST, status=503)
+
+        resp = api.post("/projects", json={"title": "Fix the fence"})
+        assert resp.status_code == 503
+        assert "Retry-After" in resp.headers
+        assert _hits(fake, "POST") == 1
+
+    def test_client_errors_are_not_retried_or_counted(self, api, fake, monkeypatch):
+        monkeypatch.setattr(settings, "circuit_breaker_failure_threshold", 1)
+        fake.inject(REST, status=404)
+
+        with pytest.raises(APIError):
+            api.get("/projects")
+        assert _hits(fake, "GET") == 1
+        assert breakers.stats()["rest"]["state"] == CLOSED
+
+    def test_remote_token_check_is_retried(self, api, fake, monkeypatch):
+        monkeypatch.setattr(settings, "auth_verification", "remote")
+        fake.inject("/auth/v1/user", status=502, times=1)
+
+        resp = api.get("/auth/me")
+        assert resp.status_code == 200
+        assert _hits(fake, "GET", "/auth/v1/user") == 2
+
+
+class TestDeadlines:
+    def test_slow_call_times_out(self, api, fake, monkeypatch):
+        monkeypatch.setattr(settings, "supabase_call_timeout_seconds", 0.2)
+        monkeypatch.setattr(settings, "supabase_retries", 0)
+        fake.inject(REST, delay=1.0)
+
+        start = time.perf_counter()
+        resp = api.get("/projects")
+        assert resp.status_code == 504
+        assert time.perf_counter() - start < 1.0
+
+    def test_retries_stop_at_request_budget(self, api, fake, monkeypatch):
+        monkeypatch.setattr(settings, "request_budget_seconds", 0.5)
+        monkeypatch.setattr(settings, "supabase_call_timeout_seconds", 0.2)
+        monkeypatch.setattr(settings, "supabase_retries", 10)
+        fake.inject(REST, delay=1.0)
+
+        start = time.perf_counter()
+        resp = api.get("/projects")
+        assert resp.status_code == 504
+        assert time.perf_counter() - start < 1.0
+        assert _hits(fake, "GET") <= 3
+
+
+class TestCircuitBreakerRoutes:
+    def test_open_breaker_fails_fast(self, api, fake, monkeypatch):
+        monkeypatch.setattr(settings, "circuit_breaker_failure_threshold", 2)
+        monkeypatch.setattr(settings, "supabase_retries", 0)
+        fake.inject(REST, status=503)
+        rejections = SUPABASE_REJECTIONS.value("rest")
+
+        assert api.get("/projects").status_code == 503
+        assert api.get("/projects").status_code == 503
+        resp = api.get("/projects")
+
+        assert resp.status_code == 503
+        assert int(resp.headers["Retry-After"]) >= 1
+        assert _hits(fake, "GET") == 2
+        assert SUPABASE_REJECTIONS.value("rest") == rejections + 1
+        assert breakers.stats()["rest"]["state"] == OPEN
+        assert 'supabase_circuit_state{upstream="rest"} 2' in api.get("/metrics").text
+
+    def test_breaker_recovers_once_upstream_does(self, api, fake, monkeypatch):
+        monkeypatch.setattr(settings, "circuit_breaker_failure_threshold", 1)
+        monkeypatch.setattr(settings, "circuit_breaker_reset_seconds", 0.1)
+        monkeypatch.setattr(settings, "supabase_retries", 0)
+        fake.inject(REST, status=503)
+
+        assert api.get("/projects").status_code == 503
+        fake.clear_faults()
+        time.sleep(0.1)
+
+        assert api.get("/projects").status_code == 200
+        assert breakers.stats()["rest"]["state"] == CLOSED
+
+    def test_breakers_are_per_upstream(self, api, fake, monkeypatch):
+        monkeypatch.setattr(settings, "circuit_breaker_failure_threshold", 1)
+        monkeypatch.setattr(settings, "supabase_retries", 0)
+        fake.inject(REST, status=503)
+
+        assert api.get("/projects").status_code == 503
+        assert api.post(
+            "/auth/login", json={"email": "a@example.com", "password": "secret-password"}
+        ).status_code == 200
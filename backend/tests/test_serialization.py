@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+import app.shared.serialization as serialization
+from app.config import settings
+from app.features.projects.models import ProjectResponse, ProjectSummary
+from app.features.projects.test_projects import (
+    AUTH_HEADER,
+    SAMPLE_PROJECT,
+    _mock_auth,
+    _mock_table_select,
+)
+from app.shared.serialization import model_response
+
+ROW = {**SAMPLE_PROJECT, "search_vector": "'faucet':1"}
+
+
+@pytest.fixture
+def trusted(monkeypatch):
+    monkeypatch.setattr(settings, "trusted_serialization", True)
+
+
+def _body(response):
+    return json.loads(response.body)
+
+
+class TestModelResponse:
+    def test_validated_path(self):
+        body = _body(model_response([ROW], ProjectResponse))
+        assert body[0]["estimated_cost"] == 150.0
+        assert "search_vector" not in body[0]
+
+    def test_trusted_path_trims_to_model_fields(self, trusted):
+        body = _body(model_response([ROW], ProjectSummary))
+        assert list(body[0]) == list(ProjectSummary.model_fields)
+        assert body[0]["title"] == SAMPLE_PROJECT["title"]
+
+    def test_trusted_path_keeps_nested_values(self, trusted):
+        body = _body(model_response(ROW, ProjectResponse))
+        assert body["materials"] == SAMPLE_PROJECT["materials"]
+        assert body["instructions"] == SAMPLE_PROJECT["instructions"]
+
+    def test_trusted_path_without_orjson(self, trusted, monkeypatch):
+        monkeypatch.setattr(serialization, "orjson", None)
+        body = _body(model_response([ROW], ProjectSummary))
+        assert body[0]["id"] == SAMPLE_PROJECT["id"]
+
+    def test_paths_agree_on_content(self, trusted):
+        trusted_body = _body(model_response([ROW], ProjectResponse))
+        settings.trusted_serialization = False
+        validated_body = _body(model_response([ROW], ProjectResponse))
+        for field in ("id", "title", "status", "instructions", "materials"):
+            assert trusted_body[0][field] == validated_body[0][field]
+
+
+class TestTrustedListEndpoint:
+    def test_list_drops_internal_columns(self, client, mock_supabase, trusted):
+        _mock_auth(mock_supabase)
+        _mock_table_select(mock_supabase, [{**SAMPLE_PROJECT, "position": 3}])
+
+        resp = client.get("/projects?fields=id,title", headers=AUTH_HEADER)
+        assert resp.status_code == 200
+        assert resp.json() == [{"id": SAMPLE_PROJECT["id"], "title": SAMPLE_PROJECT["title"]}]
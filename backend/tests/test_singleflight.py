@@ -0,0 +1,188 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.main import app as fastapi_app
+from app.shared.cache import cache, invalidate, read_through
+from app.shared.singleflight import SingleFlight
+from tests.test_async_mode import AUTH_HEADER, PROJECT_ID, SAMPLE_PROJECT, _mock_auth
+
+
+class Load:
+    """A load that blocks until released, counting how often it ran."""
+
+    def __init__(self, result="rows", error=None):
+        self.calls = 0
+        self.cancelled = False
+        self.release = asyncio.Event()
+        self.result = result
+        self.error = error
+
+    async def __call__(self):
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return self.result
+
+
+async def _settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_load(self):
+        async def scenario():
+            flights, load = SingleFlight(), Load()
+            callers = [asyncio.create_task(flights.do("u", "list", load)) for _ in range(5)]
+            await _settle()
+            load.release.set()
+            return await asyncio.gather(*callers), load, flights
+
+        results, load, flights = asyncio.run(scenario())
+        assert results == ["rows"] * 5
+        assert load.calls == 1
+        assert flights.stats() == {"calls": 1, "coalesced": 4, "in_flight": 0}
+
+    def test_different_keys_do_not_share(self):
+        async def scenario():
+            flights, load = SingleFlight(), Load()
+            load.release.set()
+            await asyncio.gather(flights.do("u", "a", load), flights.do("u", "b", load))
+            return load
+
+        assert asyncio.run(scenario()).calls == 2
+
+    def test_error_reaches_every_caller_and_is_not_reused(self):
+        async def scenario():
+            flights, load = SingleFlight(), Load(error=RuntimeError("boom"))
+            callers = [asyncio.create_task(flights.do("u", "list", load)) for _ in range(3)]
+            await _settle()
+            load.release.set()
+            results = await asyncio.gather(*callers, return_exceptions=True)
+
+            retry = Load()
+            retry.release.set()
+            return results, await flights.do("u", "list", retry)
+
+        results, retried = asyncio.run(scenario())
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert retried == "rows"
+
+    def test_cancelled_caller_does_not_cancel_the_others(self):
+        async def scenario():
+            flights, load = SingleFlight(), Load()
+            first = asyncio.create_task(flights.do("u", "list", load))
+            second = asyncio.create_task(flights.do("u", "list", load))
+            await _settle()
+            first.cancel()
+            await _settle()
+            load.release.set()
+            return first, await second, load
+
+        first, second_result, load = asyncio.run(scenario())
+        assert first.cancelled()
+        assert second_result == "rows"
+        assert not load.cancelled
+
+    def test_load_is_cancelled_when_every_caller_leaves(self):
+        async def scenario():
+            flights, load = SingleFlight(), Load()
+            caller = asyncio.create_task(flights.do("u", "list", load))
+            await _settle()
+            caller.cancel()
+            await _settle()
+            return load, flights
+
+        load, flights = asyncio.run(scenario())
+        assert load.cancelled
+        assert flights.stats()["in_flight"] == 0
+
+    def test_forget_makes_later_callers_start_a_fresh_load(self):
+        async def scenario():
+            flights, before, after = SingleFlight(), Load("old"), Load("new")
+            stale = asyncio.create_task(flights.do("u", "list", before))
+            await _settle()
+            flights.forget("u")
+            fresh = asyncio.create_task(flights.do("u", "list", after))
+            await _settle()
+            before.release.set()
+            after.release.set()
+            return await stale, await fresh
+
+        assert asyncio.run(scenario()) == ("old", "new")
+
+
+class TestReadThrough:
+    def test_invalidate_detaches_in_flight_reads(self):
+        async def scenario():
+            before, after = Load("old"), Load("new")
+            stale = asyncio.create_task(read_through("user-a", "list", before))
+            await _settle()
+            await invalidate("user-a")
+            fresh = asyncio.create_task(read_through("user-a", "list", after))
+            await _settle()
+            before.release.set()
+            after.release.set()
+            return await stale, await fresh
+
+        assert asyncio.run(scenario()) == ("old", "new")
+
+    def test_read_overlapping_invalidate_is_not_cached(self, monkeypatch):
+        monkeypatch.setattr(settings, "cache_enabled", True)
+
+        async def scenario():
+            stale, fresh = Load("old"), Load("new")
+            reading = asyncio.create_task(read_through("user-a", "list", stale))
+            await _settle()
+            await invalidate("user-a")
+            stale.release.set()
+            first = await reading
+            fresh.release.set()
+            return first, await read_through("user-a", "list", fresh), fresh.calls
+
+        assert asyncio.run(scenario()) == ("old", "new", 1)
+
+    def test_reads_after_invalidate_are_cached_again(self, monkeypatch):
+        monkeypatch.setattr(settings, "cache_enabled", True)
+
+        async def scenario():
+            await invalidate("user-a")
+            load = Load("rows")
+            load.release.set()
+            await read_through("user-a", "list", load)
+            return await cache.get("user-a", "list")
+
+        assert asyncio.run(scenario()) == "rows"
+
+
+@pytest.mark.usefixtures("mock_supabase")
+def test_concurrent_identical_requests_make_one_supabase_call(mock_async_supabase):
+    _mock_auth(mock_async_supabase)
+    query = mock_async_supabase.table.return_value.select.return_value
+    query.eq.return_value = query
+
+    async def slow_execute():
+        await asyncio.sleep(0.05)
+        return MagicMock(data=[SAMPLE_PROJECT])
+
+    query.execute = AsyncMock(side_effect=slow_execute)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=fastapi_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                *(client.get(f"/projects/{PROJECT_ID}", headers=AUTH_HEADER) for _ in range(4))
+            )
+
+    responses = asyncio.run(scenario())
+    assert [resp.status_code for resp in responses] == [200] * 4
+    assert query.execute.await_count == 1
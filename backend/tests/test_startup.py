@@ -0,0 +1,103 @@
+import subprocess
+import sys
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import app.supabase_client as supabase_client_module
+import app.warmup as warmup
+from app.config import settings
+from app.main import app as fastapi_app
+
+
+@pytest.fixture
+def configured(monkeypatch):
+    monkeypatch.setattr(settings, "supabase_url", "https://example.supabase.co")
+    monkeypatch.setattr(settings, "supabase_key", "anon-key")
+    monkeypatch.setattr(warmup, "state", warmup.Readiness())
+    supabase_client_module.close_http_client()
+    yield
+    supabase_client_module.close_http_client()
+
+
+@pytest.fixture
+def upstream(configured, monkeypatch):
+    """Route the shared pool through a mock transport that records requests."""
+    seen = []
+    status = {"code": 200}
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(status["code"], json={})
+
+    pool = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(warmup, "get_http_client", lambda: pool)
+    monkeypatch.setattr(warmup, "_get_client", lambda: None)
+    yield seen, status
+    pool.close()
+
+
+class TestWarmUp:
+    def test_opens_connections_before_traffic(self, upstream, monkeypatch):
+        seen, _ = upstream
+        monkeypatch.setattr(settings, "warmup_connections", 3)
+
+        with TestClient(fastapi_app):
+            assert warmup.state.ready
+
+        assert len(seen) == 3
+        assert seen[0].url == "https://example.supabase.co/auth/v1/health"
+        assert seen[0].headers["apikey"] == "anon-key"
+        assert set(warmup.state.checks) == {"clients", "connections"}
+
+    def test_prefetches_jwks_for_local_verification(self, upstream, monkeypatch):
+        monkeypatch.setattr(settings, "auth_verification", "local")
+        fetched = []
+
+        class JwksClient:
+            def fetch_data(self):
+                fetched.append(1)
+
+        monkeypatch.setattr(warmup, "_get_jwks_client", JwksClient)
+
+        with TestClient(fastapi_app):
+            pass
+
+        assert fetched == [1]
+        assert warmup.state.checks["jwks"]["status"] == "ok"
+
+    def test_failed_warm_up_still_starts(self, upstream):
+        _, status = upstream
+        status["code"] = 503
+
+        with TestClient(fastapi_app) as client:
+            assert client.get("/health").status_code == 200
+            resp = client.get("/ready")
+
+        assert resp.status_code == 503
+        assert resp.json()["status"] == "starting"
+        assert resp.json()["checks"]["connections"]["status"].startswith("error")
+
+
+class TestReadiness:
+    def test_ready_retries_warm_up(self, upstream):
+        _, status = upstream
+        status["code"] = 503
+
+        with TestClient(fastapi_app) as client:
+            assert client.get("/ready").status_code == 503
+            status["code"] = 200
+            resp = client.get("/ready")
+
+        assert resp.status_code == 200
+        assert resp.json()["checks"]["connections"]["status"] == "ok"
+
+
+def test_importing_the_app_skips_heavy_supabase_modules():
+    code = (
+        "import sys, app.main; "
+        "print(sorted(m for m in ('supabase', 'realtime', 'storage3') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,45 @@
+import pytest
+
+import app.supabase_client as supabase_client_module
+from app.config import settings
+
+
+@pytest.fixture
+def configured(monkeypatch):
+    monkeypatch.setattr(settings, "supabase_url", "https://example.supabase.co")
+    monkeypatch.setattr(settings, "supabase_key", "anon-key")
+    supabase_client_module.close_http_client()
+    yield
+    supabase_client_module.close_http_client()
+
+
+class TestConnectionPooling:
+    def test_postgrest_clients_share_transport(self, configured):
+        first = supabase_client_module.create_postgrest_client("token-a")
+        second = supabase_client_module.create_postgrest_client("token-b")
+
+        assert first.session is second.session
+        assert first.session is supabase_client_module.get_http_client()
+
+    def test_postgrest_client_acts_as_user(self, configured):
+        db = supabase_client_module.create_postgrest_client("token-a")
+
+        assert db.headers["Authorization"] == "Bearer token-a"
+        assert db.headers["apikey"] == "anon-key"
+        assert str(db.base_url) == "https://example.supabase.co/rest/v1"
+
+    def test_user_clients_are_cached_per_token(self, configured):
+        first = supabase_client_module.get_user_client("token-a")
+        again = supabase_client_module.get_user_client("token-a")
+        other = supabase_client_module.get_user_client("token-b")
+
+        assert first is again
+        assert first is not other
+        assert first.postgrest.session is other.postgrest.session
+
+    def test_close_reopens_fresh_transport(self, configured):
+        before = supabase_client_module.get_http_client()
+        supabase_client_module.close_http_client()
+
+        assert before.is_closed
+        assert supabase_client_module.get_http_client() is not before
@@ -0,0 +1,125 @@
+import asyncio
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from app.config import settings
+from app.shared import tokens
+
+USER_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+JWT_SECRET = "test-jwt-secret-with-at-least-32-bytes"
+
+
+def _make_token(secret=JWT_SECRET, **overrides):
+    claims = {
+        "sub": USER_ID,
+        "email": "test@example.com",
+        "aud": "authenticated",
+        "role": "authenticated",
+        "exp": int(time.time()) + 3600,
+        **overrides,
+    }
+    return jwt.encode(claims, secret, algorithm="HS256")
+
+
+@pytest.fixture
+def local_verification(monkeypatch):
+    monkeypatch.setattr(settings, "auth_verification", "local")
+    monkeypatch.setattr(settings, "supabase_jwt_secret", JWT_SECRET)
+
+
+class TestLocalVerification:
+    def test_valid_token_skips_auth_api(self, client, mock_supabase, local_verification):
+        resp = client.get(
+            "/auth/me",
+            headers={"Authorization": f"Bearer {_make_token()}"},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["id"] == USER_ID
+        assert data["email"] == "test@example.com"
+        mock_supabase.auth.get_user.assert_not_called()
+
+    def test_expired_token(self, client, mock_supabase, local_verification):
+        token = _make_token(exp=int(time.time()) - 60)
+
+        resp = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert resp.status_code == 401
+        assert "expired" in resp.json()["detail"].lower()
+
+    def test_wrong_signature(self, client, mock_supabase, local_verification):
+        token = _make_token(secret="some-other-secret-with-at-least-32-bytes")
+
+        resp = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert resp.status_code == 401
+
+    def test_wrong_audience(self, client, mock_supabase, local_verification):
+        token = _make_token(aud="anon")
+
+        resp = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert resp.status_code == 401
+
+    def test_missing_subject(self, client, mock_supabase, local_verification):
+        claims = {"aud": "authenticated", "exp": int(time.time()) + 3600}
+        token = jwt.encode(claims, JWT_SECRET, algorithm="HS256")
+
+        resp = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert resp.status_code == 401
+
+    def test_unsigned_token_rejected(self, client, mock_supabase, local_verification):
+        token = jwt.encode(
+            {"sub": USER_ID, "aud": "authenticated", "exp": int(time.time()) + 3600},
+            None,
+            algorithm="none",
+        )
+
+        resp = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert resp.status_code == 401
+
+    def test_malformed_token(self, client, mock_supabase, local_verification):
+        resp = client.get("/auth/me", headers={"Authorization": "Bearer not-a-jwt"})
+        assert resp.status_code == 401
+
+    def test_jwks_lookup_runs_off_the_event_loop(
+        self, client, mock_supabase, local_verification, monkeypatch
+    ):
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        lookups = []
+
+        class FakeJwksClient:
+            def get_signing_key_from_jwt(self, token):
+                try:
+                    asyncio.get_running_loop()
+                    lookups.append("event loop")
+                except RuntimeError:
+                    lookups.append("worker thread")
+                return jwt.PyJWK.from_dict(
+                    jwt.algorithms.ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+                )
+
+        monkeypatch.setattr(tokens, "_get_jwks_client", FakeJwksClient)
+        claims = {
+            "sub": USER_ID,
+            "aud": "authenticated",
+            "exp": int(time.time()) + 3600,
+        }
+        token = jwt.encode(claims, private_key, algorithm="ES256")
+
+        resp = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert resp.status_code == 200
+        assert resp.json()["id"] == USER_ID
+        assert lookups == ["worker thread"]
+
+    def test_remote_mode_uses_auth_api(self, client, mock_supabase, monkeypatch):
+        monkeypatch.setattr(settings, "auth_verification", "remote")
+        mock_supabase.auth.get_user.return_value.user.id = USER_ID
+        mock_supabase.auth.get_user.return_value.user.email = "test@example.com"
+
+        resp = client.get(
+            "/auth/me",
+            headers={"Authorization": f"Bearer {_make_token()}"},
+        )
+        assert resp.status_code == 200
+        mock_supabase.auth.get_user.assert_called_once()
@@ -0,0 +1,8 @@
+-- Keyset pagination for GET /projects orders by (updated_at, id) within the
+-- caller's rows; RLS supplies the user_id equality.
+CREATE INDEX projects_user_updated_at_id_idx
+    ON projects (user_id, updated_at, id);
+
+-- Server-side status/priority filters on the project list.
+CREATE INDEX projects_user_status_priority_idx
+    ON projects (user_id, status, priority);
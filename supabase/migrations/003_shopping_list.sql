@@ -0,0 +1,35 @@
+-- Aggregated shopping list: every unowned material across the caller's
+-- projects, grouped by normalized name. Runs as the caller so RLS applies.
+
+-- Only projects with at least one unowned material take part.
+CREATE INDEX projects_user_unowned_materials_idx
+    ON projects (user_id)
+    WHERE materials @> '[{"owned": false}]';
+
+CREATE OR REPLACE FUNCTION shopping_list()
+RETURNS TABLE (
+    name       TEXT,
+    quantity   NUMERIC,
+    total_cost NUMERIC,
+    projects   JSONB
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+    SELECT
+        min(btrim(item->>'name'))                           AS name,
+        sum(coalesce((item->>'quantity')::numeric, 1))      AS quantity,
+        sum((item->>'cost')::numeric)                       AS total_cost,
+        jsonb_agg(DISTINCT jsonb_build_object('id', p.id, 'title', p.title)) AS projects
+    FROM projects p
+    CROSS JOIN LATERAL jsonb_array_elements(p.materials) AS item
+    WHERE p.user_id = auth.uid()
+      AND p.materials @> '[{"owned": false}]'
+      AND NOT coalesce((item->>'owned')::boolean, false)
+    GROUP BY lower(btrim(item->>'name'))
+    ORDER BY lower(btrim(item->>'name'));
+$$;
+
+GRANT EXECUTE ON FUNCTION shopping_list() TO authenticated;
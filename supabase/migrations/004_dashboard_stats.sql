@@ -0,0 +1,34 @@
+-- Dashboard figures for the caller in one round trip. Runs as the caller
+-- so RLS applies; the status/priority counts use
+-- projects_user_status_priority_idx.
+CREATE OR REPLACE FUNCTION dashboard_stats()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+    WITH mine AS (
+        SELECT status, priority, estimated_cost, estimated_duration_hours, materials
+        FROM projects
+        WHERE user_id = auth.uid()
+    ),
+    material_items AS (
+        SELECT coalesce((item->>'owned')::boolean, false) AS owned
+        FROM mine
+        CROSS JOIN LATERAL jsonb_array_elements(mine.materials) AS item
+    )
+    SELECT jsonb_build_object(
+        'total_projects',        (SELECT count(*) FROM mine),
+        'by_status',             (SELECT coalesce(jsonb_object_agg(status, n), '{}'::jsonb)
+                                  FROM (SELECT status, count(*) AS n FROM mine GROUP BY status) s),
+        'by_priority',           (SELECT coalesce(jsonb_object_agg(priority, n), '{}'::jsonb)
+                                  FROM (SELECT priority, count(*) AS n FROM mine GROUP BY priority) p),
+        'total_estimated_cost',  (SELECT coalesce(sum(estimated_cost), 0) FROM mine),
+        'total_estimated_hours', (SELECT coalesce(sum(estimated_duration_hours), 0) FROM mine),
+        'materials_total',       (SELECT count(*) FROM material_items),
+        'materials_owned',       (SELECT count(*) FROM material_items WHERE owned)
+    );
+$$;
+
+GRANT EXECUTE ON FUNCTION dashboard_stats() TO authenticated;
@@ -0,0 +1,64 @@
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Weighted document: title (A), description and material names (B),
+-- instruction text (C). Generated so it never drifts from the row.
+ALTER TABLE projects
+    ADD COLUMN search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B') ||
+        setweight(jsonb_to_tsvector('english', jsonb_path_query_array(materials, '$[*].name'), '["string"]'), 'B') ||
+        setweight(jsonb_to_tsvector('english', jsonb_path_query_array(instructions, '$[*].text'), '["string"]'), 'C')
+    ) STORED;
+
+CREATE INDEX projects_search_vector_idx
+    ON projects USING GIN (search_vector);
+
+-- Fuzzy title matches ("fawcet") for queries the stemmer can't resolve.
+CREATE INDEX projects_title_trgm_idx
+    ON projects USING GIN (title gin_trgm_ops);
+
+-- Ranked search over the caller's projects, keyset-paginated on
+-- (rank, id) descending. Runs as the caller so RLS applies.
+CREATE OR REPLACE FUNCTION search_projects(
+    q TEXT,
+    result_limit INT DEFAULT 50,
+    after_rank REAL DEFAULT NULL,
+    after_id UUID DEFAULT NULL
+)
+RETURNS TABLE (
+    id                       UUID,
+    user_id                  UUID,
+    title                    TEXT,
+    description              TEXT,
+    status                   project_status,
+    priority                 project_priority,
+    estimated_duration_hours NUMERIC,
+    estimated_cost           NUMERIC,
+    created_at               TIMESTAMPTZ,
+    updated_at               TIMESTAMPTZ,
+    rank                     REAL
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+    WITH query AS (
+        SELECT websearch_to_tsquery('english', q) AS tsq
+    ),
+    ranked AS (
+        SELECT p.id, p.user_id, p.title, p.description, p.status, p.priority,
+               p.estimated_duration_hours, p.estimated_cost, p.created_at, p.updated_at,
+               (ts_rank_cd(p.search_vector, query.tsq) + similarity(p.title, q))::REAL AS rank
+        FROM projects p, query
+        WHERE p.user_id = auth.uid()
+          AND (p.search_vector @@ query.tsq OR p.title % q)
+    )
+    SELECT *
+    FROM ranked
+    WHERE after_rank IS NULL OR (ranked.rank, ranked.id) < (after_rank, after_id)
+    ORDER BY ranked.rank DESC, ranked.id DESC
+    LIMIT result_limit;
+$$;
+
+GRANT EXECUTE ON FUNCTION search_projects(TEXT, INT, REAL, UUID) TO authenticated;
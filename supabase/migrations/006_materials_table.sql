@@ -0,0 +1,247 @@
+-- Materials move out of the projects.materials JSONB array into their own
+-- table, so changing one item writes one small row instead of rewriting
+-- the whole project.
+
+CREATE TABLE materials (
+    id         UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    user_id    UUID NOT NULL DEFAULT auth.uid() REFERENCES auth.users(id) ON DELETE CASCADE,
+    position   BIGINT GENERATED BY DEFAULT AS IDENTITY,
+    name       TEXT NOT NULL,
+    quantity   NUMERIC NOT NULL DEFAULT 1,
+    cost       NUMERIC,
+    owned      BOOLEAN NOT NULL DEFAULT false,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX materials_project_position_idx ON materials (project_id, position);
+CREATE INDEX materials_user_unowned_idx ON materials (user_id) WHERE NOT owned;
+CREATE INDEX materials_name_search_idx ON materials USING GIN (to_tsvector('english', name));
+
+CREATE TRIGGER materials_updated_at
+    BEFORE UPDATE ON materials
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- Project ETags are the project's updated_at, and project responses embed
+-- materials, so any material change bumps its project once per statement.
+CREATE OR REPLACE FUNCTION touch_material_projects()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE projects SET updated_at = now()
+    WHERE id IN (SELECT DISTINCT project_id FROM changed_materials);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER materials_touch_project_insert
+    AFTER INSERT ON materials
+    REFERENCING NEW TABLE AS changed_materials
+    FOR EACH STATEMENT EXECUTE FUNCTION touch_material_projects();
+CREATE TRIGGER materials_touch_project_update
+    AFTER UPDATE ON materials
+    REFERENCING NEW TABLE AS changed_materials
+    FOR EACH STATEMENT EXECUTE FUNCTION touch_material_projects();
+CREATE TRIGGER materials_touch_project_delete
+    AFTER DELETE ON materials
+    REFERENCING OLD TABLE AS changed_materials
+    FOR EACH STATEMENT EXECUTE FUNCTION touch_material_projects();
+
+ALTER TABLE materials ENABLE ROW LEVEL SECURITY;
+
+-- user_id is denormalized so reads filter without joining projects.
+CREATE POLICY "Users can view their own materials"
+    ON materials FOR SELECT USING (auth.uid() = user_id);
+CREATE POLICY "Users can insert materials into their own projects"
+    ON materials FOR INSERT WITH CHECK (
+        auth.uid() = user_id
+        AND EXISTS (SELECT 1 FROM projects p WHERE p.id = project_id AND p.user_id = auth.uid())
+    );
+CREATE POLICY "Users can update their own materials"
+    ON materials FOR UPDATE USING (auth.uid() = user_id) WITH CHECK (
+        auth.uid() = user_id
+        AND EXISTS (SELECT 1 FROM projects p WHERE p.id = project_id AND p.user_id = auth.uid())
+    );
+CREATE POLICY "Users can delete their own materials"
+    ON materials FOR DELETE USING (auth.uid() = user_id);
+
+-- Computed relationship overriding the foreign key one, so embedding
+-- materials(...) on projects returns items in list order, including in
+-- insert/update representations where PostgREST can't apply an order.
+CREATE OR REPLACE FUNCTION materials(projects)
+RETURNS SETOF materials
+LANGUAGE sql
+STABLE
+ROWS 20
+SET search_path = public
+AS $$
+    SELECT * FROM materials WHERE project_id = $1.id ORDER BY position
+$$;
+
+-- Backfill in array order; the identity column preserves it.
+ALTER TABLE materials DISABLE TRIGGER materials_touch_project_insert;
+INSERT INTO materials (project_id, user_id, name, quantity, cost, owned)
+SELECT
+    p.id,
+    p.user_id,
+    item->>'name',
+    coalesce((item->>'quantity')::numeric, 1),
+    (item->>'cost')::numeric,
+    coalesce((item->>'owned')::boolean, false)
+FROM projects p
+CROSS JOIN LATERAL jsonb_array_elements(p.materials) WITH ORDINALITY AS e(item, ord)
+ORDER BY p.id, e.ord;
+ALTER TABLE materials ENABLE TRIGGER materials_touch_project_insert;
+
+-- Replace the material lists of several projects in one transaction.
+-- Each item in ``items`` names its project_id. Returns the touched
+-- projects so callers can embed the new materials and read the new ETag.
+CREATE OR REPLACE FUNCTION replace_project_materials(project_ids UUID[], items JSONB)
+RETURNS SETOF projects
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+BEGIN
+    DELETE FROM materials WHERE project_id = ANY(project_ids);
+
+    INSERT INTO materials (project_id, name, quantity, cost, owned)
+    SELECT
+        (item->>'project_id')::uuid,
+        item->>'name',
+        coalesce((item->>'quantity')::numeric, 1),
+        (item->>'cost')::numeric,
+        coalesce((item->>'owned')::boolean, false)
+    FROM jsonb_array_elements(items) WITH ORDINALITY AS e(item, ord)
+    ORDER BY e.ord;
+
+    RETURN QUERY SELECT * FROM projects WHERE id = ANY(project_ids);
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION replace_project_materials(UUID[], JSONB) TO authenticated;
+
+-- Everything that read projects.materials now reads the table.
+DROP INDEX projects_user_unowned_materials_idx;
+
+CREATE OR REPLACE FUNCTION shopping_list()
+RETURNS TABLE (
+    name       TEXT,
+    quantity   NUMERIC,
+    total_cost NUMERIC,
+    projects   JSONB
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+    SELECT
+        min(btrim(m.name))                                  AS name,
+        sum(m.quantity)                                     AS quantity,
+        sum(m.cost)                                         AS total_cost,
+        jsonb_agg(DISTINCT jsonb_build_object('id', p.id, 'title', p.title)) AS projects
+    FROM materials m
+    JOIN projects p ON p.id = m.project_id
+    WHERE m.user_id = auth.uid()
+      AND NOT m.owned
+    GROUP BY lower(btrim(m.name))
+    ORDER BY lower(btrim(m.name));
+$$;
+
+CREATE OR REPLACE FUNCTION dashboard_stats()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+    WITH mine AS (
+        SELECT status, priority, estimated_cost, estimated_duration_hours
+        FROM projects
+        WHERE user_id = auth.uid()
+    ),
+    material_items AS (
+        SELECT owned FROM materials WHERE user_id = auth.uid()
+    )
+    SELECT jsonb_build_object(
+        'total_projects',        (SELECT count(*) FROM mine),
+        'by_status',             (SELECT coalesce(jsonb_object_agg(status, n), '{}'::jsonb)
+                                  FROM (SELECT status, count(*) AS n FROM mine GROUP BY status) s),
+        'by_priority',           (SELECT coalesce(jsonb_object_agg(priority, n), '{}'::jsonb)
+                                  FROM (SELECT priority, count(*) AS n FROM mine GROUP BY priority) p),
+        'total_estimated_cost',  (SELECT coalesce(sum(estimated_cost), 0) FROM mine),
+        'total_estimated_hours', (SELECT coalesce(sum(estimated_duration_hours), 0) FROM mine),
+        'materials_total',       (SELECT count(*) FROM material_items),
+        'materials_owned',       (SELECT count(*) FROM material_items WHERE owned)
+    );
+$$;
+
+-- A generated column can't look into another table: material names are
+-- matched through materials_name_search_idx instead.
+ALTER TABLE projects DROP COLUMN search_vector;
+ALTER TABLE projects
+    ADD COLUMN search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B') ||
+        setweight(jsonb_to_tsvector('english', jsonb_path_query_array(instructions, '$[*].text'), '["string"]'), 'C')
+    ) STORED;
+
+CREATE INDEX projects_search_vector_idx
+    ON projects USING GIN (search_vector);
+
+CREATE OR REPLACE FUNCTION search_projects(
+    q TEXT,
+    result_limit INT DEFAULT 50,
+    after_rank REAL DEFAULT NULL,
+    after_id UUID DEFAULT NULL
+)
+RETURNS TABLE (
+    id                       UUID,
+    user_id                  UUID,
+    title                    TEXT,
+    description              TEXT,
+    status                   project_status,
+    priority                 project_priority,
+    estimated_duration_hours NUMERIC,
+    estimated_cost           NUMERIC,
+    created_at               TIMESTAMPTZ,
+    updated_at               TIMESTAMPTZ,
+    rank                     REAL
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+    WITH query AS (
+        SELECT websearch_to_tsquery('english', q) AS tsq
+    ),
+    material_hits AS (
+        SELECT m.project_id,
+               max(ts_rank_cd(setweight(to_tsvector('english', m.name), 'B'), query.tsq)) AS rank
+        FROM materials m, query
+        WHERE m.user_id = auth.uid()
+          AND to_tsvector('english', m.name) @@ query.tsq
+        GROUP BY m.project_id
+    ),
+    ranked AS (
+        SELECT p.id, p.user_id, p.title, p.description, p.status, p.priority,
+               p.estimated_duration_hours, p.estimated_cost, p.created_at, p.updated_at,
+               (ts_rank_cd(p.search_vector, query.tsq) + similarity(p.title, q)
+                + coalesce(mh.rank, 0))::REAL AS rank
+        FROM projects p
+        CROSS JOIN query
+        LEFT JOIN material_hits mh ON mh.project_id = p.id
+        WHERE p.user_id = auth.uid()
+          AND (p.search_vector @@ query.tsq OR p.title % q OR mh.project_id IS NOT NULL)
+    )
+    SELECT *
+    FROM ranked
+    WHERE after_rank IS NULL OR (ranked.rank, ranked.id) < (after_rank, after_id)
+    ORDER BY ranked.rank DESC, ranked.id DESC
+    LIMIT result_limit;
+$$;
+
+ALTER TABLE projects DROP COLUMN materials;
@@ -0,0 +1,169 @@
+-- RFC 6902 JSON Patch on a project's instructions array and materials
+-- rows, applied in one transaction. The API parses and validates each
+-- operation and sends it as
+--
+--   {op, path, array, index, field, from, value}
+--
+-- where index is a number, "-" (end of array) or null (the whole array).
+-- Failures raise PostgREST status codes: PT404 missing project, PT412
+-- stale If-Match version, PT409 failed test, PT422 index out of range.
+
+CREATE OR REPLACE FUNCTION jsonb_array_insert(arr JSONB, idx INT, val JSONB)
+RETURNS JSONB
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT CASE
+        WHEN idx >= jsonb_array_length(arr) THEN arr || jsonb_build_array(val)
+        ELSE jsonb_insert(arr, ARRAY[idx::text], val)
+    END
+$$;
+
+CREATE OR REPLACE FUNCTION patch_project(
+    target_id UUID,
+    ops JSONB,
+    versions TIMESTAMPTZ[] DEFAULT NULL
+)
+RETURNS SETOF projects
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+    cur      projects%ROWTYPE;
+    steps    JSONB;
+    items    JSONB;
+    arr      JSONB;
+    op       JSONB;
+    kind     TEXT;
+    fld      TEXT;
+    idx      INT;
+    src      INT;
+    n        INT;
+    val      JSONB;
+    item     JSONB;
+    original UUID[];
+    kept     UUID[];
+    in_order BOOLEAN;
+    seq      TEXT := pg_get_serial_sequence('materials', 'position');
+BEGIN
+    -- Row lock: concurrent patches to one project apply one after another.
+    SELECT * INTO cur FROM projects WHERE projects.id = target_id FOR UPDATE;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Project not found' USING ERRCODE = 'PT404';
+    END IF;
+    IF versions IS NOT NULL AND NOT cur.updated_at = ANY(versions) THEN
+        RAISE EXCEPTION 'Project has been modified' USING ERRCODE = 'PT412';
+    END IF;
+
+    steps := cur.instructions;
+    SELECT
+        coalesce(jsonb_agg(jsonb_build_object(
+            'id', m.id, 'name', m.name, 'quantity', m.quantity, 'cost', m.cost, 'owned', m.owned
+        ) ORDER BY m.position), '[]'::jsonb),
+        coalesce(array_agg(m.id ORDER BY m.position), '{}')
+    INTO items, original
+    FROM materials m
+    WHERE m.project_id = target_id;
+
+    FOR op IN SELECT value FROM jsonb_array_elements(ops) LOOP
+        arr  := CASE op->>'array' WHEN 'instructions' THEN steps ELSE items END;
+        n    := jsonb_array_length(arr);
+        kind := op->>'op';
+        fld  := op->>'field';
+        val  := op->'value';
+        src  := (op->>'from')::int;
+        idx  := CASE
+            WHEN op->>'index' = '-' THEN CASE WHEN kind = 'move' THEN n - 1 ELSE n END
+            ELSE (op->>'index')::int
+        END;
+
+        IF src >= n
+           OR idx > CASE WHEN kind IN ('add', 'copy') AND fld IS NULL THEN n ELSE n - 1 END THEN
+            RAISE EXCEPTION 'Path % is out of range', op->>'path' USING ERRCODE = 'PT422';
+        END IF;
+
+        IF kind = 'test' THEN
+            IF CASE WHEN fld IS NULL THEN (arr->idx) - 'id' ELSE arr->idx->fld END
+               IS DISTINCT FROM val THEN
+                RAISE EXCEPTION 'Test failed at %', op->>'path' USING ERRCODE = 'PT409';
+            END IF;
+        ELSIF kind = 'remove' THEN
+            arr := CASE WHEN fld IS NULL THEN arr - idx ELSE arr #- ARRAY[idx::text, fld] END;
+        ELSIF kind IN ('add', 'replace') AND idx IS NULL THEN
+            arr := val;
+        ELSIF kind IN ('add', 'replace') AND fld IS NOT NULL THEN
+            arr := jsonb_set(arr, ARRAY[idx::text, fld], val);
+        ELSIF kind = 'add' THEN
+            arr := jsonb_array_insert(arr, idx, val);
+        ELSIF kind = 'replace' THEN
+            -- Replacing a material keeps its row.
+            arr := jsonb_set(arr, ARRAY[idx::text], val || jsonb_strip_nulls(jsonb_build_object('id', arr->idx->'id')));
+        ELSIF kind = 'move' THEN
+            arr := jsonb_array_insert(arr - src, idx, arr->src);
+        ELSIF kind = 'copy' THEN
+            arr := jsonb_array_insert(arr, idx, (arr->src) - 'id');
+        END IF;
+
+        IF op->>'array' = 'instructions' THEN
+            steps := arr;
+        ELSE
+            items := arr;
+        END IF;
+    END LOOP;
+
+    IF steps IS DISTINCT FROM cur.instructions THEN
+        UPDATE projects SET instructions = steps WHERE projects.id = target_id;
+    END IF;
+
+    -- Sync materials rows with the patched list, touching only what changed.
+    SELECT coalesce(array_agg((e.item->>'id')::uuid ORDER BY e.ord), '{}')
+    INTO kept
+    FROM jsonb_array_elements(items) WITH ORDINALITY AS e(item, ord)
+    WHERE e.item ? 'id';
+
+    DELETE FROM materials m WHERE m.project_id = target_id AND NOT m.id = ANY(kept);
+
+    -- Surviving rows in their old order with new rows only at the end keep
+    -- their positions; anything else renumbers from the sequence.
+    in_order := kept = ARRAY(
+            SELECT o.x FROM unnest(original) WITH ORDINALITY AS o(x, i)
+            WHERE o.x = ANY(kept) ORDER BY o.i
+        )
+        AND NOT EXISTS (
+            SELECT 1 FROM jsonb_array_elements(items) WITH ORDINALITY AS e(item, ord)
+            WHERE e.ord <= cardinality(kept) AND NOT e.item ? 'id'
+        );
+
+    FOR item IN SELECT value FROM jsonb_array_elements(items) LOOP
+        IF item ? 'id' THEN
+            UPDATE materials m SET
+                name     = item->>'name',
+                quantity = coalesce((item->>'quantity')::numeric, 1),
+                cost     = (item->>'cost')::numeric,
+                owned    = coalesce((item->>'owned')::boolean, false),
+                position = CASE WHEN in_order THEN m.position ELSE nextval(seq) END
+            WHERE m.id = (item->>'id')::uuid
+              AND (NOT in_order OR (m.name, m.quantity, m.cost, m.owned) IS DISTINCT FROM (
+                  item->>'name',
+                  coalesce((item->>'quantity')::numeric, 1),
+                  (item->>'cost')::numeric,
+                  coalesce((item->>'owned')::boolean, false)
+              ));
+        ELSE
+            INSERT INTO materials (project_id, name, quantity, cost, owned)
+            VALUES (
+                target_id,
+                item->>'name',
+                coalesce((item->>'quantity')::numeric, 1),
+                (item->>'cost')::numeric,
+                coalesce((item->>'owned')::boolean, false)
+            );
+        END IF;
+    END LOOP;
+
+    RETURN QUERY SELECT * FROM projects WHERE projects.id = target_id;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION patch_project(UUID, JSONB, TIMESTAMPTZ[]) TO authenticated;
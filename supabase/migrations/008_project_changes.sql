@@ -0,0 +1,56 @@
+-- Delta sync (GET /projects/changes): changed rows come from the existing
+-- (user_id, updated_at, id) index; deletions are logged here as tombstones.
+
+CREATE TABLE deleted_projects (
+    id         UUID PRIMARY KEY,
+    user_id    UUID NOT NULL,
+    deleted_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX deleted_projects_user_deleted_at_id_idx
+    ON deleted_projects (user_id, deleted_at, id);
+
+-- Users only read their tombstones; the trigger below is the only writer.
+-- No foreign key to auth.users: deleting a user cascades to projects, and
+-- those tombstones are written while the user row is going away.
+ALTER TABLE deleted_projects ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view their own deleted projects"
+    ON deleted_projects FOR SELECT USING (auth.uid() = user_id);
+
+CREATE OR REPLACE FUNCTION log_deleted_projects()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    INSERT INTO deleted_projects (id, user_id)
+    SELECT id, user_id FROM removed_projects
+    ON CONFLICT (id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER projects_log_deleted
+    AFTER DELETE ON projects
+    REFERENCING OLD TABLE AS removed_projects
+    FOR EACH STATEMENT EXECUTE FUNCTION log_deleted_projects();
+
+-- Tombstones older than the API's retention window are never read again
+-- (older cursors get 410 and resync from scratch). Schedule with pg_cron:
+--   SELECT cron.schedule('purge-deleted-projects', '0 4 * * *',
+--                        $$SELECT purge_deleted_projects(interval '90 days')$$);
+CREATE OR REPLACE FUNCTION purge_deleted_projects(older_than INTERVAL)
+RETURNS BIGINT
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    WITH purged AS (
+        DELETE FROM deleted_projects WHERE deleted_at < now() - older_than RETURNING 1
+    )
+    SELECT count(*) FROM purged
+$$;
+
+REVOKE EXECUTE ON FUNCTION purge_deleted_projects(INTERVAL) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,35 @@
+-- Live updates (GET /projects/stream): every write to projects sends a small
+-- notification on the project_changes channel. The API holds one LISTEN
+-- connection per worker and fans events out to the owner's open streams.
+-- Payloads carry ids only (NOTIFY is capped at 8000 bytes); clients fetch
+-- the rows they care about.
+
+CREATE OR REPLACE FUNCTION notify_project_change()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    changed projects%ROWTYPE;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := OLD;
+    ELSE
+        changed := NEW;
+    END IF;
+    PERFORM pg_notify(
+        'project_changes',
+        json_build_object(
+            'op', TG_OP,
+            'id', changed.id,
+            'user_id', changed.user_id,
+            'updated_at', changed.updated_at
+        )::text
+    );
+    RETURN NULL;
+END;
+$$;
+
+-- Notifications are delivered on commit, and only if it commits.
+CREATE TRIGGER projects_notify_change
+    AFTER INSERT OR UPDATE OR DELETE ON projects
+    FOR EACH ROW EXECUTE FUNCTION notify_project_change();
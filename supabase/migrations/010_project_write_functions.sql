@@ -0,0 +1,124 @@
+-- Project writes that carry a materials list, each in one transaction: the
+-- project row and its materials commit together or not at all, and an
+-- If-Match precondition guards both. Writes without materials stay single
+-- PostgREST statements.
+
+-- Insert projects, each with an optional ``materials`` array next to its
+-- columns. Returns the new projects in input order.
+CREATE OR REPLACE FUNCTION create_projects(new_projects JSONB)
+RETURNS SETOF projects
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+    entry   JSONB;
+    given   projects%ROWTYPE;
+    new_id  UUID;
+    created UUID[] := '{}';
+BEGIN
+    FOR entry IN SELECT value FROM jsonb_array_elements(new_projects) LOOP
+        given := jsonb_populate_record(NULL::projects, entry);
+
+        INSERT INTO projects (
+            user_id, title, description, status, priority,
+            estimated_duration_hours, estimated_cost, instructions
+        )
+        VALUES (
+            given.user_id,
+            given.title,
+            given.description,
+            coalesce(given.status, 'planning'),
+            coalesce(given.priority, 'medium'),
+            given.estimated_duration_hours,
+            given.estimated_cost,
+            coalesce(given.instructions, '[]'::jsonb)
+        )
+        RETURNING id INTO new_id;
+
+        INSERT INTO materials (project_id, name, quantity, cost, owned)
+        SELECT
+            new_id,
+            item->>'name',
+            coalesce((item->>'quantity')::numeric, 1),
+            (item->>'cost')::numeric,
+            coalesce((item->>'owned')::boolean, false)
+        FROM jsonb_array_elements(coalesce(entry->'materials', '[]'::jsonb))
+            WITH ORDINALITY AS e(item, ord)
+        ORDER BY e.ord;
+
+        created := created || new_id;
+    END LOOP;
+
+    RETURN QUERY
+        SELECT * FROM projects WHERE id = ANY(created) ORDER BY array_position(created, id);
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION create_projects(JSONB) TO authenticated;
+
+-- Apply the same ``changes`` to several projects and, unless ``items`` is
+-- null, replace each one's materials with ``items``. With ``versions`` only
+-- projects whose updated_at is listed are written. Returns the written
+-- projects; ids that matched nothing are simply absent.
+CREATE OR REPLACE FUNCTION update_projects(
+    project_ids UUID[],
+    changes JSONB,
+    items JSONB DEFAULT NULL,
+    versions TIMESTAMPTZ[] DEFAULT NULL
+)
+RETURNS SETOF projects
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+    given   projects%ROWTYPE := jsonb_populate_record(NULL::projects, changes);
+    matched UUID[];
+BEGIN
+    IF changes = '{}'::jsonb THEN
+        -- Lock the rows so the precondition still holds for the materials.
+        SELECT coalesce(array_agg(locked.id), '{}') INTO matched
+        FROM (
+            SELECT p.id FROM projects p
+            WHERE p.id = ANY(project_ids)
+              AND (versions IS NULL OR p.updated_at = ANY(versions))
+            FOR UPDATE
+        ) locked;
+    ELSE
+        WITH written AS (
+            UPDATE projects p SET
+                title                    = CASE WHEN changes ? 'title' THEN given.title ELSE p.title END,
+                description              = CASE WHEN changes ? 'description' THEN given.description ELSE p.description END,
+                status                   = CASE WHEN changes ? 'status' THEN given.status ELSE p.status END,
+                priority                 = CASE WHEN changes ? 'priority' THEN given.priority ELSE p.priority END,
+                estimated_duration_hours = CASE WHEN changes ? 'estimated_duration_hours' THEN given.estimated_duration_hours ELSE p.estimated_duration_hours END,
+                estimated_cost           = CASE WHEN changes ? 'estimated_cost' THEN given.estimated_cost ELSE p.estimated_cost END,
+                instructions             = CASE WHEN changes ? 'instructions' THEN given.instructions ELSE p.instructions END
+            WHERE p.id = ANY(project_ids)
+              AND (versions IS NULL OR p.updated_at = ANY(versions))
+            RETURNING p.id
+        )
+        SELECT coalesce(array_agg(written.id), '{}') INTO matched FROM written;
+    END IF;
+
+    IF items IS NOT NULL AND cardinality(matched) > 0 THEN
+        DELETE FROM materials WHERE project_id = ANY(matched);
+
+        INSERT INTO materials (project_id, name, quantity, cost, owned)
+        SELECT
+            t.id,
+            e.item->>'name',
+            coalesce((e.item->>'quantity')::numeric, 1),
+            (e.item->>'cost')::numeric,
+            coalesce((e.item->>'owned')::boolean, false)
+        FROM unnest(matched) WITH ORDINALITY AS t(id, n)
+        CROSS JOIN jsonb_array_elements(items) WITH ORDINALITY AS e(item, ord)
+        ORDER BY t.n, e.ord;
+    END IF;
+
+    RETURN QUERY SELECT * FROM projects WHERE id = ANY(matched);
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION update_projects(UUID[], JSONB, JSONB, TIMESTAMPTZ[]) TO authenticated;